@@ -0,0 +1,75 @@
+# coding: utf-8
+"""
+Per call overhead of the client, without network: the session is replaced by a stub returning a canned response.
+Compares the parts of the former dispatch (a functools.wraps closure built by __getattr__ at every call, str.format
+of the uri, urlencode of the filters) with the generated endpoint methods, and times whole calls.
+
+    PYTHONPATH=src python benchmarks/bench_endpoints.py [calls]
+"""
+
+import sys
+import timeit
+from functools import wraps
+
+import requests
+
+from vimeo.clients import VimeoClient
+from vimeo.mixins import _get_querystring
+
+try:
+    from urllib import urlencode
+except ImportError:  # python 3
+    from urllib.parse import urlencode
+
+
+class _StubSession(object):
+    def __init__(self):
+        self.response = requests.Response()
+        self.response.status_code = 200
+        self.response._content = b'{}'
+
+    def get(self, url, **kwargs):
+        return self.response
+
+    def close(self):
+        pass
+
+
+def _micros(function, calls):
+    return timeit.timeit(function, number=calls) / calls * 1e6
+
+
+def main(calls=100000):
+    configuration_dict = {'METRICS': False, 'RATE_LIMIT': False, 'CONDITIONAL_GET_CACHE_SIZE': 0}
+    client = VimeoClient(token='token', configuration_dict=configuration_dict)
+    client.session = _StubSession()
+    filter_dict = {'page': 2, 'per_page': 50, 'sort': 'date', 'direction': 'desc'}
+    album_id, video_id = 1, 2
+
+    def legacy_dispatch():
+        request_method = client.session.get
+
+        @wraps(request_method)
+        def caller(url, **kwargs):
+            return request_method(url, **kwargs)
+        return caller
+
+    rows = [
+        ('dispatch, wraps closure', _micros(legacy_dispatch, calls)),
+        ('dispatch, bound method', _micros(lambda: client.get, calls)),
+        ('uri, str.format', _micros(
+            lambda: '/me/albums/{album_id}/videos/{video_id}'.format(album_id=album_id, video_id=video_id), calls,
+        )),
+        ('uri, precompiled', _micros(lambda: '/me/albums/%s/videos/%s' % (album_id, video_id), calls)),
+        ('querystring, urlencode', _micros(lambda: urlencode([(str(k), str(v)) for k, v in filter_dict.items()]),
+                                           calls)),
+        ('querystring, encoder', _micros(lambda: _get_querystring(filter_dict), calls)),
+        ('read_album(1)', _micros(lambda: client.read_album(1), calls // 10)),
+        ('get_videos(filter_dict)', _micros(lambda: client.get_videos(filter_dict=filter_dict), calls // 10)),
+    ]
+    for name, micros in rows:
+        print('{name:26} {micros:8.2f} us'.format(name=name + ':', micros=micros))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
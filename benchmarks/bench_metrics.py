@@ -0,0 +1,51 @@
+# coding: utf-8
+"""
+Cost of the per endpoint metrics: requests per second against a local stand-in with METRICS off and on, and the
+time of a bare Metrics.begin / end pair.
+
+    PYTHONPATH=src python benchmarks/bench_metrics.py [calls]
+"""
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests'))
+
+from standin import StandInServer  # noqa: E402
+
+from vimeo.clients import VimeoClient  # noqa: E402
+from vimeo.components import Metrics  # noqa: E402
+
+
+def _rate(calls, function):
+    start = time.time()
+    for _ in range(calls):
+        function()
+    return calls / (time.time() - start)
+
+
+def main(calls=2000):
+    with StandInServer() as server:
+        server.route('GET', r'/me/albums/\d+', lambda request: (200, {}, {'name': 'album'}))
+        rates = dict()
+        for enabled in (False, True):
+            configuration_dict = {'API_ROOT': server.url, 'METRICS': enabled}
+            with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+                client.read_album(1)
+                rates[enabled] = _rate(calls, lambda: client.read_album(1))
+
+    metrics = Metrics()
+    started = metrics.begin('GET /me/albums/{album_id}')
+    metrics.end('GET /me/albums/{album_id}', started)
+    pair = timeit.timeit(lambda: metrics.end('GET /me/albums/{album_id}', metrics.begin('GET /me/albums/{album_id}')),
+                         number=100000) / 100000
+
+    print('METRICS off:          {rate:8.1f} req/s'.format(rate=rates[False]))
+    print('METRICS on:           {rate:8.1f} req/s'.format(rate=rates[True]))
+    print('begin / end pair:     {micros:8.2f} us'.format(micros=pair * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
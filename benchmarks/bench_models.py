@@ -0,0 +1,62 @@
+# coding: utf-8
+"""
+Memory per video: plain dicts from json vs vimeo.models.Video.
+
+    PYTHONPATH=src python benchmarks/bench_models.py [videos]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from vimeo import models
+
+
+def _video(video_id):
+    sizes = [{'width': width, 'height': width * 9 // 16, 'link': 'https://i.vimeocdn.com/video/{}_{}x{}.jpg'.format(
+        video_id, width, width * 9 // 16)} for width in (100, 200, 295, 640, 960, 1280, 1920)]
+    return {
+        'uri': '/videos/{}'.format(video_id),
+        'name': 'Video {}'.format(video_id),
+        'description': 'Description of video {}'.format(video_id),
+        'link': 'https://vimeo.com/{}'.format(video_id),
+        'duration': video_id % 600,
+        'width': 1920,
+        'height': 1080,
+        'language': None,
+        'created_time': '2016-05-10T12:00:00+00:00',
+        'modified_time': '2016-05-11T12:00:00+00:00',
+        'release_time': '2016-05-10T12:00:00+00:00',
+        'status': 'available',
+        'resource_key': '{:040x}'.format(video_id),
+        'license': None,
+        'privacy': {'view': 'anybody', 'embed': 'public', 'download': False, 'add': True, 'comments': 'anybody'},
+        'pictures': {'uri': '/videos/{}/pictures/1'.format(video_id), 'active': True, 'type': 'custom', 'sizes': sizes},
+        'embed': {'html': '<iframe src="https://player.vimeo.com/video/{}" width="1920" height="1080" frameborder="0" '
+                          'allowfullscreen></iframe>'.format(video_id)},
+        'tags': [{'uri': '/tags/tag{}'.format(tag), 'name': 'tag{}'.format(tag)} for tag in range(3)],
+        'stats': {'plays': video_id * 7},
+        'metadata': {'connections': dict((name, {'uri': '/videos/{}/{}'.format(video_id, name), 'total': 0})
+                                         for name in ('comments', 'credits', 'likes', 'pictures', 'texttracks'))},
+        'user': {'uri': '/users/1', 'name': 'User', 'link': 'https://vimeo.com/user1', 'pictures': {'sizes': sizes}},
+    }
+
+
+def _measure(build):
+    tracemalloc.start()
+    objects = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(objects)
+
+
+def main(videos=10000):
+    raw = [json.dumps(_video(video_id)) for video_id in range(videos)]
+    as_dicts = _measure(lambda: [json.loads(video) for video in raw])
+    as_models = _measure(lambda: [models.build(json.loads(video)) for video in raw])
+    print('dict:        {size:8.0f} bytes per video'.format(size=as_dicts))
+    print('models.Video {size:8.0f} bytes per video'.format(size=as_models))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
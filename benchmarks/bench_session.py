@@ -0,0 +1,45 @@
+# coding: utf-8
+"""
+Requests per second against a local stand-in: module level requests.get vs the pooled client session.
+
+    PYTHONPATH=src python benchmarks/bench_session.py [calls]
+"""
+
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests'))
+
+from standin import StandInServer  # noqa: E402
+
+from vimeo.clients import VimeoClient  # noqa: E402
+
+
+def _rate(calls, function):
+    start = time.time()
+    for _ in range(calls):
+        function()
+    return calls / (time.time() - start)
+
+
+def main(calls=2000):
+    with StandInServer() as server:
+        server.route('GET', '/me', lambda request: (200, {}, {'name': 'me'}))
+        url = server.url + '/me'
+
+        before = _rate(calls, lambda: requests.get(url))
+        before_connections = server.connections
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            after = _rate(calls, client.read_user)
+
+        print('module level requests.get: {rate:8.1f} req/s, {connections} connections'.format(
+            rate=before, connections=before_connections))
+        print('pooled client session:     {rate:8.1f} req/s, {connections} connections'.format(
+            rate=after, connections=server.connections - before_connections))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -66,11 +66,13 @@ setup(
     ],
     install_requires=[
         'requests',
+        'futures; python_version=="2.7"',
     ],
     extras_require={
         # eg:
         #   'rst': ['docutils>=0.11'],
         #   ':python_version=="2.6"': ['argparse'],
+        'async': ['aiohttp'],
     },
     entry_points={
         'console_scripts': [
@@ -0,0 +1,441 @@
+# coding: utf-8
+"""
+Asyncio twin of VimeoClient, requires python >= 3.5 and aiohttp (pip install vimeopy[async]).
+
+Endpoints are not redefined: AsyncVimeoClient reuses VimeoClientMethodMixin, whose methods return whatever the
+HTTP METHODS helpers return. Here the helpers are coroutines, so every endpoint becomes awaitable:
+
+    async with AsyncVimeoClient(token='YOUR_APP_TOKEN') as vimeo_client:
+        response = await vimeo_client.read_albums()
+"""
+
+import asyncio
+import json
+from collections import deque
+from itertools import islice
+
+import requests
+
+from vimeo import exceptions
+from vimeo import tracing
+from vimeo import uploads
+from vimeo.clients import VimeoClient
+from vimeo.components import uri_template
+from vimeo.mixins import _get_fields
+from vimeo.utils import JSONListDecoder
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def aiohttp_trace_config():
+    """
+    aiohttp.TraceConfig recording pool_wait, connect and ttfb spans of the requests sent with
+    trace_request_ctx=trace.
+    """
+    def timer(name):
+        async def on_start(session, context, params):
+            if context.trace_request_ctx is not None:
+                setattr(context, name, context.trace_request_ctx.clock())
+
+        async def on_end(session, context, params):
+            trace = context.trace_request_ctx
+            if trace is not None and hasattr(context, name):
+                trace.add_span(name, getattr(context, name), trace.clock())
+        return on_start, on_end
+
+    trace_config = aiohttp.TraceConfig()
+    for name, start_signal, end_signal in (
+        ('pool_wait', trace_config.on_connection_queued_start, trace_config.on_connection_queued_end),
+        ('connect', trace_config.on_connection_create_start, trace_config.on_connection_create_end),
+        ('ttfb', trace_config.on_request_start, trace_config.on_request_end),
+    ):
+        on_start, on_end = timer(name)
+        start_signal.append(on_start)
+        end_signal.append(on_end)
+    return trace_config
+
+
+class AsyncSingleFlight(object):
+    """
+    Asyncio twin of vimeo.components.SingleFlight: concurrent tasks with the same key await the first one.
+    """
+
+    def __init__(self):
+        self.calls = dict()
+
+    async def do(self, key, function, *args, **kwargs):
+        """
+        :return: result of await function(*args, **kwargs), run once for the concurrent calls with key
+        """
+        future = self.calls.get(key)
+        while future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # the first task was cancelled, not this one: take its place
+                future = self.calls.get(key)
+
+        future = self.calls[key] = asyncio.get_event_loop().create_future()
+        try:
+            result = await function(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # retrieved, no warning if no task is waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self.calls[key]
+        return result
+
+
+class AsyncResponse(object):
+    """
+    Buffered response exposing the requests.Response attributes used by check_response and exceptions.
+    """
+
+    def __init__(self, status_code, headers, url, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncVimeoClient(VimeoClient):
+
+    def __init__(self, token=None, key=None, secret=None, **kwargs):
+        if aiohttp is None:
+            raise exceptions.ClientException(error_text='aiohttp is required by AsyncVimeoClient')
+        super(AsyncVimeoClient, self).__init__(token=token, key=key, secret=secret, **kwargs)
+        if self.singleflight is not None:
+            self.singleflight = AsyncSingleFlight()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def build_session(self):
+        """
+        aiohttp.ClientSession must be created within the running loop, see get_session.
+        """
+        return None
+
+    def get_session(self):
+        """
+        Return the aiohttp.ClientSession, built on first use. POOL_MAXSIZE bounds the connections per host,
+        concurrent calls beyond it wait for a free connection.
+        :return: session
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.configuration_dict['POOL_MAXSIZE'],
+                force_close=not self.configuration_dict['KEEP_ALIVE'],
+            )
+            trace_configs = [aiohttp_trace_config()] if self.tracer is not None else None
+            self.session = aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+        return self.session
+
+    async def close(self):
+        """
+        Close the session and release every pooled connection.
+        """
+        if self.session is not None:
+            await self.session.close()
+
+    def prepare_aiohttp_request(self, uri, jsonify=True, **kwargs):
+        """
+        VimeoClient.prepare_request, with auth and timeout converted for aiohttp.
+        :return: (url, kwargs)
+        """
+        url, kwargs = self.prepare_request(uri, jsonify=jsonify, **kwargs)
+        auth = kwargs.pop('auth')
+        if auth:
+            kwargs['headers']['Authorization'] = 'Bearer ' + auth.token
+        connect_timeout, read_timeout = kwargs.pop('timeout')
+        kwargs['timeout'] = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        return url, kwargs
+
+    def trace(self, http_method, uri):
+        """
+        Trace of a call of the HTTP METHODS helpers, not bound to the thread: it is passed along to request.
+        :return: context manager yielding the trace or None
+        """
+        if self.tracer is None:
+            return tracing.span(None, None)
+        return self.tracer.trace_task('{method} {uri}'.format(method=http_method.upper(), uri=uri_template(uri)))
+
+    async def wait_rate_limit(self):
+        if self.configuration_dict['RATE_LIMIT']:
+            wait = self.rate_limiter.reserve()
+            while wait:
+                await asyncio.sleep(wait)
+                wait = self.rate_limiter.reserve()
+
+    async def request(self, http_method, uri, jsonify=True, trace=None, **kwargs):
+        """
+        Non-blocking request, same headers, data, timeout, auth, rate limit and retry handling of VimeoClient.
+        :param trace: Trace of the call, None if it is not sampled
+        :return: AsyncResponse
+        """
+        if http_method not in self.configuration_dict['HTTP_METHODS']:
+            raise exceptions.HTTPMethodNotImplementedException(method_name=http_method)
+
+        url, kwargs = self.prepare_aiohttp_request(uri, jsonify=jsonify, **kwargs)
+        endpoint = '{method} {uri}'.format(method=http_method.upper(), uri=uri.split('?', 1)[0])
+        started = self.retry_policy.clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            response, error = None, None
+            try:
+                response = await self.send(http_method, url, trace=trace, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exception:
+                error = exception
+            wait = self.retry_policy.retry_wait(http_method, endpoint, attempt, started, response=response, error=error)
+            if wait is None:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(wait)
+
+    async def send(self, http_method, url, trace=None, **kwargs):
+        """
+        Send a single request, paced by the rate limiter.
+        :return: AsyncResponse
+        """
+        await self.wait_rate_limit()
+        if self.metrics is not None:
+            data = kwargs.get('data')
+            uri = url[len(self.configuration_dict['API_ROOT']):]
+            metric = '{method} {uri}'.format(method=http_method.upper(), uri=uri_template(uri))
+            started = self.metrics.begin(metric)
+        response = None
+        try:
+            with tracing.span(trace, 'request', url=url):
+                async with self.get_session().request(http_method.upper(), url, trace_request_ctx=trace,
+                                                      **kwargs) as aiohttp_response:
+                    with tracing.span(trace, 'download'):
+                        content = await aiohttp_response.read()
+            response = AsyncResponse(aiohttp_response.status, aiohttp_response.headers, str(aiohttp_response.url), content)
+            if trace is not None:
+                trace.status_code = response.status_code
+        finally:
+            if self.metrics is not None:
+                self.metrics.end(metric, started, response=response, bytes_in=len(response.content) if response else None,
+                                 bytes_out=len(data) if data else 0)
+        self.rate_limiter.update(response)
+        return response
+
+    # ---===   HTTP METHODS   ===--- #
+    async def get_method(self, uri, filter_dict=None, success_code=200, error_codes=list(), fields=None):
+        uri_to_call = self.get_uri_to_call(uri, filter_dict=filter_dict, fields=fields)
+        with self.trace('get', uri_to_call) as trace:
+            response = self.response_cache.get(uri_to_call)
+            if response is not None and response.status_code == success_code:
+                self.logger.debug('GET (cached): %s', uri_to_call)
+                return response
+            if self.singleflight is None:
+                response = await self.revalidate(uri_to_call, trace=trace)
+            else:
+                response = await self.singleflight.do(uri_to_call, self.revalidate, uri_to_call, trace=trace)
+            with tracing.span(trace, 'check_response'):
+                response = self.check_response(response, success_code, error_codes)
+            self.response_cache.set(uri_to_call, response)
+            return response
+
+    async def revalidate(self, uri_to_call, trace=None):
+        self.logger.debug('GET: %s', uri_to_call)
+        cached_response = self.validator_cache.get(uri_to_call)
+        response = await self.request(
+            'get', uri_to_call, trace=trace, headers=self.validator_cache.conditional_headers(cached_response),
+        )
+        return self.validator_cache.update(uri_to_call, response, cached_response)
+
+    async def post_method(self, uri, data, success_code=200, error_codes=list()):
+        with self.trace('post', uri) as trace:
+            self.logger.debug('POST: %s', uri)
+            response = await self.request('post', uri, trace=trace, data=data)
+            self.response_cache.invalidate(uri)
+            with tracing.span(trace, 'check_response'):
+                return self.check_response(response, success_code, error_codes)
+
+    async def patch_method(self, uri, data, success_code=200, error_codes=list()):
+        with self.trace('patch', uri) as trace:
+            self.logger.debug('PATCH: %s', uri)
+            response = await self.request('patch', uri, trace=trace, data=data)
+            self.response_cache.invalidate(uri)
+            with tracing.span(trace, 'check_response'):
+                return self.check_response(response, success_code, error_codes)
+
+    async def put_method(self, uri, success_code=200, error_codes=list()):
+        with self.trace('put', uri) as trace:
+            self.logger.debug('PUT: %s', uri)
+            response = await self.request('put', uri, trace=trace)
+            self.response_cache.invalidate(uri)
+            with tracing.span(trace, 'check_response'):
+                return self.check_response(response, success_code, error_codes)
+
+    async def delete_method(self, uri, success_code=200, error_codes=list()):
+        with self.trace('delete', uri) as trace:
+            self.logger.debug('DELETE: %s', uri)
+            response = await self.request('delete', uri, trace=trace)
+            self.response_cache.invalidate(uri)
+            with tracing.span(trace, 'check_response'):
+                return self.check_response(response, success_code, error_codes)
+
+    async def exists_method(self, uri, success_code=200, fields=None):
+        if not self.configuration_dict['STATUS_RESULTS']:
+            return await self.get_method(uri, success_code=success_code, error_codes=[404], fields=fields)
+        uri_to_call = self.get_uri_to_call(uri, fields=fields)
+        with self.trace('get', uri_to_call) as trace:
+            self.logger.debug('GET (status): %s', uri_to_call)
+            response = await self.request('get', uri_to_call, trace=trace)
+            return self.status_result(response, success_code, trace)
+
+    async def get_page(self, uri, filter_dict=None, error_codes=list()):
+        if self.singleflight is not None:
+            key = ('page', self.get_uri_to_call(uri, filter_dict=filter_dict), tuple(error_codes))
+            return await self.singleflight.do(key, self.decode_page, uri, filter_dict, error_codes)
+        return await self.decode_page(uri, filter_dict, error_codes)
+
+    async def decode_page(self, uri, filter_dict, error_codes):
+        response = await self.get_method(uri, filter_dict=filter_dict, error_codes=error_codes)
+        return response.json()
+
+    async def iter_method(self, uri, filter_dict=None, error_codes=list(), fetch_all=False, fields=None, stream=False):
+        """
+        Asynchronous generator twin of VimeoClientMethodMixin.iter_method, iter_* endpoints are used with async for.
+        """
+        if fields:
+            filter_dict = dict(filter_dict or dict(), fields=_get_fields(fields))
+        if fetch_all or stream:
+            method = self.fetch_all_method if fetch_all else self.stream_method
+            async for item in method(uri, filter_dict=filter_dict, error_codes=error_codes):
+                yield self.build_model(item)
+            return
+
+        next_page = None
+        try:
+            page = await self.get_page(uri, filter_dict=filter_dict, error_codes=error_codes)
+            while page:
+                next_uri = (page.get('paging') or dict()).get('next')
+                next_page = asyncio.ensure_future(self.get_page(next_uri, error_codes=error_codes)) if next_uri else None
+                for item in page['data']:
+                    yield self.build_model(item)
+                page = await next_page if next_page else None
+        finally:
+            if next_page and not next_page.done():
+                next_page.cancel()
+
+    async def stream_method(self, uri, filter_dict=None, error_codes=list(), chunk_size=65536):
+        """
+        Asynchronous generator twin of VimeoClientMethodMixin.stream_method. Calls are paced by the rate limiter
+        but not retried.
+        """
+        uri_to_call = self.get_uri_to_call(uri, filter_dict=filter_dict)
+        while uri_to_call:
+            self.logger.debug('GET (stream): %s', uri_to_call)
+            url, kwargs = self.prepare_aiohttp_request(uri_to_call)
+            await self.wait_rate_limit()
+            decoder = JSONListDecoder('data')
+            metric = 'GET ' + uri_template(uri_to_call)
+            started = self.metrics.begin(metric) if self.metrics is not None else None
+            try:
+                async with self.get_session().get(url, **kwargs) as response:
+                    headers_response = AsyncResponse(response.status, response.headers, str(response.url), b'')
+                    if started is not None:
+                        # latency of a streamed call is the time to the response headers
+                        self.metrics.end(metric, started, response=headers_response)
+                        started = None
+                    if response.status != 200:
+                        content = await response.read()
+                        self.check_response(AsyncResponse(response.status, response.headers, str(response.url), content),
+                                            200, error_codes)
+                    self.rate_limiter.update(headers_response)
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        for item in decoder.feed(chunk):
+                            yield item
+                    for item in decoder.feed(b'', eof=True):
+                        yield item
+            finally:
+                if started is not None:
+                    self.metrics.end(metric, started)
+            next_uri = (decoder.document.get('paging') or dict()).get('next')
+            uri_to_call = self.get_uri_to_call(next_uri) if next_uri else None
+
+    async def fetch_all_method(self, uri, filter_dict=None, error_codes=list(), max_workers=None):
+        """
+        Asynchronous generator twin of VimeoClientMethodMixin.fetch_all_method, at most max_workers pages
+        are requested ahead of the consumer.
+        """
+        max_workers = max_workers or self.configuration_dict['FETCH_ALL_WORKERS']
+        filter_dict = dict(filter_dict or dict())
+        page = await self.get_page(uri, filter_dict=filter_dict, error_codes=error_codes)
+        for item in page['data']:
+            yield item
+
+        per_page = int(page['per_page'])
+        last_page = (int(page['total']) + per_page - 1) // per_page
+        numbers = iter(range(int(page['page']) + 1, last_page + 1))
+        filter_dict['per_page'] = per_page
+
+        def submit(number):
+            return asyncio.ensure_future(self.get_page(uri, filter_dict=dict(filter_dict, page=number), error_codes=error_codes))
+
+        window = deque()
+        try:
+            window.extend(submit(number) for number in islice(numbers, max_workers))
+            while window:
+                page = await window.popleft()
+                window.extend(submit(number) for number in islice(numbers, 1))
+                for item in page['data']:
+                    yield item
+        finally:
+            for task in window:
+                task.cancel()
+
+    async def upload_video(self, file_or_path, data=None, chunk_size=None, progress=None):
+        """
+        Twin of VimeoClientMethodMixin.upload_video, the chunks are sent by a TusUpload running in the default
+        executor over a requests.Session of its own, the loop is not blocked.
+        """
+        response = await self.create_video_upload(uploads.file_size(file_or_path), data=data)
+        with requests.Session() as session:
+            upload = uploads.TusUpload(
+                self, response.json()['upload']['upload_link'], file_or_path,
+                chunk_size=chunk_size, progress=progress, session=session,
+            )
+            await asyncio.get_event_loop().run_in_executor(None, upload.upload)
+        return response
+
+    async def download_video(self, video_id, path, quality='source', progress=None):
+        """
+        Twin of VimeoClientMethodMixin.download_video, the Range requests run in the default executor over the
+        requests.Session of a VimeoClient of their own, the loop is not blocked.
+        """
+        response = await self.get_video(video_id, fields='download')
+        key, secret = self.app_info
+        with VimeoClient(token=self.token, key=key, secret=secret, configuration_dict=self.configuration_dict) as client:
+            await asyncio.get_event_loop().run_in_executor(
+                None, lambda: client.download_file(response, path, quality=quality, progress=progress),
+            )
+        return response
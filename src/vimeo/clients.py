@@ -4,9 +4,20 @@ import json
 import logging
 import requests
 
-from functools import wraps
+from functools import partial
+from requests.adapters import HTTPAdapter
 
 from vimeo import exceptions
+from vimeo import tracing
+from vimeo.components import Metrics
+from vimeo.components import RateLimiter
+from vimeo.components import ResponseCache
+from vimeo.components import RetryPolicy
+from vimeo.components import SQLiteResponseCache
+from vimeo.components import SQLiteValidatorCache
+from vimeo.components import SingleFlight
+from vimeo.components import ValidatorCache
+from vimeo.components import uri_template
 from vimeo.logger import LoggerSingleton
 from vimeo.mixins import VimeoClientMethodMixin
 
@@ -17,9 +28,68 @@ _initial_client_configuration = {
     'ACCEPT_HEADER': "application/vnd.vimeo.*;version=3.2",
     'USER_AGENT': "pyvimeo 0.1; (http://developer.vimeo.com/api/docs)",
     'TIMEOUT': (1, 30),
+    # CONNECTION POOL: every client owns a requests.Session with a mounted HTTPAdapter
+    'POOL_CONNECTIONS': 10,  # number of host pools cached by the adapter
+    'POOL_MAXSIZE': 10,  # max connections kept alive per host
+    'POOL_BLOCK': False,  # wait for a free connection instead of opening a throw-away one
+    'KEEP_ALIVE': True,
+    # LIST ENDPOINTS: max concurrent page requests of iter_*(fetch_all=True)
+    'FETCH_ALL_WORKERS': 8,
+    # BULK: max concurrent calls and retries of transient errors per job of bulk_method
+    'BULK_WORKERS': 8,
+    'BULK_RETRIES': 2,
+    # RATE LIMIT: pace calls on the X-RateLimit-* response headers, shared by all threads of a client
+    'RATE_LIMIT': True,
+    'RATE_LIMIT_BURST': 10,
+    # RETRY: exponential backoff with jitter of connection errors, timeouts and RETRY_STATUS_CODES
+    'RETRY_METHODS': {'get', 'head', 'put', 'delete'},  # idempotent methods only
+    'RETRY_STATUS_CODES': {429, 500, 502, 503, 504},
+    'RETRY_MAX': 3,
+    'RETRY_BACKOFF': 0.5,  # seconds, doubled at every retry
+    'RETRY_BACKOFF_MAX': 30,
+    'RETRY_DEADLINE': 60,  # max seconds spent on a call, retries included
+    # CONDITIONAL GET: GET responses with ETag / Last-Modified kept for revalidation, 0 disables
+    'CONDITIONAL_GET_CACHE_SIZE': 1000,
+    # RESPONSE CACHE: GET responses served without API calls, invalidated by the mutations of the client
+    'RESPONSE_CACHE_MAX_BYTES': 0,  # bound of the cached bodies, 0 disables
+    'RESPONSE_CACHE_TTL': {'': 60},  # seconds by uri prefix, the longest matching prefix wins
+    'RESPONSE_CACHE_PATH': None,  # SQLite database shared by the processes of a host, None keeps it in memory
+    # FIELDS: default projection of GET calls by uri pattern (fnmatch), the longest matching pattern wins
+    'DEFAULT_FIELDS': {},
+    # SINGLEFLIGHT: concurrent identical GETs of a client (same uri, filters and fields) share one request
+    'SINGLEFLIGHT': False,
+    # STATUS RESULTS: existence checks (read_liked_video, ...) return a StatusResult instead of raising on 404
+    'STATUS_RESULTS': False,
+    # MODELS: iter_* yield vimeo.models instances (Video, Album, ...) instead of dicts
+    'MODELS': False,
+    # UPLOADS: tus resumable uploads of upload_video and vimeo.uploads.UploadQueue
+    'UPLOAD_CHUNK_SIZE': 128 * 1024 * 1024,  # bytes sent by a PATCH
+    'UPLOAD_RETRIES': 5,  # max consecutive failures, every failure resumes from the offset of the server
+    'UPLOAD_WORKERS': 4,  # concurrent uploads of a queue
+    'UPLOAD_BANDWIDTH': 0,  # bytes per second of all the uploads of a queue, 0 disables the cap
+    # DOWNLOADS: parallel Range requests of download_video
+    'DOWNLOAD_PART_SIZE': 16 * 1024 * 1024,  # bytes of a Range request
+    'DOWNLOAD_WORKERS': 4,  # concurrent Range requests, keep it within POOL_MAXSIZE
+    'DOWNLOAD_RETRIES': 5,  # max retries of a part
+    # METRICS: calls by endpoint template, see VimeoClient.metrics
+    'METRICS': True,
+    # TRACING: spans of a share of the calls passed to hooks, see vimeo.tracing
+    'TRACE_SAMPLE_RATE': 0,  # 0 disables tracing, 1 traces every call
+    'TRACE_HOOKS': (),  # objects with before(trace) and / or after(trace) methods
 }
 
 
+def _http_method(http_method):
+    """
+    :return: client method calling VimeoClient.request with http_method
+    """
+    def method(self, url, jsonify=True, **kwargs):
+        return self.request(http_method, url, jsonify=jsonify, **kwargs)
+    method.__name__ = http_method
+    method.__doc__ = '{method} request to url, see VimeoClient.request'.format(method=http_method.upper())
+    return method
+
+
 class VimeoAuth(requests.auth.AuthBase):
     """
     Custom Authentication Class, docs at:
@@ -56,8 +126,16 @@ class VimeoClient(VimeoClientMethodMixin):
         self.logger = LoggerSingleton(
             enabled=logger_enabled,
             level=logger_level,
+            queued=kwargs.get('logger_queued', False),
+            error_rate=kwargs.get('logger_error_rate', 1.0),
+            error_burst=kwargs.get('logger_error_burst', 10),
         )
 
+        # Per instance configuration, merged on top of the shared one
+        configuration_dict = kwargs.get('configuration_dict')
+        if configuration_dict:
+            self.configuration_dict = dict(self.configuration_dict, **configuration_dict)
+
         self.token = token
 
         # Instance of VimeoAuth
@@ -71,48 +149,208 @@ class VimeoClient(VimeoClientMethodMixin):
         except AssertionError:
             raise exceptions.BadConfigurationException()
 
+        # Pooled keep-alive session
+        self.session = self.build_session()
+
+        # Rate limit scheduler
+        self.rate_limiter = RateLimiter(burst=self.configuration_dict['RATE_LIMIT_BURST'])
+
+        # Retry engine
+        self.retry_policy = RetryPolicy(
+            methods=self.configuration_dict['RETRY_METHODS'],
+            status_codes=self.configuration_dict['RETRY_STATUS_CODES'],
+            max_retries=self.configuration_dict['RETRY_MAX'],
+            backoff=self.configuration_dict['RETRY_BACKOFF'],
+            backoff_max=self.configuration_dict['RETRY_BACKOFF_MAX'],
+            deadline=self.configuration_dict['RETRY_DEADLINE'],
+        )
+
+        # Per endpoint metrics
+        self.metrics = Metrics() if self.configuration_dict['METRICS'] else None
+
+        # Sampled tracing
+        self.tracer = None
+        if self.configuration_dict['TRACE_SAMPLE_RATE']:
+            self.tracer = tracing.Tracer(
+                sample_rate=self.configuration_dict['TRACE_SAMPLE_RATE'],
+                hooks=self.configuration_dict['TRACE_HOOKS'],
+                logger=self.logger,
+            )
+
+        # Coalescing of concurrent identical GETs
+        self.singleflight = SingleFlight() if self.configuration_dict['SINGLEFLIGHT'] else None
+
+        # Response cache and conditional GET revalidation cache
+        if self.configuration_dict['RESPONSE_CACHE_PATH']:
+            self.response_cache = SQLiteResponseCache(
+                path=self.configuration_dict['RESPONSE_CACHE_PATH'],
+                namespace=token or key or '',
+                max_bytes=self.configuration_dict['RESPONSE_CACHE_MAX_BYTES'],
+                ttl=self.configuration_dict['RESPONSE_CACHE_TTL'],
+            )
+            self.validator_cache = SQLiteValidatorCache(self.response_cache)
+        else:
+            self.response_cache = ResponseCache(
+                max_bytes=self.configuration_dict['RESPONSE_CACHE_MAX_BYTES'],
+                ttl=self.configuration_dict['RESPONSE_CACHE_TTL'],
+            )
+            self.validator_cache = ValidatorCache(max_entries=self.configuration_dict['CONDITIONAL_GET_CACHE_SIZE'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def build_session(self):
+        """
+        Build a requests.Session whose HTTPAdapter is sized by the client configuration.
+        :return: session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.configuration_dict['POOL_CONNECTIONS'],
+            pool_maxsize=self.configuration_dict['POOL_MAXSIZE'],
+            pool_block=self.configuration_dict['POOL_BLOCK'],
+        )
+        if self.configuration_dict['TRACE_SAMPLE_RATE']:
+            tracing.instrument_adapter(adapter)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.configuration_dict['KEEP_ALIVE']:
+            session.headers['Connection'] = 'close'
+        return session
+
+    @property
+    def rate_limit(self):
+        """
+        Rate limit budget as of the last response: dict with limit, remaining and reset epoch seconds.
+        """
+        return self.rate_limiter.snapshot()
+
+    def close(self):
+        """
+        Close the session and release every pooled connection.
+        """
+        self.session.close()
+
+    def prepare_request(self, url, jsonify=True, **kwargs):
+        """
+        Update headers, data, timeout, auth and url of a request.
+        :param url: uri relative to API_ROOT
+        :param jsonify: dump dict or list data as json
+        :return: (url, kwargs)
+        """
+        headers = kwargs.get('headers', dict())
+        headers['Accept'] = self.configuration_dict['ACCEPT_HEADER']
+        headers['User-Agent'] = self.configuration_dict['USER_AGENT']
+
+        if jsonify and 'data' in kwargs and isinstance(kwargs['data'], (dict, list)):
+            kwargs['data'] = json.dumps(kwargs['data'])
+            headers['Content-Type'] = 'application/json'
+
+        kwargs['timeout'] = kwargs.get('timeout', self.configuration_dict['TIMEOUT'])
+        kwargs['auth'] = kwargs.get('auth', self.auth_instance)
+        kwargs['headers'] = headers
+        return self.configuration_dict['API_ROOT'] + url, kwargs
+
+    def send_measured(self, metric, request_method, url, **kwargs):
+        """
+        Call request_method, recording the call in metrics.
+        :param metric: endpoint template, 'GET /me/albums/{album_id}'
+        :return: response
+        """
+        data = kwargs.get('data')
+        started = self.metrics.begin(metric)
+        response = None
+        try:
+            response = request_method(url, **kwargs)
+        finally:
+            bytes_in = len(response.content) if response is not None and not kwargs.get('stream') else None
+            self.metrics.end(metric, started, response=response, bytes_in=bytes_in, bytes_out=len(data) if data else 0)
+        return response
+
+    def send_traced(self, trace, request_method, url, **kwargs):
+        """
+        Call request_method, recording request, ttfb and download spans in trace.
+        :return: response
+        """
+        with trace.span('request', url=url):
+            started = trace.clock()
+            response = request_method(url, **dict(kwargs, stream=True))
+            trace.add_span('ttfb', started, trace.clock())
+            trace.status_code = response.status_code
+            if not kwargs.get('stream'):
+                with trace.span('download'):
+                    response.content
+        return response
+
+    def trace(self, http_method, uri):
+        """
+        Trace of a call of the HTTP METHODS helpers, a no-op context manager when the call is not sampled.
+        :return: context manager yielding the trace or None
+        """
+        if self.tracer is None:
+            return tracing.span(None, None)
+        return self.tracer.trace('{method} {uri}'.format(method=http_method.upper(), uri=uri_template(uri)))
+
+    def request(self, http_method, url, jsonify=True, **kwargs):
+        """
+        Call the session method http_method after update of headers, kwargs and url, paced by the rate limiter and
+        retried by the retry policy.
+        :param url: uri relative to API_ROOT
+        :return: response
+        """
+        if http_method not in self.configuration_dict['HTTP_METHODS']:
+            raise exceptions.HTTPMethodNotConfiguredException(
+                method_name=http_method,
+                possible_methods=self.configuration_dict['HTTP_METHODS'],
+            )
+        if not getattr(self.session, http_method, None):
+            raise exceptions.HTTPMethodNotImplementedException(
+                method_name=http_method,
+            )
+
+        endpoint = '{method} {uri}'.format(method=http_method.upper(), uri=url.split('?', 1)[0])
+        url, kwargs = self.prepare_request(url, jsonify=jsonify, **kwargs)
+        return self.retry_policy.call(http_method, endpoint, partial(self.send, http_method, url, **kwargs))
+
+    def send(self, http_method, url, **kwargs):
+        """
+        Send a single request, paced by the rate limiter.
+        :return: response
+        """
+        request_method = getattr(self.session, http_method)
+        if self.configuration_dict['RATE_LIMIT']:
+            self.rate_limiter.acquire()
+        trace = tracing.current_trace() if self.tracer is not None else None
+        call = request_method if trace is None else partial(self.send_traced, trace, request_method)
+        if self.metrics is None:
+            response = call(url, **kwargs)
+        else:
+            uri = url[len(self.configuration_dict['API_ROOT']):]
+            metric = '{method} {uri}'.format(method=http_method.upper(), uri=uri_template(uri))
+            response = self.send_measured(metric, call, url, **kwargs)
+        self.rate_limiter.update(response)
+        return response
+
+    # HTTP METHODS: get, post, ... of the session called through request
+    head = _http_method('head')
+    get = _http_method('get')
+    post = _http_method('post')
+    put = _http_method('put')
+    patch = _http_method('patch')
+    options = _http_method('options')
+    delete = _http_method('delete')
+
     def __getattr__(self, name):
         """
         Called when an attribute lookup has not found
         """
 
-        if name in self.configuration_dict.keys():
+        if name in self.configuration_dict:
             return self.configuration_dict[name]
 
-        if name in self.configuration_dict['HTTP_METHODS']:
-            http_method = name
-            request_method = getattr(requests, http_method, None)
-            if not request_method:
-                raise exceptions.HTTPMethodNotImplementedException(
-                    method_name=http_method,
-                )
-
-            @wraps(request_method)
-            def caller(url, jsonify=True, **kwargs):
-                """
-                Call request_method after update:
-                 - headers
-                 - kwargs
-                 - url
-                """
-                headers = kwargs.get('headers', dict())
-                headers['Accept'] = self.configuration_dict['ACCEPT_HEADER']
-                headers['User-Agent'] = self.configuration_dict['USER_AGENT']
-
-                if jsonify and 'data' in kwargs and isinstance(kwargs['data'], (dict, list)):
-                    kwargs['data'] = json.dumps(kwargs['data'])
-                    headers['Content-Type'] = 'application/json'
-
-                kwargs['timeout'] = kwargs.get('timeout', self.configuration_dict['TIMEOUT'])
-                kwargs['auth'] = kwargs.get('auth', self.auth_instance)
-                kwargs['headers'] = headers
-                url = self.API_ROOT + url
-
-                return request_method(url, **kwargs)
-
-            # wrapped method of requests (GET, POST, ..) is returned
-            return caller
-
 
 class VimeoClientSingleton(object):
 
@@ -1 +1,829 @@
 # coding: utf-8 -*-
+
+import calendar
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections import OrderedDict
+from concurrent.futures import Future
+from email.utils import mktime_tz
+from email.utils import parsedate_tz
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from vimeo import exceptions
+
+
+def is_transient_error(error):
+    """
+    True for errors that can succeed if the call is repeated: connection errors, timeouts, 429 and 5xx.
+    """
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(error, exceptions.HTTPErrorException):
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return False
+
+
+class StatusResult(object):
+    """
+    Outcome of an existence check (read_liked_video, ...) when STATUS_RESULTS is enabled, true if the resource exists
+    """
+    __slots__ = ('status_code', 'exists')
+
+    def __init__(self, status_code, exists):
+        self.status_code = status_code
+        self.exists = exists
+
+    def __repr__(self):
+        return 'StatusResult(status_code={status_code}, exists={exists})'.format(
+            status_code=self.status_code, exists=self.exists,
+        )
+
+    def __bool__(self):
+        return self.exists
+
+    __nonzero__ = __bool__  # python 2
+
+
+class BulkResult(object):
+    """
+    Outcome of a single job of VimeoClientMethodMixin.bulk_method
+    """
+    SUCCESS = 'success'
+    FAILED = 'failed'
+
+    __slots__ = ('index', 'job', 'status', 'response', 'exception', 'attempts')
+
+    def __init__(self, index, job, status, response=None, exception=None, attempts=1):
+        self.index = index
+        self.job = job
+        self.status = status
+        self.response = response
+        self.exception = exception
+        self.attempts = attempts
+
+    def __repr__(self):
+        return 'BulkResult(job={job!r}, status={status}, attempts={attempts})'.format(
+            job=self.job, status=self.status, attempts=self.attempts,
+        )
+
+    @property
+    def succeeded(self):
+        return self.status == self.SUCCESS
+
+    @property
+    def retried(self):
+        return self.attempts > 1
+
+
+def run_bulk_job(index, method, job, retries):
+    """
+    Call method with the job arguments: a tuple is expanded as positional arguments, a dict as keyword
+    arguments, anything else is the only argument. Transient errors are retried up to retries times, any
+    VimeoException is recorded in the result instead of being raised.
+    :return: BulkResult
+    """
+    if isinstance(job, tuple):
+        args, kwargs = job, dict()
+    elif isinstance(job, dict):
+        args, kwargs = tuple(), job
+    else:
+        args, kwargs = (job, ), dict()
+
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            response = method(*args, **kwargs)
+        except (exceptions.VimeoException, requests.exceptions.RequestException) as error:
+            if attempts <= retries and is_transient_error(error):
+                continue
+            return BulkResult(index, job, BulkResult.FAILED, exception=error, attempts=attempts)
+        return BulkResult(index, job, BulkResult.SUCCESS, response=response, attempts=attempts)
+
+
+class SingleFlight(object):
+    """
+    Coalesce concurrent calls with the same key: the first caller runs the function, the callers arriving while
+    it runs wait for it and get the same result, or the same exception.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = dict()
+
+    def do(self, key, function, *args, **kwargs):
+        """
+        :return: result of function(*args, **kwargs), run once for the concurrent calls with key
+        """
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self.lock:
+                del self.calls[key]
+        return result
+
+
+def parse_rate_limit_reset(value, now):
+    """
+    Parse X-RateLimit-Reset: an ISO 8601 date (as sent by the API), epoch seconds or seconds from now.
+    :return: epoch seconds or None
+    """
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        pass
+    else:
+        return seconds if seconds > 1e9 else now + seconds
+    try:
+        reset = calendar.timegm(time.strptime(value[:19], '%Y-%m-%dT%H:%M:%S'))
+    except (TypeError, ValueError):
+        return None
+    offset = value[19:].split('.')[-1].lstrip('0123456789')
+    if offset[:1] in ('+', '-') and len(offset) >= 6:
+        sign = 1 if offset[0] == '+' else -1
+        reset -= sign * (int(offset[1:3]) * 3600 + int(offset[4:6]) * 60)
+    return reset
+
+
+class RateLimiter(object):
+    """
+    Token bucket shared by every thread of a client, refilled so that the remaining budget reported by the
+    API is spread until the reset time. Without rate limit headers calls are not paced.
+    """
+    LIMIT_HEADER = 'X-RateLimit-Limit'
+    REMAINING_HEADER = 'X-RateLimit-Remaining'
+    RESET_HEADER = 'X-RateLimit-Reset'
+
+    def __init__(self, burst=10, clock=time.time, sleep=time.sleep):
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self.lock = threading.Lock()
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+        self.tokens = burst
+        self.refilled = clock()
+
+    def reserve(self):
+        """
+        Take a token if available.
+        :return: seconds to wait before trying again, 0 when the call can be sent
+        """
+        with self.lock:
+            now = self.clock()
+            if self.remaining is None or self.reset is None or now >= self.reset:
+                # budget unknown or expired: the next response tells the new one
+                self.remaining = None
+                self.refilled = now
+                return 0
+            if self.remaining <= 0:
+                return self.reset - now
+
+            rate = self.remaining / (self.reset - now)
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled) * rate)
+            self.refilled = now
+            if self.tokens < 1:
+                return (1 - self.tokens) / rate
+            self.tokens -= 1
+            self.remaining -= 1
+            return 0
+
+    def acquire(self):
+        """
+        Block the calling thread until a call can be sent.
+        """
+        wait = self.reserve()
+        while wait:
+            self.sleep(wait)
+            wait = self.reserve()
+
+    def update(self, response):
+        """
+        Update the budget with the rate limit headers of a response.
+        """
+        headers = response.headers
+        if self.REMAINING_HEADER not in headers and response.status_code != 429:
+            return
+        with self.lock:
+            now = self.clock()
+            if self.LIMIT_HEADER in headers:
+                self.limit = int(headers[self.LIMIT_HEADER])
+            if self.REMAINING_HEADER in headers:
+                self.remaining = int(headers[self.REMAINING_HEADER])
+            if self.RESET_HEADER in headers:
+                self.reset = parse_rate_limit_reset(headers[self.RESET_HEADER], now)
+            if response.status_code == 429:
+                self.remaining = 0
+                if self.reset is None or self.reset <= now:
+                    self.reset = parse_rate_limit_reset(headers.get('Retry-After'), now) or now + 1
+
+    def snapshot(self):
+        """
+        :return: dict with limit, remaining budget and reset epoch seconds, for monitoring
+        """
+        with self.lock:
+            return dict(limit=self.limit, remaining=self.remaining, reset=self.reset)
+
+
+class BandwidthLimiter(object):
+    """
+    Token bucket of rate bytes per second shared by every thread, bursts are bounded by a second of bytes.
+    Reservations can go in debt, so concurrent senders are served in order.
+    """
+
+    def __init__(self, rate, clock=time.time, sleep=time.sleep):
+        self.rate = float(rate)
+        self.clock = clock
+        self.sleep = sleep
+        self.lock = threading.Lock()
+        self.available = self.rate
+        self.refilled = clock()
+
+    def reserve(self, size):
+        """
+        Take size bytes from the bucket.
+        :return: seconds to wait before sending them
+        """
+        with self.lock:
+            now = self.clock()
+            self.available = min(self.rate, self.available + (now - self.refilled) * self.rate)
+            self.refilled = now
+            self.available -= size
+            return max(0.0, -self.available / self.rate)
+
+    def acquire(self, size):
+        """
+        Block the calling thread until size bytes can be sent.
+        """
+        wait = self.reserve(size)
+        if wait:
+            self.sleep(wait)
+
+
+def parse_retry_after(value, now):
+    """
+    Parse Retry-After: seconds or HTTP date.
+    :return: seconds to wait or None
+    """
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    date = parsedate_tz(value) if value else None
+    return max(0.0, mktime_tz(date) - now) if date else None
+
+
+class RetryPolicy(object):
+    """
+    Exponential backoff with full jitter for idempotent calls, honoring Retry-After, within a total deadline.
+    Retries are counted per endpoint.
+    """
+
+    def __init__(self, methods, status_codes, max_retries=3, backoff=0.5, backoff_max=30, deadline=60,
+                 clock=time.time, sleep=time.sleep, jitter=random.uniform):
+        self.methods = methods
+        self.status_codes = status_codes
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.clock = clock
+        self.sleep = sleep
+        self.jitter = jitter
+        self.lock = threading.Lock()
+        self.retries = Counter()
+
+    def retry_wait(self, http_method, endpoint, attempt, started, response=None, error=None):
+        """
+        Decide if a failed attempt is retried, counting the retry.
+        :param attempt: number of attempts already done
+        :param started: clock time of the first attempt
+        :param response: response of the attempt
+        :param error: transient error (connection error, timeout) raised by the attempt
+        :return: seconds to wait before the next attempt, None if the call must not be retried
+        """
+        if http_method not in self.methods or attempt > self.max_retries:
+            return None
+        if error is None and response.status_code not in self.status_codes:
+            return None
+
+        now = self.clock()
+        wait = self.jitter(0, min(self.backoff_max, self.backoff * 2 ** (attempt - 1)))
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'), now)
+            if retry_after is not None:
+                wait = max(wait, retry_after)
+        if now + wait - started > self.deadline:
+            return None
+
+        with self.lock:
+            self.retries[endpoint] += 1
+        return wait
+
+    def call(self, http_method, endpoint, send):
+        """
+        Call send until it returns a response that is not retried.
+        :param send: callable sending the request
+        :return: response
+        """
+        started = self.clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            response, error = None, None
+            try:
+                response = send()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exception:
+                error = exception
+            wait = self.retry_wait(http_method, endpoint, attempt, started, response=response, error=error)
+            if wait is None:
+                if error is not None:
+                    raise error
+                return response
+            self.sleep(wait)
+
+    def counters(self):
+        """
+        :return: dict of retries per endpoint
+        """
+        with self.lock:
+            return dict(self.retries)
+
+
+class ValidatorCache(object):
+    """
+    LRU of the last max_entries GET responses carrying an ETag or Last-Modified validator, keyed by uri.
+    The validators are sent back as If-None-Match / If-Modified-Since, a 304 is answered with the cached response.
+    """
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        """
+        :return: cached response or None
+        """
+        if not self.max_entries:
+            return None
+        with self.lock:
+            response = self.entries.pop(key, None)
+            if response is not None:
+                self.entries[key] = response
+            return response
+
+    @staticmethod
+    def conditional_headers(cached_response):
+        """
+        :return: If-None-Match / If-Modified-Since headers of a cached response
+        """
+        headers = dict()
+        if cached_response is not None:
+            if 'ETag' in cached_response.headers:
+                headers['If-None-Match'] = cached_response.headers['ETag']
+            if 'Last-Modified' in cached_response.headers:
+                headers['If-Modified-Since'] = cached_response.headers['Last-Modified']
+        return headers
+
+    def update(self, key, response, cached_response=None):
+        """
+        Store a response with validators.
+        :param cached_response: response whose validators were sent
+        :return: cached_response if response is 304 Not Modified, else response
+        """
+        if response.status_code == 304 and cached_response is not None:
+            return cached_response
+        if not self.max_entries or response.status_code != 200:
+            return response
+        if 'ETag' in response.headers or 'Last-Modified' in response.headers:
+            with self.lock:
+                self.entries.pop(key, None)
+                self.entries[key] = response
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        return response
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+def _uri_path(uri):
+    return uri.split('?', 1)[0].rstrip('/')
+
+
+def _is_related_path(path, other_path):
+    """
+    True if the paths are equal or one contains the other, e.g. /me/albums/1 and /me/albums/1/videos/2
+    """
+    return path == other_path or path.startswith(other_path + '/') or other_path.startswith(path + '/')
+
+
+class ResponseCache(object):
+    """
+    In-memory cache of successful GET responses, bounded to max_bytes of response bodies with LRU eviction.
+    Entries live for the TTL of the longest uri prefix matching in ttl ('' is the default, 0 is not cached).
+    A mutation of a uri drops every entry of the same, a containing or a contained path: adding a video to
+    /me/albums/1/videos/2 drops /me/albums/1/videos, /me/albums/1, /me/albums and /me.
+    """
+
+    def __init__(self, max_bytes=0, ttl=None, clock=time.time):
+        self.max_bytes = max_bytes
+        self.ttl = sorted((ttl or dict()).items(), key=lambda item: len(item[0]), reverse=True)
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key: (response, expires, size)
+        self.size = 0
+
+    def ttl_for(self, path):
+        for prefix, seconds in self.ttl:
+            if not prefix or path == prefix.rstrip('/') or path.startswith(prefix.rstrip('/') + '/'):
+                return seconds
+        return 0
+
+    def _drop(self, key):
+        self.size -= self.entries.pop(key)[2]
+
+    def get(self, key):
+        """
+        :return: cached response or None if missing or expired
+        """
+        if not self.max_bytes:
+            return None
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self._drop(key)
+            if entry[1] <= self.clock():
+                return None
+            self.entries[key] = entry
+            self.size += entry[2]
+            return entry[0]
+
+    def set(self, key, response):
+        ttl = self.ttl_for(_uri_path(key))
+        size = len(response.content)
+        if not self.max_bytes or not ttl or size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._drop(key)
+            self.entries[key] = (response, self.clock() + ttl, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._drop(next(iter(self.entries)))
+
+    def invalidate(self, uri):
+        """
+        Drop the entries related to a mutated uri.
+        """
+        if not self.max_bytes:
+            return
+        path = _uri_path(uri)
+        with self.lock:
+            for key in [key for key in self.entries if _is_related_path(path, _uri_path(key))]:
+                self._drop(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    ResponseCache stored in a SQLite database in WAL mode, shared by the processes of a host: a worker starting
+    cold reads the responses fetched by the others. Entries are namespaced by token, bounded to max_bytes of
+    bodies with least recently used eviction. Expired entries with an ETag or Last-Modified validator are kept
+    for revalidation, see SQLiteValidatorCache.
+    """
+
+    def __init__(self, path, namespace='', max_bytes=0, ttl=None, clock=time.time, timeout=30):
+        super(SQLiteResponseCache, self).__init__(max_bytes=max_bytes, ttl=ttl, clock=clock)
+        self.path = path
+        self.namespace = hashlib.sha1(namespace.encode('utf-8')).hexdigest()[:16]
+        self.timeout = timeout
+        self.local = threading.local()
+        if self.max_bytes:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    content BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires REAL NOT NULL,
+                    validated INTEGER NOT NULL,
+                    accessed REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                );
+                CREATE INDEX IF NOT EXISTS responses_path ON responses (namespace, path);
+                CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+            """)
+
+    @property
+    def connection(self):
+        """
+        sqlite3 connections can not be shared by threads, one per thread is opened.
+        """
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self.local.connection = connection
+        return connection
+
+    @staticmethod
+    def build_response(row):
+        status_code, headers, url, content = row
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.url = url
+        response.encoding = 'utf-8'
+        response._content = bytes(content)
+        return response
+
+    def _get(self, key, fresh):
+        if not self.max_bytes:
+            return None
+        now = self.clock()
+        query = 'SELECT status_code, headers, url, content FROM responses WHERE namespace = ? AND key = ?'
+        query += ' AND expires > ?' if fresh else ' AND (expires > ? OR validated)'
+        row = self.connection.execute(query, (self.namespace, key, now)).fetchone()
+        if row is None:
+            return None
+        self.connection.execute(
+            'UPDATE responses SET accessed = ? WHERE namespace = ? AND key = ?', (now, self.namespace, key),
+        )
+        return self.build_response(row)
+
+    def get(self, key):
+        """
+        :return: cached response or None if missing or expired
+        """
+        return self._get(key, fresh=True)
+
+    def get_stale(self, key):
+        """
+        :return: cached response, also if expired, or None
+        """
+        return self._get(key, fresh=False)
+
+    def set(self, key, response):
+        size = len(response.content)
+        ttl = self.ttl_for(_uri_path(key))
+        validated = 'ETag' in response.headers or 'Last-Modified' in response.headers
+        if not self.max_bytes or not (ttl or validated) or size > self.max_bytes:
+            return
+        now = self.clock()
+        self.connection.execute(
+            'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (self.namespace, key, _uri_path(key), response.status_code, json.dumps(dict(response.headers)),
+             response.url or '', sqlite3.Binary(response.content), size, now + ttl, validated, now),
+        )
+        self.evict()
+
+    def evict(self):
+        """
+        Drop the least recently used entries while the bodies exceed max_bytes.
+        """
+        excess = self.connection.execute('SELECT TOTAL(size) FROM responses').fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        rows = self.connection.execute('SELECT namespace, key, size FROM responses ORDER BY accessed')
+        keys = []
+        for namespace, key, size in rows:
+            keys.append((namespace, key))
+            excess -= size
+            if excess <= 0:
+                break
+        self.connection.executemany('DELETE FROM responses WHERE namespace = ? AND key = ?', keys)
+
+    def invalidate(self, uri):
+        """
+        Drop the entries related to a mutated uri, as ResponseCache.invalidate.
+        """
+        if not self.max_bytes:
+            return
+        path = _uri_path(uri)
+        self.connection.execute(
+            "DELETE FROM responses WHERE namespace = ? AND (path = ? OR ? LIKE path || '/%' OR path LIKE ? || '/%')",
+            (self.namespace, path, path, path),
+        )
+
+    def clear(self):
+        if self.max_bytes:
+            self.connection.execute('DELETE FROM responses WHERE namespace = ?', (self.namespace, ))
+
+
+class SQLiteValidatorCache(object):
+    """
+    ValidatorCache on top of a SQLiteResponseCache: expired entries are revalidated with their stored validators.
+    Responses are stored by SQLiteResponseCache.set once checked.
+    """
+
+    conditional_headers = staticmethod(ValidatorCache.conditional_headers)
+
+    def __init__(self, response_cache):
+        self.response_cache = response_cache
+
+    def get(self, key):
+        return self.response_cache.get_stale(key)
+
+    def update(self, key, response, cached_response=None):
+        if response.status_code == 304 and cached_response is not None:
+            return cached_response
+        return response
+
+    def clear(self):
+        self.response_cache.clear()
+
+
+_ID_SEGMENT = re.compile(r'/([A-Za-z_]+)/(\d+)(?=/|$)')
+
+
+def _name_id(match):
+    collection = match.group(1)
+    name = collection[:-1] if collection.endswith('s') else collection
+    return '/{collection}/{{{name}_id}}'.format(collection=collection, name=name)
+
+
+def uri_template(uri):
+    """
+    Template of a uri, the numeric ids are named after their collection and the querystring is dropped:
+    /me/albums/123/videos/456?page=2 is /me/albums/{album_id}/videos/{video_id}
+    """
+    return _ID_SEGMENT.sub(_name_id, uri.split('?', 1)[0])
+
+
+class EndpointMetrics(object):
+    """
+    Counters of the calls of an endpoint
+    """
+    __slots__ = ('count', 'errors', 'in_flight', 'statuses', 'buckets', 'latency', 'bytes_in', 'bytes_out')
+
+    def __init__(self, buckets):
+        self.count = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.statuses = Counter()
+        self.buckets = [0] * (len(buckets) + 1)
+        self.latency = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics(object):
+    """
+    Calls by endpoint ('GET /me/albums/{album_id}'): count, status codes, connection errors, latency histogram,
+    bytes received and sent, calls in flight. The hot path takes a lock, a bisect and a few increments.
+
+        started = metrics.begin(endpoint)
+        metrics.end(endpoint, started, response=response, bytes_out=len(body))
+    """
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, buckets=BUCKETS, clock=time.time):
+        self.bucket_bounds = tuple(buckets)
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.endpoints = dict()
+
+    def begin(self, endpoint):
+        """
+        :return: start time of the call, for end
+        """
+        with self.lock:
+            metrics = self.endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self.endpoints[endpoint] = EndpointMetrics(self.bucket_bounds)
+            metrics.in_flight += 1
+        return self.clock()
+
+    def end(self, endpoint, started, response=None, bytes_in=None, bytes_out=0):
+        """
+        :param response: response of the call, None for a connection error or timeout
+        :param bytes_in: bytes received, Content-Length of the response by default
+        """
+        latency = self.clock() - started
+        if bytes_in is None and response is not None:
+            bytes_in = int(response.headers.get('Content-Length') or 0)
+        with self.lock:
+            metrics = self.endpoints[endpoint]
+            metrics.in_flight -= 1
+            metrics.count += 1
+            if response is None:
+                metrics.errors += 1
+            else:
+                metrics.statuses[response.status_code] += 1
+            metrics.buckets[bisect_left(self.bucket_bounds, latency)] += 1
+            metrics.latency += latency
+            metrics.bytes_in += bytes_in or 0
+            metrics.bytes_out += bytes_out
+
+    def snapshot(self):
+        """
+        :return: dict by endpoint with count, errors, in_flight, status (count by status code), latency (sum and
+         cumulative count by upper bound in seconds), bytes_in and bytes_out
+        """
+        bounds = self.bucket_bounds + (float('inf'), )
+        with self.lock:
+            snapshot = dict()
+            for endpoint, metrics in self.endpoints.items():
+                cumulative, buckets = 0, OrderedDict()
+                for bound, count in zip(bounds, metrics.buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                snapshot[endpoint] = dict(
+                    count=metrics.count,
+                    errors=metrics.errors,
+                    in_flight=metrics.in_flight,
+                    status=dict(metrics.statuses),
+                    latency=dict(sum=metrics.latency, buckets=buckets),
+                    bytes_in=metrics.bytes_in,
+                    bytes_out=metrics.bytes_out,
+                )
+        return snapshot
+
+    def prometheus(self, prefix='vimeo'):
+        """
+        :return: snapshot in the Prometheus text exposition format
+        """
+        lines = []
+
+        def family(name, kind, description):
+            lines.append('# HELP {prefix}_{name} {description}'.format(prefix=prefix, name=name, description=description))
+            lines.append('# TYPE {prefix}_{name} {kind}'.format(prefix=prefix, name=name, kind=kind))
+
+        def sample(name, labels, value):
+            lines.append('{prefix}_{name}{{{labels}}} {value}'.format(
+                prefix=prefix, name=name, value=value,
+                labels=','.join('{key}="{value}"'.format(key=key, value=_label(label)) for key, label in labels),
+            ))
+
+        snapshot = sorted(self.snapshot().items())
+        family('requests_total', 'counter', 'Responses by endpoint and status code.')
+        for endpoint, metrics in snapshot:
+            method, template = endpoint.split(' ', 1)
+            for status, count in sorted(metrics['status'].items()):
+                sample('requests_total', (('method', method), ('endpoint', template), ('status', status)), count)
+        family('request_errors_total', 'counter', 'Connection errors and timeouts by endpoint.')
+        for endpoint, metrics in snapshot:
+            method, template = endpoint.split(' ', 1)
+            sample('request_errors_total', (('method', method), ('endpoint', template)), metrics['errors'])
+        family('request_duration_seconds', 'histogram', 'Latency of the calls by endpoint.')
+        for endpoint, metrics in snapshot:
+            method, template = endpoint.split(' ', 1)
+            labels = (('method', method), ('endpoint', template))
+            for bound, count in metrics['latency']['buckets'].items():
+                sample('request_duration_seconds_bucket', labels + (('le', '+Inf' if bound == float('inf') else bound), ),
+                       count)
+            sample('request_duration_seconds_sum', labels, metrics['latency']['sum'])
+            sample('request_duration_seconds_count', labels, metrics['count'])
+        family('request_bytes_total', 'counter', 'Bytes received (in) and sent (out) by endpoint.')
+        for endpoint, metrics in snapshot:
+            method, template = endpoint.split(' ', 1)
+            sample('request_bytes_total', (('method', method), ('endpoint', template), ('direction', 'in')),
+                   metrics['bytes_in'])
+            sample('request_bytes_total', (('method', method), ('endpoint', template), ('direction', 'out')),
+                   metrics['bytes_out'])
+        family('requests_in_flight', 'gauge', 'Calls waiting for a response by endpoint.')
+        for endpoint, metrics in snapshot:
+            method, template = endpoint.split(' ', 1)
+            sample('requests_in_flight', (('method', method), ('endpoint', template)), metrics['in_flight'])
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,205 @@
+# coding: utf-8
+"""
+Parallel ranged downloads of video files (the links of the download section of a video).
+
+The file is split in parts of part_size bytes, fetched concurrently with Range requests over the pooled connections
+of the client and written straight into a memory mapping of a preallocated <path>.part file. Finished parts are
+recorded in <path>.part.json: a download started again after a failure or a crash fetches only the missing parts.
+At the end size and md5 are verified and <path>.part is renamed to path.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+
+import requests
+
+from vimeo import exceptions
+from vimeo.utils import write_json_atomic
+
+
+class RangedDownload(object):
+    """
+    Download url to path:
+
+        download = RangedDownload(vimeo_client, link, '/backup/video.mp4', size=size, md5=md5)
+        download.download()
+
+    Servers without Range support are downloaded with a single GET. Connection errors, timeouts, 429, 5xx and
+    truncated bodies are retried per part, with the backoff of the client retry policy.
+    """
+
+    def __init__(self, client, url, path, size=None, md5=None, part_size=None, max_workers=None, retries=None,
+                 progress=None):
+        """
+        :param client: VimeoClient, provides configuration, retry backoff and session
+        :param url: file url
+        :param path: destination path
+        :param size: expected size in bytes
+        :param md5: expected md5 hex digest
+        :param part_size: bytes of a Range request, DOWNLOAD_PART_SIZE by default
+        :param max_workers: concurrent Range requests, DOWNLOAD_WORKERS by default
+        :param retries: max retries of a part, DOWNLOAD_RETRIES by default
+        :param progress: callable receiving (received, size) after every written block
+        """
+        self.client = client
+        self.url = url
+        self.path = path
+        self.size = size
+        self.md5 = md5
+        self.part_size = part_size or client.configuration_dict['DOWNLOAD_PART_SIZE']
+        self.max_workers = max_workers or client.configuration_dict['DOWNLOAD_WORKERS']
+        self.retries = client.configuration_dict['DOWNLOAD_RETRIES'] if retries is None else retries
+        self.progress = progress
+        self.part_path = path + '.part'
+        self.state_path = path + '.part.json'
+        self.lock = threading.Lock()
+        self.received = 0
+
+    def request(self, method, headers=None, stream=False):
+        headers = dict(headers or dict(), **{'User-Agent': self.client.configuration_dict['USER_AGENT']})
+        return self.client.session.request(
+            method, self.url, headers=headers, stream=stream, timeout=self.client.configuration_dict['TIMEOUT'],
+        )
+
+    def probe(self):
+        """
+        :return: (size, ranges supported, validator of the file)
+        """
+        response = self.request('HEAD')
+        response.close()
+        if response.status_code != 200:
+            raise exceptions.DownloadException(self.url, response.status_code)
+        size = response.headers.get('Content-Length')
+        ranges = response.headers.get('Accept-Ranges') == 'bytes'
+        return (int(size) if size is not None else None), ranges, response.headers.get('ETag')
+
+    def load_state(self, size, etag):
+        """
+        :return: indexes of the parts already written to the .part file, empty if the file changed
+        """
+        if not os.path.exists(self.state_path) or not os.path.exists(self.part_path):
+            return set()
+        with open(self.state_path) as state_file:
+            state = json.load(state_file)
+        if state.get('size') != size or state.get('etag') != etag or state.get('part_size') != self.part_size:
+            return set()
+        return set(state['done'])
+
+    def save_state(self, size, etag, done):
+        write_json_atomic(self.state_path, dict(size=size, etag=etag, part_size=self.part_size, done=sorted(done)))
+
+    def add_received(self, length, size):
+        with self.lock:
+            self.received += length
+            received = self.received
+        if self.progress:
+            self.progress(received, size)
+
+    def fetch_part(self, output, start, end, size, ranged):
+        """
+        Write bytes start..end (inclusive) of the file at the same offsets of output.
+        """
+        headers = {'Range': 'bytes={start}-{end}'.format(start=start, end=end)} if ranged else None
+        response = self.request('GET', headers=headers, stream=True)
+        position = start
+        try:
+            if response.status_code != (206 if ranged else 200):
+                raise exceptions.DownloadException(self.url, response.status_code)
+            for block in response.iter_content(65536):
+                block = block[:end + 1 - position]
+                output[position:position + len(block)] = block
+                position += len(block)
+                self.add_received(len(block), size)
+        finally:
+            response.close()
+            if position != end + 1:
+                # the bytes of an incomplete part are fetched again
+                self.add_received(start - position, size)
+        if position != end + 1:
+            raise exceptions.DownloadException(self.url)
+
+    def is_transient(self, error):
+        if isinstance(error, exceptions.DownloadException):
+            return error.status_code is None or error.status_code == 429 or error.status_code >= 500
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                                  requests.exceptions.ChunkedEncodingError))
+
+    def fetch_part_with_retries(self, output, start, end, size, ranged):
+        policy = self.client.retry_policy
+        failures = 0
+        while True:
+            try:
+                return self.fetch_part(output, start, end, size, ranged)
+            except Exception as error:
+                failures += 1
+                if failures > self.retries or not self.is_transient(error):
+                    raise
+                self.client.logger.debug('GET (retry range %d-%d): %s', start, end, self.url)
+                policy.sleep(policy.jitter(0, min(policy.backoff_max, policy.backoff * 2 ** (failures - 1))))
+
+    def fetch_parts(self, output, size, ranged, etag):
+        parts = [(index, start, min(start + self.part_size, size) - 1)
+                 for index, start in enumerate(range(0, size, self.part_size))] if ranged else [(0, 0, size - 1)]
+        done = self.load_state(size, etag) if ranged else set()
+        self.received = sum(end + 1 - start for index, start, end in parts if index in done)
+
+        executor = ThreadPoolExecutor(self.max_workers)
+        futures = dict(
+            (executor.submit(self.fetch_part_with_retries, output, start, end, size, ranged), index)
+            for index, start, end in parts if index not in done
+        )
+        try:
+            for future in as_completed(futures):
+                future.result()
+                done.add(futures[future])
+                if ranged:
+                    output.flush()
+                    self.save_state(size, etag, done)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def verify(self, output, size):
+        if self.size is not None and size != self.size:
+            raise exceptions.DownloadException(self.url, error_text='size {size} instead of {expected}'.format(
+                size=size, expected=self.size,
+            ))
+        if self.md5 and hashlib.md5(output).hexdigest() != self.md5.lower():
+            # corrupted parts cannot be told apart: the next download starts from scratch
+            if os.path.exists(self.state_path):
+                os.remove(self.state_path)
+            raise exceptions.DownloadException(self.url, error_text='md5 mismatch')
+
+    def download(self):
+        """
+        Download the missing parts of the file, verify it and move it to path.
+        :return: path
+        """
+        size, ranged, etag = self.probe()
+        if size is None:
+            raise exceptions.DownloadException(self.url, error_text='Content-Length missing')
+
+        mode = 'r+b' if os.path.exists(self.part_path) else 'w+b'
+        with open(self.part_path, mode) as part_file:
+            part_file.truncate(size)
+            if size:
+                output = mmap.mmap(part_file.fileno(), size)
+                try:
+                    self.fetch_parts(output, size, ranged, etag)
+                    self.verify(output, size)
+                    output.flush()
+                finally:
+                    output.close()
+            else:
+                self.verify(b'', size)
+
+        getattr(os, 'replace', os.rename)(self.part_path, self.path)
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        return self.path
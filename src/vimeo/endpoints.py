@@ -0,0 +1,341 @@
+# coding: utf-8
+"""
+Declarative table of the API endpoints of VimeoClientMethodMixin.
+
+Every Endpoint becomes a client method when the mixin class is created (see define_endpoints): the method source is
+generated once with the exact signature of the endpoint and the uri template precompiled to a printf format, so a
+call only interpolates the path arguments and calls the HTTP METHODS helper:
+
+    Endpoint('read_album', 'get', '/me/albums/{album_id}', error_codes=(404, ), fields=True, doc='Get an Album.')
+
+is compiled to:
+
+    def read_album(self, album_id, fields=None):
+        return self.get_method(_uri % (album_id, ), success_code=200, error_codes=_error_codes, fields=fields)
+"""
+
+import re
+
+_PATH_PARAMETER = re.compile(r'\{(\w+)\}')
+
+# methods a retry cannot apply twice
+IDEMPOTENT_METHODS = frozenset(('get', 'head', 'put', 'delete', 'options'))
+
+
+class Endpoint(object):
+    """
+    An endpoint of the API and the signature of its client method:
+     - get endpoints read a resource, with paginated the method is an iter_* generator of the items and with exists
+       an existence check (see exists_method)
+     - filters and fields add the filter_dict and fields arguments
+     - data is the body of post / patch calls: 'data' (required argument), 'data=None' (optional argument) or a tuple
+       of arguments sent as fields of the body, 'name=None' for the optional ones
+    """
+    __slots__ = ('name', 'http_method', 'uri', 'success_code', 'error_codes', 'paginated', 'exists', 'filters',
+                 'fields', 'data', 'idempotent', 'doc', 'path_parameters', 'uri_format')
+
+    def __init__(self, name, http_method, uri, success_code=200, error_codes=(), paginated=False, exists=False,
+                 filters=False, fields=False, data=None, idempotent=None, doc=''):
+        self.name = name
+        self.http_method = http_method
+        self.uri = uri
+        self.success_code = success_code
+        self.error_codes = tuple(error_codes)
+        self.paginated = paginated
+        self.exists = exists
+        self.filters = filters
+        self.fields = fields
+        self.data = data
+        self.idempotent = http_method in IDEMPOTENT_METHODS if idempotent is None else idempotent
+        self.doc = doc
+        self.path_parameters = tuple(_PATH_PARAMETER.findall(uri))
+        self.uri_format = _PATH_PARAMETER.sub('%s', uri)
+
+    def __repr__(self):
+        return 'Endpoint({http_method} {uri})'.format(http_method=self.http_method.upper(), uri=self.uri)
+
+    @property
+    def helper(self):
+        """
+        Name of the HTTP METHODS helper called by the method
+        """
+        if self.paginated:
+            return 'iter_method'
+        if self.exists:
+            return 'exists_method'
+        return '{http_method}_method'.format(http_method=self.http_method)
+
+    def signature(self):
+        """
+        :return: (parameters, arguments of the helper, docstring lines) of the method
+        """
+        parameters = list(self.path_parameters)
+        docs = [':param {name}'.format(name=name) for name in self.path_parameters]
+        uri = '_uri % ({parameters}, )'.format(parameters=', '.join(parameters)) if parameters else '_uri'
+        arguments = [uri]
+
+        if self.paginated:
+            parameters += ['filter_dict=None', 'fetch_all=False', 'fields=None', 'stream=False']
+            arguments += ['filter_dict=filter_dict', 'error_codes=_error_codes', 'fetch_all=fetch_all',
+                          'fields=fields', 'stream=stream']
+            docs += [':param filter_dict: filters', ':param fetch_all: fetch the pages concurrently',
+                     ':param fields: fields projection', ':param stream: decode the pages while downloaded',
+                     ':return: generator of items']
+            return parameters, arguments, docs
+
+        if self.exists:
+            arguments.append('success_code={success_code}'.format(success_code=self.success_code))
+        else:
+            arguments += ['success_code={success_code}'.format(success_code=self.success_code),
+                          'error_codes=_error_codes']
+
+        if self.filters:
+            parameters.append('filter_dict=None')
+            arguments.append('filter_dict=filter_dict')
+            docs.append(':param filter_dict: filters')
+        if self.fields:
+            parameters.append('fields=None')
+            arguments.append('fields=fields')
+            docs.append(':param fields: fields projection')
+
+        if self.data == 'data':
+            parameters.append('data')
+            arguments.append('data=data')
+            docs.append(':param data: body')
+        elif self.data == 'data=None':
+            parameters.append('data=None')
+            arguments.append('data=data or dict()')
+            docs.append(':param data: body')
+        elif self.data is not None:
+            parameters += list(self.data)
+            names = [parameter.split('=', 1)[0] for parameter in self.data]
+            arguments.append('data=dict({fields})'.format(fields=', '.join(
+                '{name}={name}'.format(name=name) for name in names
+            )))
+            docs += [':param {name}'.format(name=name) for name in names]
+
+        docs.append(':return: StatusResult with STATUS_RESULTS, else response' if self.exists else ':return: response')
+        return parameters, arguments, docs
+
+    def compile(self):
+        """
+        :return: function calling the endpoint, to be set on the client class
+        """
+        parameters, arguments, docs = self.signature()
+        source = 'def {name}({parameters}):\n    return self.{helper}({arguments})\n'.format(
+            name=self.name,
+            parameters=', '.join(['self'] + parameters),
+            helper=self.helper,
+            arguments=', '.join(arguments),
+        )
+        namespace = {'__name__': __name__, '_uri': self.uri_format, '_error_codes': self.error_codes}
+        exec(source, namespace)
+        method = namespace[self.name]
+        method.__doc__ = '\n'.join([self.doc] + docs)
+        method.endpoint = self
+        return method
+
+
+def define_endpoints(endpoints):
+    """
+    Class decorator setting a method for every endpoint, the methods defined in the class body are kept.
+    """
+    def decorator(cls):
+        for endpoint in endpoints:
+            if endpoint.name not in cls.__dict__:
+                setattr(cls, endpoint.name, endpoint.compile())
+        return cls
+    return decorator
+
+
+ENDPOINTS = (
+    # ---===   INFORMATION   ===--- #
+    Endpoint('read_user', 'get', '/me', fields=True, doc='Get a user.'),
+    Endpoint('update_user', 'patch', '/me', data='data=None', doc='Edit a single user.'),
+
+    # ---===   ALBUMS   ===--- #
+    Endpoint('read_albums', 'get', '/me/albums', error_codes=(400, ), filters=True, fields=True,
+             doc="Get a list of a user's Albums."),
+    Endpoint('iter_albums', 'get', '/me/albums', error_codes=(400, ), paginated=True,
+             doc="Iterate over a user's Albums."),
+    Endpoint('create_album', 'post', '/me/albums', success_code=201, error_codes=(400, 401, 403),
+             data=('name', 'description', 'privacy=None', 'password=None', 'sort=None'),
+             doc='Create an Album. sort is one of arranged, newest, oldest, plays, comments, likes, added_first, '
+                 'added_last, alphabetical.'),
+    Endpoint('read_album', 'get', '/me/albums/{album_id}', error_codes=(404, ), fields=True,
+             doc='Get info on an Album.'),
+    Endpoint('update_album', 'patch', '/me/albums/{album_id}', error_codes=(400, 403), data='data',
+             doc='Edit an Album.'),
+    Endpoint('delete_album', 'delete', '/me/albums/{album_id}', success_code=204, error_codes=(403, 404),
+             doc='Delete an Album.'),
+    Endpoint('read_album_videos', 'get', '/me/albums/{album_id}/videos', error_codes=(404, ), filters=True,
+             fields=True, doc='Get the list of videos in an Album.'),
+    Endpoint('iter_album_videos', 'get', '/me/albums/{album_id}/videos', error_codes=(404, ), paginated=True,
+             doc='Iterate over the videos in an Album.'),
+    Endpoint('read_video_from_album', 'get', '/me/albums/{album_id}/videos/{video_id}', exists=True, fields=True,
+             doc='Check if an Album contains a video.'),
+    Endpoint('add_video_to_album', 'put', '/me/albums/{album_id}/videos/{video_id}', success_code=204,
+             error_codes=(403, 404), doc='Add a video to an Album.'),
+    Endpoint('remove_video_from_album', 'delete', '/me/albums/{album_id}/videos/{video_id}', success_code=204,
+             error_codes=(403, 404), doc='Remove a video from an Album.'),
+
+    # ---===   APPEARANCES   ===--- #
+    Endpoint('read_appearance_videos', 'get', '/me/appearances', filters=True, fields=True,
+             doc='Get all videos that a user appears in.'),
+    Endpoint('iter_appearance_videos', 'get', '/me/appearances', paginated=True,
+             doc='Iterate over all videos that a user appears in.'),
+
+    # ---===   CHANNELS   ===--- #
+    Endpoint('read_channels', 'get', '/me/channels', error_codes=(304, ), filters=True, fields=True,
+             doc='Get a list of the Channels a user follows.'),
+    Endpoint('iter_channels', 'get', '/me/channels', error_codes=(304, ), paginated=True,
+             doc='Iterate over the Channels a user follows.'),
+    Endpoint('create_channel', 'post', '/me/channels', data='data', doc='Create a Channel.'),
+    Endpoint('read_channel', 'get', '/me/channels/{channel_id}', success_code=204, exists=True,
+             doc='Check if a user follows a Channel.'),
+    Endpoint('subscribe_channel', 'put', '/me/channels/{channel_id}', success_code=204,
+             doc='Subscribe to a Channel.'),
+    Endpoint('unsubscribe_channel', 'delete', '/me/channels/{channel_id}', success_code=204, error_codes=(403, ),
+             doc='Unsubscribe from a Channel.'),
+
+    # ---===   CATEGORIES   ===--- #
+    Endpoint('read_categories', 'get', '/me/categories', error_codes=(403, ), filters=True, fields=True,
+             doc='Get a list of the Categories a user follows.'),
+    Endpoint('iter_categories', 'get', '/me/categories', error_codes=(403, ), paginated=True,
+             doc='Iterate over the Categories a user follows.'),
+    Endpoint('read_category', 'get', '/me/categories/{category_id}', success_code=204,
+             doc='Check if a user follows a Category.'),
+    Endpoint('subscribe_category', 'put', '/me/categories/{category_id}', success_code=204,
+             doc='Subscribe to a Category.'),
+    Endpoint('unsubscribe_category', 'delete', '/me/categories/{category_id}', success_code=204,
+             doc='Unsubscribe from a Category.'),
+
+    # ---===   GROUPS   ===--- #
+    Endpoint('read_groups', 'get', '/me/groups', filters=True, fields=True,
+             doc='Get a list of the Groups a user has joined.'),
+    Endpoint('iter_groups', 'get', '/me/groups', paginated=True, doc='Iterate over the Groups a user has joined.'),
+    Endpoint('read_group', 'get', '/me/groups/{group_id}', success_code=204, exists=True,
+             doc='Check if a user has joined a Group.'),
+    Endpoint('join_group', 'put', '/me/groups/{group_id}', success_code=204, error_codes=(403, ),
+             doc='Join a Group.'),
+    Endpoint('leave_group', 'delete', '/me/groups/{group_id}', success_code=204, error_codes=(403, ),
+             doc='Leave a Group.'),
+
+    # ---===   FEED   ===--- #
+    Endpoint('read_feed_videos', 'get', '/me/feed', filters=True, fields=True,
+             doc='Get a list of the videos in your feed.'),
+    Endpoint('iter_feed_videos', 'get', '/me/feed', paginated=True, doc='Iterate over the videos in your feed.'),
+
+    # ---===   FOLLOWERS   ===--- #
+    Endpoint('read_followers', 'get', '/me/followers', filters=True, fields=True,
+             doc="Get a list of the user's followers."),
+    Endpoint('iter_followers', 'get', '/me/followers', paginated=True, doc="Iterate over the user's followers."),
+
+    # ---===   FOLLOWING   ===--- #
+    Endpoint('read_following_users', 'get', '/me/following', filters=True, fields=True,
+             doc='Get a list of the users that a user is following.'),
+    Endpoint('iter_following_users', 'get', '/me/following', paginated=True,
+             doc='Iterate over the users that a user is following.'),
+    Endpoint('read_follow_user', 'get', '/me/following/{follow_user_id}', success_code=204, exists=True,
+             doc='Check if a user follows another user.'),
+    Endpoint('follow_user', 'put', '/me/following/{follow_user_id}', success_code=204, error_codes=(404, ),
+             doc='Follow a user.'),
+    Endpoint('unfollow_user', 'delete', '/me/following/{follow_user_id}', success_code=204,
+             doc='Unfollow a user.'),
+
+    # ---===   LIKES   ===--- #
+    Endpoint('read_liked_videos', 'get', '/me/likes', filters=True, fields=True,
+             doc='Get a list of videos that a user likes.'),
+    Endpoint('iter_liked_videos', 'get', '/me/likes', paginated=True,
+             doc='Iterate over the videos that a user likes.'),
+    Endpoint('read_liked_video', 'get', '/me/likes/{video_id}', success_code=204, exists=True,
+             doc='Check if a user likes a video.'),
+    Endpoint('like_video', 'put', '/me/likes/{video_id}', success_code=204, error_codes=(400, 403),
+             doc='Like a video.'),
+    Endpoint('unlike_video', 'delete', '/me/likes/{video_id}', success_code=204, error_codes=(400, 403),
+             doc='Unlike a video.'),
+
+    # ---===   PICTURES   ===--- #
+    Endpoint('read_pictures', 'get', '/me/pictures', fields=True,
+             doc="Get a list of this user's portrait images."),
+    Endpoint('iter_pictures', 'get', '/me/pictures', paginated=True,
+             doc="Iterate over this user's portrait images."),
+    Endpoint('create_pictures', 'post', '/me/pictures', success_code=201, data='data',
+             doc='Create a new picture resource.'),
+    Endpoint('read_portrait', 'get', '/me/pictures/{portraitset_id}', fields=True,
+             doc='Check if a user has a portrait.'),
+    Endpoint('remove_portrait', 'delete', '/me/pictures/{portraitset_id}', success_code=204,
+             doc='Remove a portrait from your portrait list.'),
+
+    # ---===   PORTFOLIOS   ===--- #
+    Endpoint('read_portfolios', 'get', '/me/portfolios', filters=True, fields=True,
+             doc='Get a list of Portfolios created by a user.'),
+    Endpoint('iter_portfolios', 'get', '/me/portfolios', paginated=True,
+             doc='Iterate over the Portfolios created by a user.'),
+    Endpoint('read_portfolio', 'get', '/me/portfolios/{portfolio_id}', fields=True, doc='Get a Portfolio.'),
+    Endpoint('read_portfolio_videos', 'get', '/me/portfolios/{portfolio_id}/videos', filters=True, fields=True,
+             doc='Get the videos in this Portfolio.'),
+    Endpoint('iter_portfolio_videos', 'get', '/me/portfolios/{portfolio_id}/videos', paginated=True,
+             doc='Iterate over the videos in this Portfolio.'),
+    Endpoint('read_video_from_portfolio', 'get', '/me/portfolios/{portfolio_id}/videos/{video_id}',
+             success_code=204, exists=True, doc='Check if a Portfolio contains a video.'),
+    Endpoint('add_video_to_portfolio', 'put', '/me/portfolios/{portfolio_id}/videos/{video_id}', success_code=204,
+             error_codes=(404, ), doc='Add a video to the Portfolio.'),
+    Endpoint('remove_video_from_portfolio', 'delete', '/me/portfolios/{portfolio_id}/videos/{video_id}',
+             success_code=204, error_codes=(404, ), doc='Remove a video from the Portfolio.'),
+
+    # ---===   WATCHED VIDEO   ===--- #
+    Endpoint('get_watched_videos', 'get', '/me/watched/videos', fields=True,
+             doc='View all videos you have watched.'),
+    Endpoint('iter_watched_videos', 'get', '/me/watched/videos', paginated=True,
+             doc='Iterate over all videos you have watched.'),
+    Endpoint('clear_all_watch_history', 'delete', '/me/watched/videos', doc='Clear your entire watch history.'),
+    Endpoint('remove_video_from_watch_history', 'delete', '/me/watched/videos/{video_id}', success_code=204,
+             doc='Remove a video from your watch history.'),
+
+    # ---===   PRESETS   ===--- #
+    Endpoint('get_presets', 'get', '/me/presets', filters=True, fields=True,
+             doc='Get all presets created by the authenticated user.'),
+    Endpoint('iter_presets', 'get', '/me/presets', paginated=True,
+             doc='Iterate over all presets created by the authenticated user.'),
+    Endpoint('get_preset', 'get', '/me/presets/{preset_id}', fields=True, doc='Get a preset.'),
+    Endpoint('update_preset', 'patch', '/me/presets/{preset_id}', error_codes=(400, 404), data='data',
+             doc='Edit a preset.'),
+    Endpoint('get_preset_videos', 'get', '/me/presets/{preset_id}/videos', fields=True,
+             doc='Get videos that have the provided preset.'),
+    Endpoint('iter_preset_videos', 'get', '/me/presets/{preset_id}/videos', paginated=True,
+             doc='Iterate over the videos that have the provided preset.'),
+
+    # ---===   VIDEOS   ===--- #
+    Endpoint('get_videos', 'get', '/me/videos', filters=True, fields=True,
+             doc='Get a list of videos uploaded by a user.'),
+    Endpoint('iter_videos', 'get', '/me/videos', paginated=True, doc='Iterate over the videos uploaded by a user.'),
+    Endpoint('get_video', 'get', '/me/videos/{video_id}', error_codes=(404, ), fields=True, doc='Get a video.'),
+
+    # ---===   WATCH LATER   ===--- #
+    Endpoint('read_watchlaters', 'get', '/me/watchlater', filters=True, fields=True,
+             doc="Get the authenticated user's Watch Later queue."),
+    Endpoint('iter_watchlaters', 'get', '/me/watchlater', paginated=True,
+             doc="Iterate over the authenticated user's Watch Later queue."),
+    Endpoint('read_watchlater', 'get', '/me/watchlater/{video_id}', success_code=204, exists=True,
+             doc="Check if a video is in the authenticated user's Watch Later queue."),
+    Endpoint('add_watchlater', 'put', '/me/watchlater/{video_id}', success_code=204,
+             doc="Add a video to the authenticated user's watch later list."),
+    Endpoint('remove_watchlater', 'delete', '/me/watchlater/{video_id}', success_code=204,
+             doc='Remove a video from your watch later list.'),
+
+    # ---===   ON DEMAND   ===--- #
+    Endpoint('read_ondemand_pages', 'get', '/me/ondemand/pages', error_codes=(404, ), filters=True, fields=True,
+             doc="Get a user's On Demand pages."),
+    Endpoint('iter_ondemand_pages', 'get', '/me/ondemand/pages', error_codes=(404, ), paginated=True,
+             doc="Iterate over a user's On Demand pages."),
+    Endpoint('add_ondemand_pages', 'post', '/me/ondemand/pages', data='data', doc='Create an On Demand page.'),
+
+    # ---===   ON DEMAND PURCHASES   ===--- #
+    Endpoint('read_ondemand_purchases', 'get', '/me/ondemand/purchases', error_codes=(400, 403), filters=True,
+             fields=True, doc="Get a user's On Demand purchases and rentals."),
+    Endpoint('iter_ondemand_purchases', 'get', '/me/ondemand/purchases', error_codes=(400, 403), paginated=True,
+             doc="Iterate over a user's On Demand purchases and rentals."),
+    Endpoint('read_ondemand_purchase', 'get', '/me/ondemand/purchases/{ondemand_id}', error_codes=(403, 404),
+             fields=True, doc='Check if an On Demand page is in your purchases.'),
+)
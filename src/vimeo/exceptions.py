@@ -9,6 +9,8 @@ Exception
             +-- HTTPError403Exception
             +-- HTTPError404Exception
             +-- UnexpectedHTTPErrorException
+        +-- UploadException
+        +-- DownloadException
         +-- HTTPMethodNotConfiguredException
         +-- HTTPMethodNotImplementedException
  """
@@ -16,6 +18,19 @@ Exception
 from vimeo.logger import LoggerSingleton
 
 
+class _ErrorText(object):
+    """
+    error_text of an exception, built only when the log record is emitted
+    """
+    __slots__ = ('exception', )
+
+    def __init__(self, exception):
+        self.exception = exception
+
+    def __str__(self):
+        return str(self.exception.error_text)
+
+
 # GENERIC EXCEPTION
 class VimeoException(Exception):
     error_text = None
@@ -23,7 +38,7 @@ class VimeoException(Exception):
     def __init__(self, write_log=True):
         self.logger = LoggerSingleton()
         if write_log:
-            self.write_log(self.error_text)
+            self.write_log(_ErrorText(self))
 
     def __str__(self):
         return repr(self.error_text)
@@ -32,7 +47,7 @@ class VimeoException(Exception):
         return repr(self.error_text)
 
     def write_log(self, msg):
-        self.logger.error(msg)
+        self.logger.error('%s', msg)
 
 
 # CLIENT GENERIC
@@ -123,15 +138,38 @@ class HTTPErrorException(ClientException):
     To raise:
         raise self.HTTPErrorException()
     """
+    _error_text = None
+
     def __init__(self, response):
         self.response = response
-        self.error_text = 'HTTP ERROR: {status_code} - DESCRIPTION: {error_msg} - URI: {url}'.format(
-            status_code=self.response.status_code,
-            error_msg=self.response.json()['error'],
-            url=self.response.url
-        )
         super(HTTPErrorException, self).__init__()
 
+    @property
+    def status_code(self):
+        return self.response.status_code
+
+    @property
+    def error_msg(self):
+        """
+        error of the json body, the body itself if it has none
+        """
+        try:
+            body = self.response.json()
+        except ValueError:
+            return self.response.text
+        return body['error'] if isinstance(body, dict) and 'error' in body else self.response.text
+
+    @property
+    def error_text(self):
+        # the body is decoded only if the message is needed
+        if self._error_text is None:
+            self._error_text = 'HTTP ERROR: {status_code} - DESCRIPTION: {error_msg} - URI: {url}'.format(
+                status_code=self.response.status_code,
+                error_msg=self.error_msg,
+                url=self.response.url
+            )
+        return self._error_text
+
 
 class HTTPError400Exception(HTTPErrorException):
     """
@@ -188,3 +226,57 @@ class UnexpectedHTTPErrorException(HTTPErrorException):
     """
     pass
 
+
+# status code -> exception raised by check_response for an expected error code
+HTTP_ERROR_EXCEPTIONS = {
+    400: HTTPError400Exception,
+    403: HTTPError403Exception,
+    404: HTTPError404Exception,
+}
+
+
+# CLIENT UPLOAD
+class UploadException(ClientException):
+    """
+    To import:
+        from vimeo import exceptions
+
+    To declare in a class add a class attribute:
+        UploadException = exceptions.UploadException
+
+    To raise:
+        raise self.UploadException()
+    """
+
+    def __init__(self, upload_link, status_code):
+        self.upload_link = upload_link
+        self.status_code = status_code
+        self.error_text = 'UPLOAD ERROR: {status_code} - UPLOAD LINK: {upload_link}'.format(
+            status_code=status_code,
+            upload_link=upload_link,
+        )
+        super(UploadException, self).__init__()
+
+
+# CLIENT DOWNLOAD
+class DownloadException(ClientException):
+    """
+    To import:
+        from vimeo import exceptions
+
+    To declare in a class add a class attribute:
+        DownloadException = exceptions.DownloadException
+
+    To raise:
+        raise self.DownloadException()
+    """
+
+    def __init__(self, url, status_code=None, error_text=None):
+        self.url = url
+        self.status_code = status_code
+        self.error_text = 'DOWNLOAD ERROR: {reason} - URL: {url}'.format(
+            reason=error_text or status_code or 'incomplete body',
+            url=url,
+        )
+        super(DownloadException, self).__init__()
+
@@ -1,6 +1,20 @@
 # coding: utf-8
 
+import atexit
 import logging
+import threading
+import time
+
+try:
+    from logging.handlers import QueueHandler
+    from logging.handlers import QueueListener
+except ImportError:  # python 2
+    QueueHandler = QueueListener = None
+
+try:
+    from queue import Queue
+except ImportError:  # python 2
+    from Queue import Queue
 
 
 class Logger(object):
@@ -10,8 +24,8 @@ class Logger(object):
 
     _logger = None
 
-    def __new__(cls, logger=None):
-        logger_manager = LoggerManager(logger)
+    def __new__(cls, logger=None, **kwargs):
+        logger_manager = LoggerManager(logger, **kwargs)
         cls._logger = logger_manager.logger
         return cls._logger
 
@@ -33,23 +47,105 @@ class LoggerSingleton(object):
             return cls._logger
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most rate records per second, bursts up to burst, of every call site logging at level or above.
+    The count of the dropped records is appended to the next record let through.
+    """
+
+    def __init__(self, rate=1.0, burst=10, level=logging.ERROR, clock=time.time):
+        logging.Filter.__init__(self)
+        self.rate = rate
+        self.burst = burst
+        self.level = level
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.buckets = dict()
+
+    def filter(self, record):
+        if record.levelno < self.level:
+            return True
+        key = (record.pathname, record.lineno)
+        with self.lock:
+            now = self.clock()
+            tokens, updated, suppressed = self.buckets.get(key, (self.burst, now, 0))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self.buckets[key] = (tokens, now, suppressed + 1)
+                return False
+            self.buckets[key] = (tokens - 1, now, 0)
+        if suppressed:
+            record.msg = '{msg} [{suppressed} similar records suppressed]'.format(msg=record.msg, suppressed=suppressed)
+        return True
+
+
+if QueueHandler is not None:
+    class DeferredQueueHandler(QueueHandler):
+        """
+        QueueHandler leaving message formatting to the listener thread: the caller only enqueues the record.
+        """
+
+        def prepare(self, record):
+            return record
+
+
 class LoggerManager(object):
     logger = None
 
-    def __init__(self, logger=None, enabled=False, level=logging.INFO):
+    # background thread of the queued default logger
+    _listener = None
+    _lock = threading.Lock()
+
+    def __init__(self, logger=None, enabled=False, level=logging.INFO, queued=False, error_rate=1.0, error_burst=10):
         # build logger
         if logger:
             self.logger = logger
         else:
-            self.set_default_logger(enabled=enabled, level=level)
+            self.set_default_logger(
+                enabled=enabled, level=level, queued=queued, error_rate=error_rate, error_burst=error_burst,
+            )
 
-    def set_default_logger(self, enabled=False, level=logging.INFO):
-            logger = logging.getLogger('default_logger')
-            logger.setLevel(level)
-            console_handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s [%(levelname)s]: %(message)s')
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+    def set_default_logger(self, enabled=False, level=logging.INFO, queued=False, error_rate=1.0, error_burst=10):
+        """
+        :param queued: hand the records to a background thread writing them, callers never wait for stderr
+        :param error_rate: errors per second let through by call site, 0 disables the limit
+        :param error_burst: errors let through at once by call site
+        """
+        logger = logging.getLogger('default_logger')
+        logger.setLevel(level)
+        console_handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s [%(levelname)s]: %(message)s')
+        console_handler.setFormatter(formatter)
 
-            self.logger = logger
-            self.logger.disabled = not enabled
+        with LoggerManager._lock:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+            for log_filter in list(logger.filters):
+                logger.removeFilter(log_filter)
+            if LoggerManager._listener is not None:
+                LoggerManager._listener.stop()
+                LoggerManager._listener = None
+
+            if queued and QueueHandler is not None:
+                records = Queue()
+                LoggerManager._listener = QueueListener(records, console_handler)
+                LoggerManager._listener.start()
+                logger.addHandler(DeferredQueueHandler(records))
+            else:
+                logger.addHandler(console_handler)
+            if error_rate:
+                logger.addFilter(RateLimitFilter(rate=error_rate, burst=error_burst))
+
+        self.logger = logger
+        self.logger.disabled = not enabled
+
+
+@atexit.register
+def _stop_listener():
+    """
+    Write the queued records before the interpreter exits.
+    """
+    with LoggerManager._lock:
+        if LoggerManager._listener is not None:
+            LoggerManager._listener.stop()
+            LoggerManager._listener = None
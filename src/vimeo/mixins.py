@@ -1,16 +1,51 @@
 # coding: utf-8
 
-import urllib
-
+from collections import deque
+from fnmatch import fnmatchcase
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from itertools import islice
+
+from vimeo import downloads
 from vimeo import exceptions
+from vimeo.endpoints import ENDPOINTS
+from vimeo.endpoints import define_endpoints
+from vimeo import models
+from vimeo import tracing
+from vimeo import uploads
+from vimeo.components import StatusResult
+from vimeo.components import run_bulk_job
+from vimeo.utils import JSONListDecoder
+
+try:
+    from urllib import quote_plus
+except ImportError:  # python 3
+    from urllib.parse import quote_plus
+
+
+def _quote(value):
+    # ints, the common filter values (page, per_page), need no quoting
+    return str(value) if type(value) is int else quote_plus(str(value))
 
 
 def _get_querystring(filter_dict):
-    query_pairs = [(str(k), str(v)) for k, v in filter_dict.iteritems()]
-    return urllib.urlencode(query_pairs)
+    return '&'.join([_quote(k) + '=' + _quote(v) for k, v in filter_dict.items()])
 
 
+def _get_fields(fields):
+    if isinstance(fields, (list, tuple, set, frozenset)):
+        return ','.join(fields)
+    return fields
+
+
+@define_endpoints(ENDPOINTS)
 class VimeoClientMethodMixin(object):
+    """
+    HTTP METHODS helpers and the API endpoints: the methods of vimeo.endpoints.ENDPOINTS are generated when the class
+    is created, the endpoints needing more than a call of a helper are defined below.
+    """
+
     def check_response(self, response, success_code, error_codes):
 
         if response.status_code == success_code:
@@ -20,529 +55,271 @@ class VimeoClientMethodMixin(object):
 
         if response.status_code in error_codes:
             # HTTP KNOWN ERROR CODE
-            exception_name = 'HTTPError{error_code}Exception'.format(error_code=response.status_code)
-            raise getattr(exceptions, exception_name)(response=response)
+            exception_class = exceptions.HTTP_ERROR_EXCEPTIONS.get(
+                response.status_code, exceptions.UnexpectedHTTPErrorException,
+            )
+            raise exception_class(response=response)
         else:
             # HTTP UNKNOWN ERROR CODE
             raise exceptions.UnexpectedHTTPErrorException(response=response)
 
-    # ---===   HTTP METHODS   ===--- #
-    def get_method(self, uri, filter_dict=None, success_code=200, error_codes=list()):
-        uri_to_call = '{}?{}'.format(uri, _get_querystring(filter_dict or dict())) if filter_dict else uri
-        self.logger.debug('GET: {uri_to_call}'.format(uri_to_call=uri_to_call))
-        response = self.get(uri_to_call)
-        return self.check_response(response, success_code, error_codes)
-
-    def post_method(self, uri, data, success_code=200, error_codes=list()):
-        self.logger.debug('POST: {uri}'.format(uri=uri))
-        response = self.post(uri, data=data)
-        return self.check_response(response, success_code, error_codes)
-
-    def patch_method(self, uri, data, success_code=200, error_codes=list()):
-        self.logger.debug('PATCH: {uri}'.format(uri=uri))
-        response = self.patch(uri, data=data)
-        return self.check_response(response, success_code, error_codes)
-
-    def put_method(self, uri, success_code=200, error_codes=list()):
-        self.logger.debug('PUT: {uri}'.format(uri=uri))
-        response = self.put(uri)
-        return self.check_response(response, success_code, error_codes)
-
-    def delete_method(self, uri, success_code=200, error_codes=list()):
-        self.logger.debug('DELETE: {uri}'.format(uri=uri))
-        response = self.delete(uri)
-        return self.check_response(response, success_code, error_codes)
-
-    # ---===   INFORMATION   ===--- #
-    def read_user(self):
-        """
-        Get a user.
-        :return: response
-        """
-        uri = '/me'
-        return self.get_method(uri)
-
-    def update_user(self, data=None):
-        """
-        Edit a single user.
-        :return: response
-        """
-        uri = '/me'
-        return self.patch_method(uri, data=data or dict())
-
-    # ---===   ALBUMS   ===--- #
-    def read_albums(self, filter_dict=None):
-        """
-        Get a list of a user's Albums.
-        :return: response
-        """
-        uri = '/me/albums'
-        return self.get_method(uri, filter_dict=filter_dict or dict(), error_codes=[400])
-
-    def create_album(self, name, description, privacy=None, password=None, sort=None):
-        """
-        Create an Album.
-        :param name: The Album title
-        :param description: The Album description
-        :param privacy: The Album's privacy level (anybody, password)
-        :param password: Required if privacy=password. The Album's password
-        :param sort: The default sort order of an Album's videos (arranged, newest, oldest, plays, comments, likes,
-            added_first, added_last, alphabetical)
-        :return: response
-        """
-        uri = "/me/albums"
-        data = dict(name=name, description=description, privacy=privacy, password=password, sort=sort)
-        return self.post_method(uri, data=data, success_code=201, error_codes=[400, 401, 403])
-
-    def read_album(self, album_id):
-        """
-        Get info on an Album.
-        :param album_id
-        :return: response
-        """
-        uri = "/me/albums/{album_id}".format(album_id=album_id)
-        return self.get_method(uri, error_codes=[404])
-
-    def update_album(self, album_id, data):
-        """
-        Get info on an Album.
-        :param album_id
-        :param data
-        :return: response
-        """
-        uri = "/me/albums/{album_id}".format(album_id=album_id)
-        return self.patch_method(uri, data, error_codes=[400, 403])
-
-    def delete_album(self, album_id):
-        """
-        Delete an Album.
-        :param album_id
-        :return: response
-        """
-        uri = "/me/albums/{album_id}".format(album_id=album_id)
-        return self.delete_method(uri, success_code=204, error_codes=[403, 404])
-
-    def read_album_videos(self, album_id, filter_dict=None):
-        """
-        Get the list of videos in an Album.
-        :param filter_dict: filters
-        :param album_id
-        :return: response
-        """
-        uri = "/me/albums/{album_id}/videos".format(album_id=album_id)
-        return self.get_method(uri, error_codes=[404], filter_dict=filter_dict or dict())
-
-    def read_video_from_album(self, album_id, video_id):
-        """
-        Check if an Album contains a video.
-        :param album_id
-        :param video_id
-        :return: response
-        """
-        uri = "/me/albums/{album_id}/videos/{video_id}". format(
-            album_id=album_id, video_id=video_id
-        )
-        return self.get_method(uri, error_codes=[404])
-
-    def add_video_to_album(self, album_id, video_id):
-        """
-        Add a video to an Album.
-        :param album_id
-        :param video_id
-        :return: response
-        """
-        uri = "/me/albums/{album_id}/videos/{video_id}".format(album_id=album_id, video_id=video_id)
-        return self.put_method(uri, success_code=204, error_codes=[403, 404])
-
-    def remove_video_from_album(self, album_id, video_id):
-        """
-        Remove a video from an Album.
-        :param album_id
-        :param video_id
-        :return: response
-        """
-        uri = "/me/albums/{album_id}/videos/{video_id}".format(album_id=album_id, video_id=video_id)
-        return self.delete_method(uri, success_code=204, error_codes=[403, 404])
-
-    # ---===   APPEARANCES   ===--- #
-    def read_appearance_videos(self, filter_dict=None):
-        """
-        Get all videos that a user appears in.
-        :return: response
-        """
-        uri = "/me/appearances"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    # ---===   CHANNELS   ===--- #
-    def read_channels(self, filter_dict=None):
-        """
-        return a list of the Channels a user follows.
-        :return: response
-        """
-        uri = "/me/channels"
-        return self.get_method(uri, error_codes=[304], filter_dict=filter_dict or dict())
-
-    def create_channel(self):
-        """
-        create channel
-        :return: response
-        """
-        uri = "/me/channels"
-        return self.post_method(uri)
-
-    def read_channel(self, channel_id):
+    def status_result(self, response, success_code, trace=None):
         """
-        Check if a user follows a Channel.
-        :param channel_id
-        :return: response
+        StatusResult of an existence check, 404 means the resource does not exist.
+        :return: StatusResult
         """
-        uri = "/me/channels/{channel_id}".format(channel_id=channel_id)
-        return self.get_method(uri, success_code=204, error_codes=[404])
+        with tracing.span(trace, 'check_response'):
+            if response.status_code == success_code or response.status_code == 404:
+                return StatusResult(response.status_code, response.status_code == success_code)
+            return self.check_response(response, success_code, [404])
 
-    def subscribe_channel(self, channel_id):
+    def default_fields(self, uri):
         """
-        Subscribe to a Channel.
-        :param channel_id
-        :return: response
+        Fields projection of DEFAULT_FIELDS whose pattern matches uri, the longest pattern wins.
+        :return: fields or None
         """
-        uri = "/me/channels/{channel_id}".format(channel_id=channel_id)
-        return self.put_method(uri, success_code=204)
+        path = uri.split('?', 1)[0]
+        patterns = [pattern for pattern in self.configuration_dict['DEFAULT_FIELDS'] if fnmatchcase(path, pattern)]
+        return self.configuration_dict['DEFAULT_FIELDS'][max(patterns, key=len)] if patterns else None
 
-    def unsubscribe_channel(self, channel_id):
+    def get_uri_to_call(self, uri, filter_dict=None, fields=None):
         """
-        Unsubscribe from a Channel.
-        :param channel_id
-        :return: response
+        Append to uri the filters and the fields projection: fields, filter_dict['fields'] or the default fields
+        of the endpoint, in this order. Fields are a comma separated string or a list.
+        :return: uri with querystring
         """
-        uri = "/me/channels/{channel_id}".format(channel_id=channel_id)
-        return self.delete_method(uri, success_code=204, error_codes=[403])
+        filter_dict = dict(filter_dict or dict())
+        fields = fields or filter_dict.get('fields')
+        if not fields and 'fields=' not in uri:
+            fields = self.default_fields(uri)
+        if fields:
+            filter_dict['fields'] = _get_fields(fields)
+        if not filter_dict:
+            return uri
+        return '{}{}{}'.format(uri, '&' if '?' in uri else '?', _get_querystring(filter_dict))
 
-    def read_categories(self, filter_dict=None):
+    def build_model(self, item):
         """
-        Get a list of the Categories a user follows.
-        :return: response
-        """
-        uri = "/me/categories"
-        return self.get_method(uri, error_codes=[403], filter_dict=filter_dict or dict())
-
-    def read_category(self, category_id):
-        """
-        Check if a user follows a Category.
-        :param category_id
-        :return: response
-        """
-        uri = "/me/categories/{category_id}".format(category_id=category_id)
-        return self.get_method(uri, success_code=204)
-
-    def subscribe_category(self, category_id):
-        """
-        Subscribe to a Category.
-        :param category_id
-        :return: response
-        """
-        uri = "/me/categories/{category_id}".format(category_id=category_id)
-        return self.put_method(uri, success_code=204)
-
-    def unsubscribe_category(self, category_id):
-        """
-        Unsubscribe from a Category.
-        :param category_id
-        :return: response
-        """
-        uri = "/me/categories/{category_id}".format(category_id=category_id)
-        return self.delete_method(uri, success_code=204)
-
-    # ---===   GROUPS   ===--- #
-    def read_groups(self, filter_dict=None):
-        """
-        Get a list of the Groups a user has joined.
-        :return: response
-        """
-        uri = "/me/groups"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    def read_group(self, group_id):
-        """
-        Check if a user has joined a Group
-        :return: response
-        """
-        uri = "/me/groups/{group_id}".format(group_id=group_id)
-        return self.get_method(uri, success_code=204, error_codes=[404])
-
-    def join_group(self, group_id):
-        """
-        Join a Group.
-        :param group_id
-        :return: response
-        """
-        uri = "/me/groups/{group_id}".format(group_id=group_id)
-        return self.put_method(uri, success_code=204, error_codes=[403])
-
-    def leave_group(self, group_id):
-        """
-        Leave a Group.
-        :param group_id
-        :return: response
-        """
-        uri = "/me/groups/{group_id}".format(group_id=group_id)
-        return self.delete_method(uri, success_code=204, error_codes=[403])
-
-    # ---===   FEED   ===--- #
-    def read_feed_videos(self, filter_dict=None):
-        """
-        Get a list of the videos in your feed.
-        :return: response
-        """
-        uri = "/me/feed"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    # ---===   FOLLOWERS   ===--- #
-    def read_followers(self, filter_dict=None):
-        """
-        Get a list of the user's followers.
-        :return: response
-        """
-        uri = "/me/followers"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    # ---===   FOLLOWING   ===--- #
-    def read_following_users(self, filter_dict=None):
-        """
-        Get a list of the users that a user is following.
-        :return: response
-        """
-        uri = "/me/following"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    def read_follow_user(self, follow_user_id):
-        """
-        Check if a user follows another user.
-        :return: response
+        :return: model of item if MODELS is enabled, else item
         """
-        uri = "/me/following/{follow_user_id}".format(follow_user_id=follow_user_id)
-        return self.get_method(uri, success_code=204, error_codes=[404])
+        return models.build(item) if self.configuration_dict['MODELS'] else item
 
-    def follow_user(self, follow_user_id):
-        """
-        Follow a user.
-        :param follow_user_id
-        :return: response
-        """
-        uri = "/me/following/{follow_user_id}".format(follow_user_id=follow_user_id)
-        return self.put_method(uri, success_code=204, error_codes=[404])
-
-    def unfollow_user(self, follow_user_id):
-        """
-        Unfollow a user.
-        :param follow_user_id
-        :return: response
-        """
-        uri = "/me/following/{follow_user_id}".format(follow_user_id=follow_user_id)
-        return self.delete_method(uri, success_code=204)
-
-    # ---===   LIKES   ===--- #
-    def read_liked_videos(self, filter_dict=None):
-        """
-        Get a list of videos that a user likes.
-        :return: response
-        """
-        uri = "/me/likes"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    def read_liked_video(self, video_id):
-        """
-        Check if a user likes a video.
-        :return: response
-        """
-        uri = "/me/likes/{video_id}".format(video_id=video_id)
-        return self.get_method(uri, success_code=204, error_codes=[404])
-
-    def like_video(self, video_id):
-        """
-        Like a video.
-        :param video_id
-        :return: response
-        """
-        uri = "/me/likes/{video_id}".format(video_id=video_id)
-        return self.put_method(uri, success_code=204, error_codes=[400, 403])
-
-    def unlike_video(self, video_id):
-        """
-        Unlike a video.
-        :param video_id
-        :return: response
-        """
-        uri = "/me/likes/{video_id}".format(video_id=video_id)
-        return self.delete_method(uri, success_code=204, error_codes=[400, 403])
-
-    # ---===   PICTURES   ===--- #
-    def read_pictures(self):
-        """
-        Get a list of this user's portrait images.
-        :return: response
-        """
-        uri = "/me/pictures"
-        return self.get_method(uri)
-
-    def create_pictures(self, data):
-        """
-        Create a new picture resource.
-        :return: response
-        """
-        uri = "/me/pictures"
-        return self.post_method(uri, data, success_code=201)
-
-    def read_portrait(self, portraitset_id):
-        """
-        Check if a user has a portrait.
-        :param portraitset_id
-        :return: response
-        """
-        uri = "/me/pictures/{portraitset_id}".format(portraitset_id=portraitset_id)
-        return self.get_method(uri)
-
-    def remove_portrait(self, portraitset_id):
-        """
-        Remove a portrait from your portrait list.
-        :param portraitset_id
-        :return: response
-        """
-        uri = "/me/pictures/{portraitset_id}".format(portraitset_id=portraitset_id)
-        return self.get_method(uri, success_code=204)
-
-    # ---===   PORTFOLIOS   ===--- #
-    def read_portfolios(self, filter_dict=None):
-        """
-        Get a list of Portfolios created by a user.
-        :return: response
-        """
-        uri = "me/portfolios"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    def read_portfolio(self, portfolio_id):
-        """
-        Get a Portfolio.
-        :param portfolio_id
-        :return: response
-        """
-        uri = "/me/portfolios/{portfolio_id}".format(portfolio_id=portfolio_id)
-        return self.get_method(uri)
-
-    def read_portfolio_videos(self, portfolio_id, filter_dict=None):
-        """
-        Get the videos in this Portfolio.
-        :return:
-        """
-        uri = "/me/portfolios/{portfolio_id}/videos".format(portfolio_id=portfolio_id)
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    def read_video_from_portfolio(self, portfolio_id, video_id):
-        """
-        Check if a Portfolio contains a video.
-        :param portfolio_id
-        :param video_id
-        :return: RESPONSE
-        """
-        uri = "/me/portfolios/{portfolio_id}/videos/{video_id}".format(
-            portfolio_id=portfolio_id, video_id=video_id
-        )
-        return self.get_method(uri, success_code=204, error_codes=[404])
-
-    def add_video_to_portfolio(self, portfolio_id, video_id):
-        """
-        Add a video to the Portfolio.
-        :param portfolio_id
-        :param video_id
-        :return: RESPONSE
-        """
-        uri = "/me/portfolios/{portfolio_id}/videos/{video_id}".format(
-            portfolio_id=portfolio_id, video_id=video_id
-        )
-        return self.put_method(uri, success_code=204, error_codes=[404])
-
-    def remove_video_from_portfolio(self, portfolio_id, video_id):
-        """
-        Remove a video from the Portfolio.
-        :param portfolio_id
-        :param video_id
-        :return: RESPONSE
-        """
-        uri = "/me/portfolios/{portfolio_id}/videos/{video_id}".format(
-            portfolio_id=portfolio_id, video_id=video_id
-        )
-        return self.delete_method(uri, success_code=204, error_codes=[404])
-
-    # ---===   WATCHED VIDEO   ===--- #
-    def get_watched_videos(self):
-        """
-        View all videos you have watched
-        :return: response
-        """
-        uri = "/me/watched/videos"
-        return self.get_method(uri)
-
-    def clear_all_watch_history(self):
-        """
-        Clear your entire watch history.
-        :return: response
-        """
-        uri = "/me/watched/videos"
-        return self.delete_method(uri)
+    # ---===   HTTP METHODS   ===--- #
+    def get_method(self, uri, filter_dict=None, success_code=200, error_codes=list(), fields=None):
+        uri_to_call = self.get_uri_to_call(uri, filter_dict=filter_dict, fields=fields)
+        with self.trace('get', uri_to_call) as trace:
+            response = self.response_cache.get(uri_to_call)
+            if response is not None and response.status_code == success_code:
+                self.logger.debug('GET (cached): %s', uri_to_call)
+                return response
+            if self.singleflight is None:
+                response = self.revalidate(uri_to_call)
+            else:
+                response = self.singleflight.do(uri_to_call, self.revalidate, uri_to_call)
+            with tracing.span(trace, 'check_response'):
+                response = self.check_response(response, success_code, error_codes)
+            self.response_cache.set(uri_to_call, response)
+            return response
 
-    def remove_video_from_watch_history(self, video_id):
+    def revalidate(self, uri_to_call):
         """
-        Remove a video from your watch history
+        GET of uri_to_call, conditional when a response with validators was kept for it.
         :return: response
         """
-        uri = "/me/watched/videos/{video_id}".format(video_id=video_id)
-        return self.delete_method(uri, success_code=204)
+        self.logger.debug('GET: %s', uri_to_call)
+        cached_response = self.validator_cache.get(uri_to_call)
+        response = self.get(uri_to_call, headers=self.validator_cache.conditional_headers(cached_response))
+        return self.validator_cache.update(uri_to_call, response, cached_response)
 
-    # ---===   PRESETS   ===--- #
-    def get_presets(self, filter_dict=None):
-        """
-        Get all presets created by the authenticated user.
-        :return: response
-        """
-        uri = "/me/presets"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
+    def post_method(self, uri, data, success_code=200, error_codes=list()):
+        with self.trace('post', uri) as trace:
+            self.logger.debug('POST: %s', uri)
+            response = self.post(uri, data=data)
+            self.response_cache.invalidate(uri)
+            with tracing.span(trace, 'check_response'):
+                return self.check_response(response, success_code, error_codes)
 
-    def get_preset(self, preset_id):
-        """
-        Get a preset.
-        :param preset_id
-        :return: response
-        """
-        uri = "/me/presets/{preset_id}".format(preset_id=preset_id)
-        return self.get_method(uri)
+    def patch_method(self, uri, data, success_code=200, error_codes=list()):
+        with self.trace('patch', uri) as trace:
+            self.logger.debug('PATCH: %s', uri)
+            response = self.patch(uri, data=data)
+            self.response_cache.invalidate(uri)
+            with tracing.span(trace, 'check_response'):
+                return self.check_response(response, success_code, error_codes)
 
-    def update_preset(self, preset_id, data):
-        """
-        Edit a preset.
-        :param preset_id
-        :param data
-        :return: response
-        """
-        uri = "/me/presets/{preset_id}".format(preset_id=preset_id)
-        return self.patch_method(uri, data, error_codes=[400, 404])
+    def put_method(self, uri, success_code=200, error_codes=list()):
+        with self.trace('put', uri) as trace:
+            self.logger.debug('PUT: %s', uri)
+            response = self.put(uri)
+            self.response_cache.invalidate(uri)
+            with tracing.span(trace, 'check_response'):
+                return self.check_response(response, success_code, error_codes)
 
-    def get_preset_videos(self, preset_id):
-        """
-        Get videos that have the provided preset.
-        :param preset_id
-        :return: response
-        """
-        uri = "/me/presets/{preset_id}/videos".format(preset_id=preset_id)
-        return self.get_method(uri)
+    def delete_method(self, uri, success_code=200, error_codes=list()):
+        with self.trace('delete', uri) as trace:
+            self.logger.debug('DELETE: %s', uri)
+            response = self.delete(uri)
+            self.response_cache.invalidate(uri)
+            with tracing.span(trace, 'check_response'):
+                return self.check_response(response, success_code, error_codes)
+
+    def exists_method(self, uri, success_code=200, fields=None):
+        """
+        GET of an existence check. With STATUS_RESULTS a StatusResult is returned, no HTTPError404Exception
+        is raised when the resource does not exist.
+        :return: response or StatusResult
+        """
+        if not self.configuration_dict['STATUS_RESULTS']:
+            return self.get_method(uri, success_code=success_code, error_codes=[404], fields=fields)
+        uri_to_call = self.get_uri_to_call(uri, fields=fields)
+        with self.trace('get', uri_to_call) as trace:
+            self.logger.debug('GET (status): %s', uri_to_call)
+            return self.status_result(self.get(uri_to_call), success_code, trace)
+
+    def get_page(self, uri, filter_dict=None, error_codes=list()):
+        """
+        Get a page of a list endpoint. With SINGLEFLIGHT concurrent calls for the same page share the decoded json.
+        :return: decoded json
+        """
+        if self.singleflight is not None:
+            key = ('page', self.get_uri_to_call(uri, filter_dict=filter_dict), tuple(error_codes))
+            return self.singleflight.do(key, self.decode_page, uri, filter_dict, error_codes)
+        return self.decode_page(uri, filter_dict, error_codes)
+
+    def decode_page(self, uri, filter_dict, error_codes):
+        with self.trace('get', uri) as trace:
+            response = self.get_method(uri, filter_dict=filter_dict, error_codes=error_codes)
+            with tracing.span(trace, 'decode'):
+                return response.json()
+
+    def iter_method(self, uri, filter_dict=None, error_codes=list(), fetch_all=False, fields=None, stream=False):
+        """
+        Yield the items of every page of a list endpoint following paging.next. The next page is fetched in
+        background while the current one is consumed, so at most two pages are held in memory.
+        With fetch_all the pages are fetched concurrently, see fetch_all_method.
+        With stream the pages are decoded while downloaded, see stream_method.
+        With MODELS enabled the items are models, see vimeo.models.
+        :return: generator of items
+        """
+        if fields:
+            filter_dict = dict(filter_dict or dict(), fields=_get_fields(fields))
+        if fetch_all or stream:
+            method = self.fetch_all_method if fetch_all else self.stream_method
+            for item in method(uri, filter_dict=filter_dict, error_codes=error_codes):
+                yield self.build_model(item)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            page = self.get_page(uri, filter_dict=filter_dict, error_codes=error_codes)
+            while page:
+                next_uri = (page.get('paging') or dict()).get('next')
+                next_page = executor.submit(self.get_page, next_uri, error_codes=error_codes) if next_uri else None
+                for item in page['data']:
+                    yield self.build_model(item)
+                page = next_page.result() if next_page else None
+        finally:
+            executor.shutdown(wait=False)
+
+    def stream_method(self, uri, filter_dict=None, error_codes=list(), chunk_size=65536):
+        """
+        Yield the items of every page of a list endpoint following paging.next, decoding the data array while it
+        is read from the socket: only the item being parsed is held in memory, the first item is yielded
+        before the page is downloaded. Responses are not cached.
+        :return: generator of items
+        """
+        uri_to_call = self.get_uri_to_call(uri, filter_dict=filter_dict)
+        while uri_to_call:
+            self.logger.debug('GET (stream): %s', uri_to_call)
+            response = self.check_response(self.get(uri_to_call, stream=True), 200, error_codes)
+            decoder = JSONListDecoder('data')
+            try:
+                for chunk in response.iter_content(chunk_size):
+                    for item in decoder.feed(chunk):
+                        yield item
+                for item in decoder.feed(b'', eof=True):
+                    yield item
+            finally:
+                response.close()
+            next_uri = (decoder.document.get('paging') or dict()).get('next')
+            uri_to_call = self.get_uri_to_call(next_uri) if next_uri else None
+
+    def fetch_all_method(self, uri, filter_dict=None, error_codes=list(), max_workers=None):
+        """
+        Yield the items of every page of a list endpoint, in order. The first page gives total and per_page, the
+        remaining pages are fetched concurrently by at most max_workers threads (FETCH_ALL_WORKERS by default).
+        At most 2 * max_workers pages are requested ahead of the consumer.
+        :return: generator of items
+        """
+        max_workers = max_workers or self.configuration_dict['FETCH_ALL_WORKERS']
+        filter_dict = dict(filter_dict or dict())
+        page = self.get_page(uri, filter_dict=filter_dict, error_codes=error_codes)
+        for item in page['data']:
+            yield item
+
+        per_page = int(page['per_page'])
+        last_page = (int(page['total']) + per_page - 1) // per_page
+        numbers = iter(range(int(page['page']) + 1, last_page + 1))
+        filter_dict['per_page'] = per_page
+
+        def submit(number):
+            return executor.submit(self.get_page, uri, filter_dict=dict(filter_dict, page=number), error_codes=error_codes)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        window = deque()
+        try:
+            window.extend(submit(number) for number in islice(numbers, 2 * max_workers))
+            while window:
+                page = window.popleft().result()
+                window.extend(submit(number) for number in islice(numbers, 1))
+                for item in page['data']:
+                    yield item
+        finally:
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def bulk_method(self, method, jobs, max_workers=None, retries=None):
+        """
+        Call method once per job, concurrently. Jobs are read lazily and at most max_workers calls
+        (BULK_WORKERS by default) are in flight. A failed job does not abort the others: transient errors are
+        retried up to retries times (BULK_RETRIES by default) for idempotent endpoints, the others are recorded
+        in the report.
+        Example:
+        report = client.bulk_method(client.add_video_to_album, [(album_id, video_id), ...])
+
+        :param method: client method, e.g. add_video_to_album
+        :param jobs: iterable of arguments, a tuple for more than one
+        :return: list of BulkResult, in job order
+        """
+        max_workers = max_workers or self.configuration_dict['BULK_WORKERS']
+        retries = self.configuration_dict['BULK_RETRIES'] if retries is None else retries
+        endpoint = getattr(method, 'endpoint', None)
+        if endpoint is not None and not endpoint.idempotent:
+            # a repeated create could apply twice
+            retries = 0
+        report = []
+        pending = set()
+
+        def collect(futures):
+            for future in futures:
+                result = future.result()
+                report[result.index] = result
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for index, job in enumerate(jobs):
+                report.append(None)
+                pending.add(executor.submit(run_bulk_job, index, method, job, retries))
+                if len(pending) >= max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(wait(pending)[0])
+        finally:
+            executor.shutdown(wait=False)
+        return report
 
     # ---===   VIDEOS   ===--- #
-    def get_videos(self, filter_dict=None):
-        """
-        Get a list of videos uploaded by a user.
-        :return: response
-        """
-        uri = "/me/videos"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
     def post_video(self, redirect_url, upload_url):
         """
         Begin the video upload process.
@@ -554,79 +331,57 @@ class VimeoClientMethodMixin(object):
         data = dict(type='POST', redirect_url=redirect_url, upload_url=upload_url)
         return self.post_method(uri, data=data, success_code=201, error_codes=[403])
 
-    def get_video(self, video_id):
-        """
-        return video
-        :param video_id:
-        :return: response
-        """
-        uri = "/me/videos/{video_id}".format(video_id=video_id)
-
-        return self.get_method(uri, error_codes=[404])
-
-    # ---===   WATCH LATER   ===--- #
-    def read_watchlaters(self, filter_dict=None):
-        """
-        Get the authenticated user's Watch Later queue.
-        :return: response
-        """
-        uri = "/me/watchlater"
-        return self.get_method(uri, filter_dict=filter_dict or dict())
-
-    def read_watchlater(self, video_id):
-        """
-        Check if a video is in the authenticated user's Watch Later queue.
-        :return: response
-        """
-        uri = "/me/watchlater/{video_id}".format(video_id=video_id)
-        return self.get_method(uri, success_code=204, error_codes=[404])
-
-    def add_watchlater(self, video_id):
-        """
-        Add a video to the authenticated user's watch later list.
-        :return: response
-        """
-        uri = "/me/watchlater/{video_id}".format(video_id=video_id)
-        return self.put_method(uri, success_code=204)
-
-    def remove_watchlater(self, video_id):
+    def create_video_upload(self, size, data=None):
         """
-        Remove a video from your watch later list.
+        Create a video with a tus resumable upload, the bytes are sent to upload.upload_link of the response.
+        :param size: size of the file in bytes
+        :param data: video metadata (name, description, privacy, ...)
         :return: response
         """
-        uri = "/me/watchlater/{video_id}".format(video_id=video_id)
-        return self.delete_method(uri, success_code=204)
-
-    # ---===   ON DEMAND   ===--- #
-    def read_ondemand_pages(self, filter_dict):
-        """
-        Get a user's On Demand pages
-        :return: response
-        """
-        uri = "/me/ondemand/pages"
-        return self.get_method(uri, filter_dict=filter_dict or dict(), error_codes=[404])
+        uri = "/me/videos"
+        data = dict(data or dict(), upload=dict(approach='tus', size=size))
+        return self.post_method(uri, data=data, success_code=200, error_codes=[403])
 
-    def add_ondemand_pages(self, data):
+    def upload_video(self, file_or_path, data=None, chunk_size=None, progress=None):
         """
-        Create an On Demand page.
-        :return: response
+        Create a video and upload the file in resumable chunks, see vimeo.uploads.TusUpload.
+        :param file_or_path: path or binary file object of the video
+        :param data: video metadata (name, description, privacy, ...)
+        :param chunk_size: bytes sent by a PATCH, UPLOAD_CHUNK_SIZE by default
+        :param progress: callable receiving (offset, size) at every acknowledged offset
+        :return: response of create_video_upload, its upload.upload_link resumes an interrupted upload
         """
-        uri = "/me/ondemand/pages"
-        return self.post_method(uri, data=data)
+        response = self.create_video_upload(uploads.file_size(file_or_path), data=data)
+        upload = uploads.TusUpload(
+            self, response.json()['upload']['upload_link'], file_or_path, chunk_size=chunk_size, progress=progress,
+        )
+        upload.upload()
+        return response
 
-    # ---===   ON DEMAND PURCHASES   ===--- #
-    def read_ondemand_purchases(self, filter_dict):
+    def download_video(self, video_id, path, quality='source', progress=None):
         """
-        Get a users On Demand purchases and rentals.
-        :return: response
+        Download a file of the video with parallel Range requests, see vimeo.downloads.RangedDownload.
+        :param video_id:
+        :param path: destination path, an interrupted download of the same path is resumed
+        :param quality: quality of the download section entry (source, hd, sd, ...)
+        :param progress: callable receiving (received, size) after every written block
+        :return: response of get_video with the download section
         """
-        uri = '/me/ondemand/purchases'
-        return self.get_method(uri, filter_dict=filter_dict or dict(), error_codes=[400, 403])
+        response = self.get_video(video_id, fields='download')
+        return self.download_file(response, path, quality=quality, progress=progress)
 
-    def read_ondemand_purchase(self, ondemand_id):
+    def download_file(self, response, path, quality='source', progress=None):
         """
-        Check if an On Demand page is in your purchases.
+        Download a file of the download section of a get_video response.
         :return: response
         """
-        uri = '/me/ondemand/purchases{ondemand_id}'.format(ondemand_id=ondemand_id)
-        return self.get_method(uri, error_codes=[403, 404])
+        files = [item for item in response.json().get('download') or list() if item.get('quality') == quality]
+        if not files:
+            raise exceptions.ClientException(error_text='No {quality} download in {url}'.format(
+                quality=quality, url=response.url,
+            ))
+        download = downloads.RangedDownload(
+            self, files[0]['link'], path, size=files[0].get('size'), md5=files[0].get('md5'), progress=progress,
+        )
+        download.download()
+        return response
@@ -0,0 +1,150 @@
+# coding: utf-8
+"""
+Compact resource models: the fields used often are kept in __slots__, the large nested sections (pictures, embed,
+metadata, ...) and any other key are kept as compact json and decoded only when accessed.
+
+    video = build(response.json())
+    video.name  # slot
+    video.pictures  # decoded on first access
+    video.to_dict()  # the original dict
+"""
+
+import json
+
+
+class _Encoded(str):
+    """
+    Json of a section not decoded yet.
+    """
+    __slots__ = ()
+
+
+def _encode(value):
+    if isinstance(value, (dict, list)):
+        return _Encoded(json.dumps(value, separators=(',', ':')))
+    return value
+
+
+def _decode(value):
+    if isinstance(value, _Encoded):
+        return json.loads(value)
+    return value
+
+
+class Resource(object):
+    """
+    Base model, subclasses list fields (slots) and lazy_fields (decoded on access).
+    """
+    __slots__ = ('_extra', )
+
+    fields = ()
+    lazy_fields = ()
+
+    def __init__(self, data):
+        data = dict(data)
+        for name in self.fields:
+            setattr(self, name, data.pop(name, None))
+        for name in self.lazy_fields:
+            setattr(self, '_' + name, _encode(data.pop(name, None)))
+        self._extra = _encode(data) if data else None
+
+    def __getattr__(self, name):
+        """
+        Called for lazy fields and keys not in fields.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in self.lazy_fields:
+            value = _decode(getattr(self, '_' + name))
+            setattr(self, '_' + name, value)
+            return value
+        self._extra = _decode(self._extra)
+        if self._extra and name in self._extra:
+            return self._extra[name]
+        raise AttributeError(name)
+
+    def __repr__(self):
+        return '<{name} {uri}>'.format(name=self.__class__.__name__, uri=getattr(self, 'uri', None))
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def to_dict(self):
+        data = dict(_decode(self._extra) or dict())
+        for name in self.fields:
+            data[name] = getattr(self, name)
+        for name in self.lazy_fields:
+            data[name] = _decode(getattr(self, '_' + name))
+        return data
+
+
+class Video(Resource):
+    fields = ('uri', 'name', 'description', 'link', 'duration', 'width', 'height', 'language', 'created_time',
+              'modified_time', 'release_time', 'status', 'resource_key', 'license')
+    lazy_fields = ('pictures', 'embed', 'metadata', 'user', 'privacy', 'stats', 'tags', 'files', 'download',
+                   'app', 'review_link', 'content_rating', 'categories')
+    __slots__ = fields + tuple('_' + name for name in lazy_fields)
+
+
+class Album(Resource):
+    fields = ('uri', 'name', 'description', 'link', 'duration', 'created_time', 'modified_time', 'resource_key')
+    lazy_fields = ('pictures', 'embed', 'metadata', 'user', 'privacy')
+    __slots__ = fields + tuple('_' + name for name in lazy_fields)
+
+
+class User(Resource):
+    fields = ('uri', 'name', 'link', 'location', 'bio', 'created_time', 'account', 'resource_key')
+    lazy_fields = ('pictures', 'websites', 'metadata', 'preferences', 'content_filter')
+    __slots__ = fields + tuple('_' + name for name in lazy_fields)
+
+
+class Channel(Resource):
+    fields = ('uri', 'name', 'description', 'link', 'created_time', 'modified_time', 'resource_key')
+    lazy_fields = ('pictures', 'header', 'metadata', 'user', 'privacy')
+    __slots__ = fields + tuple('_' + name for name in lazy_fields)
+
+
+class Group(Resource):
+    fields = ('uri', 'name', 'description', 'link', 'created_time', 'modified_time', 'resource_key')
+    lazy_fields = ('pictures', 'header', 'metadata', 'user', 'privacy')
+    __slots__ = fields + tuple('_' + name for name in lazy_fields)
+
+
+class Portfolio(Resource):
+    fields = ('uri', 'name', 'description', 'link', 'created_time', 'modified_time', 'sort')
+    lazy_fields = ('metadata', )
+    __slots__ = fields + tuple('_' + name for name in lazy_fields)
+
+
+class Preset(Resource):
+    fields = ('uri', 'name')
+    lazy_fields = ('settings', 'metadata', 'user')
+    __slots__ = fields + tuple('_' + name for name in lazy_fields)
+
+
+# model by the collection in the resource uri, e.g. /users/1/albums/2 is an Album
+MODELS = {
+    'videos': Video,
+    'albums': Album,
+    'users': User,
+    'channels': Channel,
+    'groups': Group,
+    'portfolios': Portfolio,
+    'presets': Preset,
+}
+
+
+def build(data):
+    """
+    Build the model of a resource dict, by its uri.
+    :return: model, or data if the resource has no model
+    """
+    uri = data.get('uri') if isinstance(data, dict) else None
+    segments = uri.rstrip('/').split('/') if uri else ()
+    model = MODELS.get(segments[-2]) if len(segments) >= 2 else None
+    return model(data) if model else data
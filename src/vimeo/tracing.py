@@ -0,0 +1,267 @@
+# coding: utf-8
+"""
+Sampled tracing of the client calls.
+
+A sampled call (one of the HTTP METHODS helpers of VimeoClientMethodMixin) is a Trace of timed spans:
+ - request: an attempt of the HTTP call, retries are separate spans
+ - pool_wait: wait for a connection of the pool
+ - connect: TCP (and TLS) connection, only for new connections
+ - ttfb: from the start of the attempt to the response headers, pool_wait and connect included
+ - download: response body
+ - decode: json decoding of list pages
+ - check_response: status check and exception
+
+Hooks are objects with a before(trace) and/or an after(trace) method, called when a sampled call starts and ends:
+
+    vimeo_client = VimeoClient(token='YOUR_APP_TOKEN', configuration_dict={
+        'TRACE_SAMPLE_RATE': 0.01,
+        'TRACE_HOOKS': [TraceCollector()],
+    })
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from itertools import count
+
+from urllib3.connection import HTTPConnection
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.connectionpool import HTTPSConnectionPool
+
+_local = threading.local()
+_trace_ids = count(1)
+
+
+def current_trace():
+    """
+    :return: Trace of the call running in this thread, None if it is not sampled
+    """
+    return getattr(_local, 'trace', None)
+
+
+class Span(object):
+    __slots__ = ('name', 'start', 'duration', 'attributes')
+
+    def __init__(self, name, start, duration, attributes):
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.attributes = attributes
+
+    def __repr__(self):
+        return 'Span(name={name}, duration={duration:.6f})'.format(name=self.name, duration=self.duration)
+
+    def to_dict(self):
+        return dict(name=self.name, start=self.start, duration=self.duration, **self.attributes)
+
+
+class Trace(object):
+    """
+    Spans of a sampled call
+    """
+    __slots__ = ('trace_id', 'endpoint', 'start', 'duration', 'spans', 'status_code', 'error', 'clock')
+
+    def __init__(self, endpoint, clock=time.time):
+        self.trace_id = next(_trace_ids)
+        self.endpoint = endpoint
+        self.clock = clock
+        self.start = clock()
+        self.duration = None
+        self.spans = []
+        self.status_code = None
+        self.error = None
+
+    def __repr__(self):
+        return 'Trace(endpoint={endpoint!r}, spans={spans!r})'.format(endpoint=self.endpoint, spans=self.spans)
+
+    def add_span(self, name, start, end, **attributes):
+        self.spans.append(Span(name, start, end - start, attributes))
+
+    @contextmanager
+    def span(self, name, **attributes):
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, self.clock(), **attributes)
+
+    def to_dict(self):
+        return dict(
+            trace_id=self.trace_id,
+            endpoint=self.endpoint,
+            start=self.start,
+            duration=self.duration,
+            status_code=self.status_code,
+            error=repr(self.error) if self.error is not None else None,
+            spans=[span.to_dict() for span in self.spans],
+        )
+
+
+class _NullContext(object):
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_null_context = _NullContext()
+
+
+def span(trace, name, **attributes):
+    """
+    trace.span(name), or a shared no-op context manager when the call is not sampled.
+    """
+    return _null_context if trace is None else trace.span(name, **attributes)
+
+
+class Tracer(object):
+    """
+    Sample calls with probability sample_rate and pass their traces to the hooks.
+    """
+
+    def __init__(self, sample_rate, hooks=(), logger=None, clock=time.time, sample=random.random):
+        self.sample_rate = sample_rate
+        self.hooks = list(hooks)
+        self.logger = logger
+        self.clock = clock
+        self.sample = sample
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def call_hooks(self, method_name, trace):
+        for hook in self.hooks:
+            method = getattr(hook, method_name, None)
+            if method is None:
+                continue
+            try:
+                method(trace)
+            except Exception as error:
+                # a broken hook must not break the calls
+                if self.logger is not None:
+                    self.logger.error('TRACE HOOK ERROR: %r', error)
+
+    def start(self, endpoint):
+        """
+        :return: Trace, None if the call is not sampled
+        """
+        if self.sample() >= self.sample_rate:
+            return None
+        trace = Trace(endpoint, clock=self.clock)
+        self.call_hooks('before', trace)
+        return trace
+
+    def finish(self, trace, response=None, error=None):
+        trace.duration = self.clock() - trace.start
+        trace.status_code = getattr(response, 'status_code', trace.status_code)
+        trace.error = error
+        self.call_hooks('after', trace)
+
+    @contextmanager
+    def trace(self, endpoint):
+        """
+        Trace of the call running in this thread, a new one when no call is running.
+        A nested call (get_page calling get_method) adds its spans to the running trace.
+        """
+        trace = current_trace()
+        if trace is not None:
+            yield trace
+            return
+
+        trace = self.start(endpoint)
+        if trace is None:
+            yield None
+            return
+        _local.trace = trace
+        try:
+            yield trace
+        except BaseException as error:
+            self.finish(trace, error=error)
+            raise
+        else:
+            self.finish(trace)
+        finally:
+            _local.trace = None
+
+    @contextmanager
+    def trace_task(self, endpoint):
+        """
+        Trace of a call not bound to the thread, for asyncio tasks: spans are added through the yielded trace.
+        """
+        trace = self.start(endpoint)
+        if trace is None:
+            yield None
+            return
+        try:
+            yield trace
+        except BaseException as error:
+            self.finish(trace, error=error)
+            raise
+        else:
+            self.finish(trace)
+
+
+class TraceCollector(object):
+    """
+    Hook keeping the last max_traces traces, slower than min_duration seconds.
+    """
+
+    def __init__(self, max_traces=1000, min_duration=0):
+        self.min_duration = min_duration
+        self.traces = deque(maxlen=max_traces)
+
+    def after(self, trace):
+        if trace.duration >= self.min_duration:
+            self.traces.append(trace)
+
+
+# ---===   CONNECTION POOL INSTRUMENTATION   ===--- #
+class _TracingConnectionMixin(object):
+
+    def connect(self):
+        trace = current_trace()
+        if trace is None:
+            return super(_TracingConnectionMixin, self).connect()
+        with trace.span('connect', host=self.host):
+            return super(_TracingConnectionMixin, self).connect()
+
+
+class TracingHTTPConnection(_TracingConnectionMixin, HTTPConnection):
+    pass
+
+
+class TracingHTTPSConnection(_TracingConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TracingPoolMixin(object):
+
+    def _get_conn(self, timeout=None):
+        trace = current_trace()
+        if trace is None:
+            return super(_TracingPoolMixin, self)._get_conn(timeout=timeout)
+        with trace.span('pool_wait', host=self.host):
+            return super(_TracingPoolMixin, self)._get_conn(timeout=timeout)
+
+
+class TracingHTTPConnectionPool(_TracingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = TracingHTTPConnection
+
+
+class TracingHTTPSConnectionPool(_TracingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = TracingHTTPSConnection
+
+
+def instrument_adapter(adapter):
+    """
+    Make the pools of a requests HTTPAdapter record pool_wait and connect spans.
+    """
+    adapter.poolmanager.pool_classes_by_scheme = {
+        'http': TracingHTTPConnectionPool,
+        'https': TracingHTTPSConnectionPool,
+    }
+    return adapter
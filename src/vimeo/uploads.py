@@ -0,0 +1,458 @@
+# coding: utf-8
+"""
+Resumable video uploads, tus protocol (https://tus.io/protocols/resumable-upload.html) as implemented by Vimeo.
+
+The upload is created by VimeoClient.create_video_upload, its upload_link receives the bytes:
+ - HEAD returns the Upload-Offset acknowledged by the server
+ - PATCH sends a chunk starting at Upload-Offset and returns the new offset
+
+After a failure the offset is read again with HEAD, so no acknowledged byte is sent twice. A TusUpload built on the
+upload_link of an interrupted upload resumes it, even from another process.
+
+UploadQueue runs many uploads in parallel under a global bandwidth cap, recording them in a journal file: a queue
+built on the journal of a crashed process resumes every unfinished upload.
+"""
+
+import io
+import json
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from vimeo import exceptions
+from vimeo.components import BandwidthLimiter
+from vimeo.utils import write_json_atomic
+
+TUS_VERSION = '1.0.0'
+
+
+def file_size(file_or_path):
+    """
+    :param file_or_path: path or binary file object
+    :return: size in bytes
+    """
+    if not hasattr(file_or_path, 'read'):
+        return os.path.getsize(file_or_path)
+    try:
+        return os.fstat(file_or_path.fileno()).st_size
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        position = file_or_path.tell()
+        file_or_path.seek(0, io.SEEK_END)
+        size = file_or_path.tell()
+        file_or_path.seek(position)
+        return size
+
+
+def _release(view):
+    """
+    memoryview.release is python >= 3.2, on python 2 the view is released when collected.
+    """
+    release = getattr(view, 'release', None)
+    if release:
+        release()
+
+
+class ChunkReader(object):
+    """
+    Chunks of a file as memoryviews, without whole-file copies:
+     - files with a descriptor are mapped in memory, a chunk is a view of the mapping
+     - other binary file objects are read with readinto into a single reused buffer
+
+    A chunk is valid until the next read, call close when done.
+    """
+
+    def __init__(self, file_or_path, chunk_size):
+        self.chunk_size = chunk_size
+        self.owned = not hasattr(file_or_path, 'read')
+        self.file = open(file_or_path, 'rb') if self.owned else file_or_path
+        self.mapping = None
+        self.view = None
+        try:
+            self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, TypeError, ValueError, OSError, io.UnsupportedOperation):
+            self.buffer = bytearray(chunk_size)
+            self.view = memoryview(self.buffer)
+        else:
+            try:
+                self.view = memoryview(self.mapping)
+            except TypeError:  # python 2 mmap has no buffer interface
+                self.mapping.close()
+                self.mapping = None
+                self.buffer = bytearray(chunk_size)
+                self.view = memoryview(self.buffer)
+
+    def read(self, offset):
+        """
+        :param offset: first byte of the chunk
+        :return: memoryview of at most chunk_size bytes, empty at the end of the file
+        """
+        if self.mapping is not None:
+            return self.view[offset:offset + self.chunk_size]
+        self.file.seek(offset)
+        length = self.file.readinto(self.buffer) or 0
+        return self.view[:length]
+
+    def close(self):
+        _release(self.view)
+        if self.mapping is not None:
+            self.mapping.close()
+        if self.owned:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ThrottledChunk(object):
+    """
+    File-like view of a chunk: the HTTP connection reads it in blocks, each one is paid to the bandwidth limiter
+    before being sent.
+    """
+
+    def __init__(self, chunk, limiter):
+        self.chunk = chunk
+        self.limiter = limiter
+        self.position = 0
+
+    def __len__(self):
+        return len(self.chunk)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = len(self.chunk) - self.position
+        block = self.chunk[self.position:self.position + size]
+        self.position += len(block)
+        if len(block):
+            self.limiter.acquire(len(block))
+        return block
+
+
+class TusUpload(object):
+    """
+    Send a file to a tus upload_link in chunks of chunk_size bytes:
+
+        upload = TusUpload(vimeo_client, upload_link, '/path/to/video.mp4')
+        upload.upload()
+
+    Connection errors, timeouts, 5xx and 409 (offset mismatch) are retried from the offset reported by the server,
+    with the backoff of the client retry policy. The count of consecutive failures is bounded by retries.
+    """
+
+    def __init__(self, client, upload_link, file_or_path, chunk_size=None, retries=None, progress=None, session=None,
+                 limiter=None):
+        """
+        :param client: VimeoClient, provides configuration, retry backoff and session
+        :param upload_link: upload.upload_link of the video
+        :param file_or_path: path or binary file object of the video
+        :param chunk_size: bytes sent by PATCH, UPLOAD_CHUNK_SIZE by default
+        :param retries: max consecutive failures, UPLOAD_RETRIES by default
+        :param progress: callable receiving (offset, size) at every acknowledged offset
+        :param session: requests.Session, the client session by default
+        :param limiter: BandwidthLimiter pacing the bytes sent
+        """
+        self.client = client
+        self.upload_link = upload_link
+        self.file_or_path = file_or_path
+        self.chunk_size = chunk_size or client.configuration_dict['UPLOAD_CHUNK_SIZE']
+        self.retries = client.configuration_dict['UPLOAD_RETRIES'] if retries is None else retries
+        self.progress = progress
+        self.session = session or client.session
+        self.limiter = limiter
+        self.size = file_size(file_or_path)
+        self.offset = None
+
+    def headers(self, **headers):
+        headers['Tus-Resumable'] = TUS_VERSION
+        headers['Accept'] = self.client.configuration_dict['ACCEPT_HEADER']
+        headers['User-Agent'] = self.client.configuration_dict['USER_AGENT']
+        return headers
+
+    def check_response(self, response, success_code):
+        if response.status_code != success_code:
+            raise exceptions.UploadException(self.upload_link, response.status_code)
+        return int(response.headers['Upload-Offset'])
+
+    def get_offset(self):
+        """
+        :return: offset acknowledged by the server
+        """
+        response = self.session.head(
+            self.upload_link, headers=self.headers(), timeout=self.client.configuration_dict['TIMEOUT'],
+        )
+        return self.check_response(response, 200)
+
+    def send_chunk(self, offset, chunk):
+        """
+        :param offset: offset of the first byte of chunk
+        :param chunk: bytes-like
+        :return: offset acknowledged by the server
+        """
+        headers = self.headers(**{
+            'Upload-Offset': str(offset),
+            'Content-Type': 'application/offset+octet-stream',
+        })
+        if self.limiter is not None:
+            chunk = ThrottledChunk(chunk, self.limiter)
+        response = self.session.patch(
+            self.upload_link, data=chunk, headers=headers, timeout=self.client.configuration_dict['TIMEOUT'],
+        )
+        return self.check_response(response, 204)
+
+    def is_transient(self, error):
+        if isinstance(error, exceptions.UploadException):
+            # 204 is a PATCH whose offset did not move, 409 an offset mismatch
+            return error.status_code in (204, 409) or error.status_code >= 500
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def upload(self):
+        """
+        Send the bytes after the offset acknowledged by the server, until the whole file is acknowledged.
+        Failures are counted until a PATCH moves the offset forward.
+        :return: size of the file
+        """
+        policy = self.client.retry_policy
+        failures = 0
+        self.offset = None
+        with ChunkReader(self.file_or_path, self.chunk_size) as reader:
+            while self.offset is None or self.offset < self.size:
+                try:
+                    if self.offset is None:
+                        self.offset = self.get_offset()
+                    else:
+                        chunk = reader.read(self.offset)
+                        try:
+                            offset = self.send_chunk(self.offset, chunk)
+                        finally:
+                            _release(chunk)
+                        if offset <= self.offset:
+                            raise exceptions.UploadException(self.upload_link, 204)
+                        self.offset = offset
+                        failures = 0
+                except Exception as error:
+                    failures += 1
+                    if failures > self.retries or not self.is_transient(error):
+                        raise
+                    self.client.logger.debug('PATCH (resume): %s', self.upload_link)
+                    self.offset = None
+                    policy.sleep(policy.jitter(0, min(policy.backoff_max, policy.backoff * 2 ** (failures - 1))))
+                    continue
+                if self.progress:
+                    self.progress(self.offset, self.size)
+        return self.size
+
+
+class UploadJournal(object):
+    """
+    Uploads of a queue by file path, persisted as json at every change. The file is replaced atomically, a crash
+    leaves either the previous or the new journal.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = dict()
+        if os.path.exists(path):
+            with open(path) as journal_file:
+                self.entries = json.load(journal_file)
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            return dict(entry) if entry else None
+
+    def update(self, key, **values):
+        with self.lock:
+            self.entries[key] = dict(self.entries.get(key, dict()), **values)
+            self.write()
+
+    def pending(self):
+        """
+        :return: paths of the unfinished uploads
+        """
+        with self.lock:
+            return [key for key, entry in self.entries.items() if entry.get('state') != UploadStatus.DONE]
+
+    def write(self):
+        write_json_atomic(self.path, self.entries)
+
+
+class UploadStatus(object):
+    """
+    Progress of a single upload of UploadQueue
+    """
+    PENDING = 'pending'
+    UPLOADING = 'uploading'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    __slots__ = ('path', 'uri', 'size', 'offset', 'state', 'sent', 'started', 'finished', 'exception', 'clock')
+
+    def __init__(self, path, size, clock=time.time):
+        self.path = path
+        self.uri = None
+        self.size = size
+        self.offset = 0
+        self.state = self.PENDING
+        self.sent = 0
+        self.started = None
+        self.finished = None
+        self.exception = None
+        self.clock = clock
+
+    def __repr__(self):
+        return 'UploadStatus(path={path!r}, state={state}, offset={offset}, size={size})'.format(
+            path=self.path, state=self.state, offset=self.offset, size=self.size,
+        )
+
+    @property
+    def throughput(self):
+        """
+        Bytes per second acknowledged by the server since the upload started in this process
+        """
+        if self.started is None:
+            return 0.0
+        elapsed = (self.finished or self.clock()) - self.started
+        return self.sent / elapsed if elapsed > 0 else 0.0
+
+
+class UploadQueue(object):
+    """
+    Upload many files in parallel, at most max_workers at a time and within bandwidth bytes per second overall:
+
+        with UploadQueue(vimeo_client, 'uploads.journal') as queue:
+            queue.resume()
+            for path in paths:
+                queue.submit(path, data={'name': os.path.basename(path)})
+            statuses = queue.join()
+
+    Every acknowledged offset is recorded in the journal, resume submits the unfinished uploads of a previous run
+    again: they continue on their upload_link from the offset acknowledged by the server.
+    """
+
+    def __init__(self, client, journal_path, max_workers=None, bandwidth=None, chunk_size=None, clock=time.time):
+        """
+        :param client: VimeoClient
+        :param journal_path: journal file, created if missing
+        :param max_workers: concurrent uploads, UPLOAD_WORKERS by default
+        :param bandwidth: bytes per second of all the uploads, UPLOAD_BANDWIDTH by default, 0 for no cap
+        :param chunk_size: bytes sent by a PATCH, UPLOAD_CHUNK_SIZE by default
+        """
+        self.client = client
+        self.journal = UploadJournal(journal_path)
+        self.chunk_size = chunk_size
+        self.clock = clock
+        bandwidth = client.configuration_dict['UPLOAD_BANDWIDTH'] if bandwidth is None else bandwidth
+        self.limiter = BandwidthLimiter(bandwidth, clock=clock) if bandwidth else None
+        self.executor = ThreadPoolExecutor(max_workers or client.configuration_dict['UPLOAD_WORKERS'])
+        self.lock = threading.Lock()
+        self.statuses = []
+        self.futures = []
+        self.started = clock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def submit(self, path, data=None, progress=None):
+        """
+        Queue the upload of a file, an unfinished upload of the journal is resumed, a finished one is not repeated.
+        :param path: path of the video
+        :param data: video metadata (name, description, privacy, ...)
+        :param progress: callable receiving the UploadStatus at every acknowledged offset
+        :return: UploadStatus
+        """
+        path = os.path.abspath(path)
+        status = UploadStatus(path, file_size(path), clock=self.clock)
+        with self.lock:
+            self.statuses.append(status)
+            self.futures.append(self.executor.submit(self.upload, status, data, progress))
+        return status
+
+    def resume(self, progress=None):
+        """
+        Queue the unfinished uploads of the journal.
+        :return: list of UploadStatus
+        """
+        return [self.submit(path, progress=progress) for path in self.journal.pending()]
+
+    def join(self):
+        """
+        Wait for the queued uploads.
+        :return: list of UploadStatus, in submission order
+        """
+        with self.lock:
+            futures = list(self.futures)
+        for future in futures:
+            future.exception()
+        with self.lock:
+            return list(self.statuses)
+
+    def upload(self, status, data, progress):
+        entry = self.journal.get(status.path)
+        if entry and entry['state'] == UploadStatus.DONE:
+            status.uri, status.offset, status.state = entry['uri'], entry['size'], UploadStatus.DONE
+            return status
+
+        status.state = UploadStatus.UPLOADING
+        status.started = self.clock()
+        try:
+            if not entry:
+                response = self.client.create_video_upload(status.size, data=data)
+                video = response.json()
+                entry = dict(uri=video['uri'], upload_link=video['upload']['upload_link'], size=status.size, offset=0)
+                self.journal.update(status.path, state=UploadStatus.UPLOADING, **entry)
+            status.uri = entry['uri']
+
+            acknowledged = []
+
+            def on_progress(offset, size):
+                if acknowledged and offset > acknowledged[0]:
+                    status.sent += offset - acknowledged[0]
+                acknowledged[:] = [offset]
+                status.offset = offset
+                self.journal.update(status.path, offset=offset)
+                if progress:
+                    progress(status)
+
+            upload = TusUpload(
+                self.client, entry['upload_link'], status.path, chunk_size=self.chunk_size, progress=on_progress,
+                limiter=self.limiter,
+            )
+            upload.upload()
+        except Exception as error:
+            status.state, status.exception = UploadStatus.FAILED, error
+            self.client.logger.error('UPLOAD FAILED: %s - %r', status.path, error)
+        else:
+            status.state = UploadStatus.DONE
+            self.journal.update(status.path, state=UploadStatus.DONE)
+        finally:
+            status.finished = self.clock()
+        return status
+
+    def metrics(self):
+        """
+        :return: dict with uploads by state, bytes acknowledged by the server in this process and their
+         throughput in bytes per second
+        """
+        with self.lock:
+            statuses = list(self.statuses)
+        elapsed = self.clock() - self.started
+        sent = sum(status.sent for status in statuses)
+        metrics = dict((state, 0) for state in (UploadStatus.PENDING, UploadStatus.UPLOADING, UploadStatus.DONE,
+                                                UploadStatus.FAILED))
+        for status in statuses:
+            metrics[status.state] += 1
+        metrics.update(uploads=len(statuses), bytes=sent, elapsed=elapsed, throughput=sent / elapsed if elapsed > 0 else 0.0)
+        return metrics
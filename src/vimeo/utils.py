@@ -1 +1,136 @@
-# coding: utf-8
+# coding: UTF-8
+
+import codecs
+import json
+import os
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_SEPARATOR = re.compile(r'[ \t\n\r,]*')
+
+
+class JSONListDecoder(object):
+    """
+    Incremental decoder of a JSON object fed chunk by chunk: the items of the array under key are returned as
+    soon as they are parsed, the other keys are collected in document. Only the item being parsed is buffered.
+
+        decoder = JSONListDecoder('data')
+        for chunk in response.iter_content(65536):
+            for item in decoder.feed(chunk):
+                ...
+        decoder.document  # {'total': 23, 'page': 1, 'paging': {...}}
+    """
+
+    def __init__(self, key='data'):
+        self.key = key
+        self.document = dict()
+        self.buffer = ''
+        self.position = 0
+        self.state = 'start'
+        self.current_key = None
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+
+    def _decode(self, eof):
+        """
+        Decode the value at position.
+        :return: (True, value) or (False, None) when more data is needed
+        """
+        try:
+            value, end = self.json_decoder.raw_decode(self.buffer, self.position)
+        except ValueError:
+            if eof:
+                raise
+            return False, None
+        # a number or a literal at the end of the buffer can continue in the next chunk
+        if end == len(self.buffer) and not eof and self.buffer[self.position] not in '{["':
+            return False, None
+        self.position = end
+        return True, value
+
+    def _skip(self, pattern):
+        self.position = pattern.match(self.buffer, self.position).end()
+        return self.buffer[self.position:self.position + 1]
+
+    def feed(self, chunk, eof=False):
+        """
+        :param chunk: bytes
+        :param eof: True with the last chunk
+        :return: list of the items completed by chunk
+        """
+        self.buffer = self.buffer[self.position:] + self.text_decoder.decode(chunk, final=eof)
+        self.position = 0
+        items = []
+        while True:
+            if self.state == 'start':
+                char = self._skip(_WHITESPACE)
+                if not char:
+                    break
+                if char != '{':
+                    raise ValueError('JSON object expected')
+                self.position += 1
+                self.state = 'key'
+            elif self.state == 'key':
+                char = self._skip(_SEPARATOR)
+                if char == '}':
+                    self.position += 1
+                    self.state = 'end'
+                    continue
+                if not char:
+                    break
+                done, self.current_key = self._decode(eof)
+                if not done:
+                    break
+                self.state = 'colon'
+            elif self.state == 'colon':
+                char = self._skip(_WHITESPACE)
+                if not char:
+                    break
+                if char != ':':
+                    raise ValueError('":" expected')
+                self.position += 1
+                self.state = 'array' if self.current_key == self.key else 'value'
+            elif self.state == 'array':
+                char = self._skip(_WHITESPACE)
+                if not char:
+                    break
+                if char == '[':
+                    self.position += 1
+                    self.state = 'items'
+                else:
+                    self.state = 'value'
+            elif self.state == 'value':
+                self._skip(_WHITESPACE)
+                done, value = self._decode(eof)
+                if not done:
+                    break
+                self.document[self.current_key] = value
+                self.state = 'key'
+            elif self.state == 'items':
+                char = self._skip(_SEPARATOR)
+                if char == ']':
+                    self.position += 1
+                    self.state = 'key'
+                    continue
+                if not char:
+                    break
+                done, item = self._decode(eof)
+                if not done:
+                    break
+                items.append(item)
+            else:
+                break
+        return items
+
+
+def write_json_atomic(path, data):
+    """
+    Dump data as json to path through a temporary file renamed over it: a crash leaves the previous or the new
+    content, never a truncated one.
+    """
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'w') as json_file:
+        json.dump(data, json_file)
+        json_file.flush()
+        os.fsync(json_file.fileno())
+    getattr(os, 'replace', os.rename)(temporary_path, path)
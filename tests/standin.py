@@ -0,0 +1,244 @@
+# coding: utf-8
+"""
+Local HTTP/1.1 stand-in for the Vimeo API used by tests and benchmarks.
+
+Routes are registered as (method, regex) pairs, the handler receives the request handler and returns
+(status_code, headers, body); a dict or list body is serialized as json.
+"""
+
+import json
+import re
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler
+    from http.server import HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:  # python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from BaseHTTPServer import HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.stand_in.lock:
+            self.server.stand_in.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _dispatch(self):
+        stand_in = self.server.stand_in
+        path = self.path.split('?', 1)[0]
+        with stand_in.lock:
+            stand_in.requests.append((self.command, self.path))
+        for method, pattern, handler in stand_in.routes:
+            match = pattern.match(path)
+            if method == self.command and match:
+                status_code, headers, body = handler(self, *match.groups())
+                break
+        else:
+            status_code, headers, body = 404, {}, {'error': 'not found'}
+
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode('utf-8')
+            headers.setdefault('Content-Type', 'application/json')
+        body = body or b''
+
+        self.send_response(status_code)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _dispatch
+
+
+class StandInServer(object):
+    """
+    Threaded local server, usable as a context manager:
+
+        with StandInServer() as server:
+            server.route('GET', '/me', lambda request: (200, {}, {'name': 'me'}))
+            client = VimeoClient(token='token', configuration_dict={'API_ROOT': server.url})
+    """
+
+    def __init__(self):
+        self.routes = []
+        self.requests = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0), _StandInRequestHandler)
+        self._server.stand_in = self
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{port}'.format(port=self._server.server_address[1])
+
+    def route(self, method, pattern, handler):
+        self.routes.append((method, re.compile(pattern + '$'), handler))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def paged_route(server, uri, items, per_page):
+    """
+    Serve items as a Vimeo list endpoint, with page/per_page querystring and paging links.
+    """
+    try:
+        from urllib.parse import parse_qs
+    except ImportError:  # python 2
+        from urlparse import parse_qs
+
+    def handler(request):
+        query = parse_qs(request.path.partition('?')[2])
+        page = int(query.get('page', ['1'])[0])
+        size = int(query.get('per_page', [per_page])[0])
+        last = max(1, (len(items) + size - 1) // size)
+        return 200, {}, {
+            'total': len(items),
+            'page': page,
+            'per_page': size,
+            'paging': {
+                'next': '{uri}?page={page}&per_page={size}'.format(uri=uri, page=page + 1, size=size) if page < last else None,
+                'previous': None,
+                'first': '{uri}?page=1&per_page={size}'.format(uri=uri, size=size),
+                'last': '{uri}?page={last}&per_page={size}'.format(uri=uri, last=last, size=size),
+            },
+            'data': items[(page - 1) * size:page * size],
+        }
+
+    server.route('GET', uri, handler)
+
+
+
+def _tus_upload_routes(server, upload_uri, received, failures):
+    def head(request):
+        return 200, {'Upload-Offset': str(len(received)), 'Tus-Resumable': '1.0.0'}, b''
+
+    def patch(request):
+        offset = int(request.headers['Upload-Offset'])
+        chunk = request.read_body()
+        if offset != len(received):
+            return 409, {}, b''
+        for failure in failures:
+            if failure[0] == offset:
+                failures.remove(failure)
+                received.extend(chunk[:len(chunk) // 2])
+                return failure[1], {}, b''
+        received.extend(chunk)
+        return 204, {'Upload-Offset': str(len(received)), 'Tus-Resumable': '1.0.0'}, b''
+
+    server.route('HEAD', upload_uri, head)
+    server.route('PATCH', upload_uri, patch)
+
+
+def _tus_video(server, video_id, data, upload_uri):
+    return {
+        'uri': '/videos/{video_id}'.format(video_id=video_id),
+        'name': data.get('name'),
+        'upload': dict(data['upload'], upload_link=server.url + upload_uri),
+    }
+
+
+def tus_route(server, video_id='1', failures=None):
+    """
+    Serve POST /me/videos with a tus upload_link receiving the bytes in a bytearray.
+    failures is a list of (offset, status_code): the first PATCH at offset keeps half of its chunk and answers
+    status_code, like a connection dropped by the upload server. Return the received bytearray.
+    """
+    received = bytearray()
+    upload_uri = '/upload/{video_id}'.format(video_id=video_id)
+
+    def create(request):
+        return 200, {}, _tus_video(server, video_id, json.loads(request.read_body().decode('utf-8')), upload_uri)
+
+    server.route('POST', '/me/videos', create)
+    _tus_upload_routes(server, upload_uri, received, list(failures or []))
+    return received
+
+
+def tus_uploads_route(server):
+    """
+    Serve POST /me/videos creating a new tus upload_link at every call.
+    Return the dict of the received bytearray by video name.
+    """
+    uploads = dict()
+    lock = threading.Lock()
+
+    def create(request):
+        data = json.loads(request.read_body().decode('utf-8'))
+        with lock:
+            video_id = str(len(uploads) + 1)
+            uploads[data.get('name')] = received = bytearray()
+        upload_uri = '/upload/{video_id}'.format(video_id=video_id)
+        _tus_upload_routes(server, upload_uri, received, [])
+        return 200, {}, _tus_video(server, video_id, data, upload_uri)
+
+    server.route('POST', '/me/videos', create)
+    return uploads
+
+
+def file_route(server, uri, content, ranges=True, failures=0):
+    """
+    Serve content at uri, with Range requests when ranges is true. The first failures GET are answered 503.
+    Return the list of the served ranges as (start, end).
+    """
+    served = []
+    state = dict(failures=failures)
+
+    def head(request):
+        headers = {'ETag': '"{length}"'.format(length=len(content))}
+        if ranges:
+            headers['Accept-Ranges'] = 'bytes'
+        return 200, headers, content
+
+    def get(request):
+        with server.lock:
+            state['failures'] -= 1
+            if state['failures'] >= 0:
+                return 503, {}, b''
+        byte_range = request.headers.get('Range')
+        if not ranges or not byte_range:
+            served.append((0, len(content) - 1))
+            return 200, {}, content
+        start, end = [int(value) for value in byte_range.split('=', 1)[1].split('-')]
+        served.append((start, end))
+        headers = {'Content-Range': 'bytes {start}-{end}/{length}'.format(start=start, end=end, length=len(content))}
+        return 206, headers, content[start:end + 1]
+
+    server.route('HEAD', uri, head)
+    server.route('GET', uri, get)
+    return served
@@ -0,0 +1,150 @@
+# coding: utf-8
+
+import asyncio
+import io
+
+import pytest
+from standin import StandInServer
+from standin import file_route
+from standin import paged_route
+from standin import tus_route
+
+from vimeo import exceptions
+from vimeo.tracing import TraceCollector
+
+pytest.importorskip('aiohttp')
+
+from vimeo.async_clients import AsyncVimeoClient  # noqa: E402
+
+
+def _albums(request):
+    return 200, {}, {'data': [{'uri': '/albums/1'}], 'query': request.path}
+
+
+def test_async_endpoints():
+    async def run(server):
+        async with AsyncVimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            response = await client.read_albums(filter_dict={'page': 2})
+            assert response.json() == {'data': [{'uri': '/albums/1'}], 'query': '/me/albums?page=2'}
+            with pytest.raises(exceptions.HTTPError404Exception):
+                await client.read_album(1)
+            with pytest.raises(exceptions.UnexpectedHTTPErrorException):
+                await client.read_user()
+
+    with StandInServer() as server:
+        server.route('GET', '/me/albums', _albums)
+        asyncio.run(run(server))
+        assert server.requests[0] == ('GET', '/me/albums?page=2')
+
+
+def test_async_existence_checks():
+    async def run(server):
+        configuration_dict = {'API_ROOT': server.url, 'STATUS_RESULTS': True}
+        async with AsyncVimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            results = await asyncio.gather(client.read_liked_video(1), client.read_liked_video(2))
+            assert [bool(result) for result in results] == [True, False]
+
+    with StandInServer() as server:
+        server.route('GET', '/me/likes/1', lambda request: (204, {}, b''))
+        asyncio.run(run(server))
+
+
+def test_async_concurrency():
+    async def run(server):
+        configuration_dict = {'API_ROOT': server.url, 'POOL_MAXSIZE': 8}
+        async with AsyncVimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            responses = await asyncio.gather(*[client.add_video_to_album(1, video_id) for video_id in range(200)])
+            assert [response.status_code for response in responses] == [204] * 200
+
+    with StandInServer() as server:
+        server.route('PUT', r'/me/albums/1/videos/(\d+)', lambda request, video_id: (204, {}, b''))
+        asyncio.run(run(server))
+        assert len(server.requests) == 200
+        assert server.connections <= 8
+
+
+def test_async_iter():
+    async def run(server):
+        async with AsyncVimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            return [video async for video in client.iter_videos()]
+
+    videos = [{'uri': '/videos/{}'.format(video_id)} for video_id in range(12)]
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', videos, per_page=5)
+        assert asyncio.run(run(server)) == videos
+
+
+def test_async_fetch_all():
+    async def run(server):
+        async with AsyncVimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            return [video async for video in client.iter_videos(fetch_all=True)]
+
+    videos = [{'uri': '/videos/{}'.format(video_id)} for video_id in range(57)]
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', videos, per_page=5)
+        assert asyncio.run(run(server)) == videos
+
+
+def test_async_stream():
+    async def run(server):
+        async with AsyncVimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            return [video async for video in client.iter_videos(stream=True)]
+
+    videos = [{'uri': '/videos/{}'.format(video_id)} for video_id in range(12)]
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', videos, per_page=5)
+        assert asyncio.run(run(server)) == videos
+
+
+def test_async_upload_video():
+    content = b'video' * 10000
+
+    async def run(server):
+        configuration_dict = {'API_ROOT': server.url, 'UPLOAD_CHUNK_SIZE': 16 * 1024}
+        async with AsyncVimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            response = await client.upload_video(io.BytesIO(content))
+            assert response.json()['upload']['size'] == len(content)
+
+    with StandInServer() as server:
+        received = tus_route(server)
+        asyncio.run(run(server))
+        assert bytes(received) == content
+
+
+def test_async_download_video(tmpdir):
+    content = b'video' * 10000
+    path = str(tmpdir.join('video.mp4'))
+
+    async def run(server):
+        configuration_dict = {'API_ROOT': server.url, 'DOWNLOAD_PART_SIZE': 16 * 1024}
+        async with AsyncVimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            await client.download_video(1, path)
+
+    with StandInServer() as server:
+        file_route(server, '/files/video.mp4', content)
+        server.route('GET', '/me/videos/1', lambda request: (200, {}, {'download': [
+            {'quality': 'source', 'link': server.url + '/files/video.mp4', 'size': len(content)},
+        ]}))
+        asyncio.run(run(server))
+    with open(path, 'rb') as video_file:
+        assert video_file.read() == content
+
+
+def test_async_trace_spans():
+    collector = TraceCollector()
+
+    async def run(server):
+        configuration_dict = {'API_ROOT': server.url, 'TRACE_SAMPLE_RATE': 1, 'TRACE_HOOKS': [collector]}
+        async with AsyncVimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            await asyncio.gather(client.read_albums(), client.read_albums())
+
+    with StandInServer() as server:
+        server.route('GET', '/me/albums', _albums)
+        asyncio.run(run(server))
+    assert len(collector.traces) == 2
+    for trace in collector.traces:
+        assert trace.endpoint == 'GET /me/albums'
+        assert trace.status_code == 200
+        names = [span.name for span in trace.spans]
+        assert names[-1] == 'check_response'
+        assert set(['ttfb', 'download', 'request']) <= set(names)
@@ -0,0 +1,158 @@
+# coding: utf-8
+
+import pytest
+from standin import StandInServer
+
+from vimeo import exceptions
+from vimeo.clients import VimeoClient
+
+
+def _me(request):
+    return 200, {}, {'name': 'me'}
+
+
+def test_session_reuses_connections():
+    with StandInServer() as server:
+        server.route('GET', '/me', _me)
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            for _ in range(20):
+                assert client.read_user().json() == {'name': 'me'}
+        assert server.connections == 1
+
+
+def test_keep_alive_disabled():
+    with StandInServer() as server:
+        server.route('GET', '/me', _me)
+        configuration_dict = {'API_ROOT': server.url, 'KEEP_ALIVE': False}
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            for _ in range(3):
+                client.read_user()
+        assert server.connections == 3
+
+
+def test_pool_configuration():
+    client = VimeoClient(token='token', configuration_dict={'POOL_MAXSIZE': 64, 'POOL_BLOCK': True})
+    adapter = client.session.get_adapter('https://api.vimeo.com')
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert VimeoClient.configuration_dict['POOL_MAXSIZE'] == 10
+    client.close()
+
+
+def test_rate_limit_headers():
+    headers = {'X-RateLimit-Limit': '100', 'X-RateLimit-Remaining': '42', 'X-RateLimit-Reset': '2100-01-01T00:00:00+00:00'}
+    with StandInServer() as server:
+        server.route('GET', '/me', lambda request: (200, dict(headers), {'name': 'me'}))
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            client.read_user()
+            assert client.rate_limit == {'limit': 100, 'remaining': 42, 'reset': 4102444800}
+
+
+def test_retry_transient_errors():
+    calls = []
+
+    def flaky(request):
+        calls.append(request.command)
+        if len(calls) < 3:
+            return 503, {'Retry-After': '0'}, {'error': 'try again'}
+        return 200, {}, {'name': 'me'}
+
+    with StandInServer() as server:
+        server.route('GET', '/me', flaky)
+        server.route('PATCH', '/me', flaky)
+        configuration_dict = {'API_ROOT': server.url, 'RETRY_BACKOFF': 0.01}
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            assert client.read_user().json() == {'name': 'me'}
+            assert client.retry_policy.counters() == {'GET /me': 2}
+
+            del calls[:]
+            with pytest.raises(exceptions.UnexpectedHTTPErrorException):
+                client.update_user({'name': 'me'})
+            assert calls == ['PATCH']
+
+
+def test_conditional_get():
+    not_modified = []
+
+    def album(request, album_id):
+        if request.headers.get('If-None-Match') == '"v1"':
+            not_modified.append(album_id)
+            return 304, {'ETag': '"v1"'}, b''
+        return 200, {'ETag': '"v1"'}, {'uri': '/albums/' + album_id}
+
+    with StandInServer() as server:
+        server.route('GET', r'/me/albums/(\d+)', album)
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            for _ in range(3):
+                response = client.read_album(1)
+                assert response.status_code == 200
+                assert response.json() == {'uri': '/albums/1'}
+            assert client.read_album(2).json() == {'uri': '/albums/2'}
+        assert not_modified == ['1', '1']
+
+
+def test_response_cache():
+    album_videos = []
+
+    with StandInServer() as server:
+        server.route('GET', r'/me/albums/1/videos', lambda request: (200, {}, {'data': list(album_videos)}))
+        server.route('GET', r'/me/videos', lambda request: (200, {}, {'data': []}))
+        server.route('PUT', r'/me/albums/1/videos/(\d+)', lambda request, video_id: (album_videos.append(video_id) or 204, {}, b''))
+        configuration_dict = {
+            'API_ROOT': server.url,
+            'RESPONSE_CACHE_MAX_BYTES': 1024,
+            'RESPONSE_CACHE_TTL': {'': 60, '/me/videos': 0},
+        }
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            for _ in range(3):
+                assert client.read_album_videos(1).json() == {'data': []}
+                client.get_videos()
+            assert len(server.requests) == 1 + 3
+
+            client.add_video_to_album(1, 7)
+            assert client.read_album_videos(1).json() == {'data': ['7']}
+            assert len(server.requests) == 1 + 3 + 2
+
+
+def test_sqlite_response_cache(tmpdir):
+    path = str(tmpdir.join('cache.sqlite'))
+    with StandInServer() as server:
+        server.route('GET', '/me', _me)
+        configuration_dict = {
+            'API_ROOT': server.url,
+            'RESPONSE_CACHE_MAX_BYTES': 1024,
+            'RESPONSE_CACHE_PATH': path,
+        }
+        for _ in range(3):
+            # every client is a worker starting cold
+            with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+                assert client.read_user().json() == {'name': 'me'}
+        with VimeoClient(token='other', configuration_dict=configuration_dict) as client:
+            client.read_user()
+        assert len(server.requests) == 2
+
+
+def test_metrics():
+    with StandInServer() as server:
+        server.route('GET', '/me', _me)
+        server.route('PUT', r'/me/albums/\d+/videos/\d+', lambda request: (204, {}, b''))
+        configuration_dict = {'API_ROOT': server.url, 'RETRY_MAX': 0}
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            client.read_user()
+            for video_id in range(5):
+                client.add_video_to_album(1, video_id)
+            with pytest.raises(exceptions.HTTPError404Exception):
+                client.read_album(7)
+            snapshot = client.metrics.snapshot()
+            text = client.metrics.prometheus()
+
+    assert sorted(snapshot) == ['GET /me', 'GET /me/albums/{album_id}', 'PUT /me/albums/{album_id}/videos/{video_id}']
+    assert snapshot['PUT /me/albums/{album_id}/videos/{video_id}']['status'] == {204: 5}
+    assert snapshot['GET /me/albums/{album_id}']['status'] == {404: 1}
+    assert snapshot['GET /me']['bytes_in'] == len(b'{"name": "me"}')
+    assert snapshot['GET /me']['latency']['buckets'][float('inf')] == 1
+    assert snapshot['GET /me']['in_flight'] == 0
+    assert 'vimeo_requests_total{method="PUT",endpoint="/me/albums/{album_id}/videos/{video_id}",status="204"} 5' in text
+
+    client = VimeoClient(token='token', configuration_dict={'METRICS': False})
+    assert client.metrics is None
@@ -0,0 +1,210 @@
+# coding: utf-8
+
+import threading
+
+import pytest
+import requests
+
+from vimeo.components import BandwidthLimiter
+from vimeo.components import Metrics
+from vimeo.components import RateLimiter
+from vimeo.components import ResponseCache
+from vimeo.components import RetryPolicy
+from vimeo.components import SQLiteResponseCache
+from vimeo.components import SQLiteValidatorCache
+from vimeo.components import SingleFlight
+from vimeo.components import parse_rate_limit_reset
+from vimeo.components import uri_template
+
+
+class FakeResponse(object):
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or dict()
+
+
+class FakeClock(object):
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_parse_rate_limit_reset():
+    assert parse_rate_limit_reset('2016-05-10T12:00:00+00:00', 0) == 1462881600
+    assert parse_rate_limit_reset('2016-05-10T14:00:00+02:00', 0) == 1462881600
+    assert parse_rate_limit_reset('1462881600', 0) == 1462881600
+    assert parse_rate_limit_reset('30', 1000) == 1030
+    assert parse_rate_limit_reset('soon', 1000) is None
+
+
+def test_rate_limiter_paces_remaining_budget():
+    clock = FakeClock()
+    limiter = RateLimiter(burst=1, clock=clock, sleep=clock.sleep)
+    assert limiter.reserve() == 0
+    limiter.update(FakeResponse(headers={
+        'X-RateLimit-Limit': '100', 'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': '10',
+    }))
+    assert limiter.snapshot() == {'limit': 100, 'remaining': 10, 'reset': 1010}
+
+    start = clock.now
+    for _ in range(10):
+        limiter.acquire()
+    # 10 calls spread over the 10 seconds to the reset, never over the budget
+    assert 8 <= clock.now - start <= 10
+    limiter.acquire()
+    assert clock.now >= 1010
+
+
+def test_rate_limiter_429():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.update(FakeResponse(status_code=429, headers={'Retry-After': '5'}))
+    assert limiter.reserve() == pytest.approx(5)
+
+
+def test_retry_policy_backoff():
+    clock = FakeClock()
+    policy = RetryPolicy(methods={'get'}, status_codes={503}, max_retries=3, backoff=1, deadline=10,
+                         clock=clock, sleep=clock.sleep, jitter=lambda low, high: high)
+    unavailable = FakeResponse(status_code=503)
+    assert policy.retry_wait('get', 'GET /me', 1, clock.now, response=unavailable) == 1
+    assert policy.retry_wait('get', 'GET /me', 3, clock.now, response=unavailable) == 4
+    # max retries, deadline, non idempotent method, status not retried
+    assert policy.retry_wait('get', 'GET /me', 4, clock.now, response=unavailable) is None
+    assert policy.retry_wait('get', 'GET /me', 3, clock.now - 8, response=unavailable) is None
+    assert policy.retry_wait('post', 'POST /me', 1, clock.now, response=unavailable) is None
+    assert policy.retry_wait('get', 'GET /me', 1, clock.now, response=FakeResponse(status_code=404)) is None
+    # Retry-After wins over a shorter backoff
+    throttled = FakeResponse(status_code=503, headers={'Retry-After': '7'})
+    assert policy.retry_wait('get', 'GET /me', 1, clock.now, response=throttled) == 7
+    assert policy.counters() == {'GET /me': 3}
+
+
+def test_response_cache_eviction_and_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(max_bytes=10, ttl={'': 5, '/me/albums': 60}, clock=clock)
+    small, big = FakeResponse(), FakeResponse()
+    small.content, big.content = b'1234', b'123456'
+    cache.set('/me', small)
+    cache.set('/me/albums?page=1', small)
+    cache.get('/me')
+    cache.set('/me/albums/1', big)
+    # /me/albums?page=1 is the least recently used
+    assert cache.get('/me/albums?page=1') is None
+    assert cache.get('/me') is small
+    clock.now += 10
+    assert cache.get('/me') is None
+    assert cache.get('/me/albums/1') is big
+    cache.invalidate('/me/albums/1/videos/2')
+    assert cache.get('/me/albums/1') is None
+
+
+def test_sqlite_response_cache_revalidation(tmpdir):
+    clock = FakeClock()
+    cache = SQLiteResponseCache(str(tmpdir.join('cache.sqlite')), max_bytes=10, ttl={'': 5}, clock=clock)
+    validators = SQLiteValidatorCache(cache)
+    response = requests.Response()
+    response.status_code, response.url, response._content = 200, 'http://localhost/me', b'{"a": 1}'
+    response.headers['ETag'] = '"v1"'
+    cache.set('/me', response)
+    assert cache.get('/me').json() == {'a': 1}
+
+    clock.now += 10
+    assert cache.get('/me') is None
+    stale = validators.get('/me')
+    assert validators.conditional_headers(stale) == {'If-None-Match': '"v1"'}
+    assert validators.update('/me', FakeResponse(status_code=304), stale) is stale
+
+    cache.set('/other', stale)
+    # max_bytes: the least recently used is evicted
+    assert cache.get_stale('/me') is None
+    cache.invalidate('/other/1')
+    assert cache.get_stale('/other') is None
+
+
+def test_bandwidth_limiter():
+    clock = FakeClock()
+    limiter = BandwidthLimiter(1000, clock=clock, sleep=clock.sleep)
+    limiter.acquire(1000)
+    assert clock.now == 1000
+    for _ in range(10):
+        limiter.acquire(500)
+    assert clock.now == 1005
+    clock.now += 10
+    # the burst is bounded by a second of bytes
+    assert limiter.reserve(1500) == 0.5
+
+
+def test_uri_template():
+    assert uri_template('/me/albums/123/videos/456?page=2') == '/me/albums/{album_id}/videos/{video_id}'
+    assert uri_template('/users/12/followers') == '/users/{user_id}/followers'
+    assert uri_template('/categories/music/channels') == '/categories/music/channels'
+    assert uri_template('/me') == '/me'
+
+
+def test_metrics_histogram_and_prometheus():
+    clock = FakeClock()
+    metrics = Metrics(buckets=(0.1, 1), clock=clock)
+    for latency, response in ((0.05, FakeResponse(200, {'Content-Length': '10'})), (0.5, FakeResponse(404)), (3, None)):
+        started = metrics.begin('GET /me/albums/{album_id}')
+        assert metrics.snapshot()['GET /me/albums/{album_id}']['in_flight'] == 1
+        clock.now += latency
+        metrics.end('GET /me/albums/{album_id}', started, response=response, bytes_out=2)
+
+    snapshot = metrics.snapshot()['GET /me/albums/{album_id}']
+    assert snapshot['count'] == 3
+    assert snapshot['errors'] == 1
+    assert snapshot['status'] == {200: 1, 404: 1}
+    assert list(snapshot['latency']['buckets'].items()) == [(0.1, 1), (1, 2), (float('inf'), 3)]
+    assert snapshot['latency']['sum'] == pytest.approx(3.55)
+    assert (snapshot['bytes_in'], snapshot['bytes_out']) == (10, 6)
+
+    text = metrics.prometheus()
+    assert '# TYPE vimeo_request_duration_seconds histogram' in text
+    assert 'vimeo_request_duration_seconds_bucket{method="GET",endpoint="/me/albums/{album_id}",le="+Inf"} 3' in text
+    assert 'vimeo_request_bytes_total{method="GET",endpoint="/me/albums/{album_id}",direction="in"} 10' in text
+    assert 'vimeo_requests_in_flight{method="GET",endpoint="/me/albums/{album_id}"} 0' in text
+
+
+def test_single_flight():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def call(value):
+        calls.append(value)
+        started.set()
+        release.wait()
+        if value == 'error':
+            raise ValueError(value)
+        return [value]
+
+    for value in ('result', 'error'):
+        results = []
+
+        def wait():
+            try:
+                results.append(flight.do('key', call, value))
+            except ValueError as error:
+                results.append(error)
+
+        leader = threading.Thread(target=wait)
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=wait) for _ in range(5)]
+        for follower in followers:
+            follower.start()
+        while len(flight.calls['key']._waiters) < 5:
+            release.wait(0.01)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+        assert len(results) == 6 and all(result is results[0] for result in results)
+        started.clear()
+        release.clear()
+    assert calls == ['result', 'error'] and flight.calls == dict()
@@ -0,0 +1,98 @@
+# coding: utf-8
+
+import hashlib
+import json
+import os
+
+import pytest
+from standin import StandInServer
+from standin import file_route
+
+from vimeo import exceptions
+from vimeo.clients import VimeoClient
+from vimeo.downloads import RangedDownload
+
+CONTENT = os.urandom(100 * 1024 + 7)
+MD5 = hashlib.md5(CONTENT).hexdigest()
+
+
+def download_client(server, **configuration_dict):
+    configuration_dict = dict(
+        {'API_ROOT': server.url, 'DOWNLOAD_PART_SIZE': 16 * 1024, 'RETRY_BACKOFF': 0}, **configuration_dict
+    )
+    return VimeoClient(token='token', configuration_dict=configuration_dict)
+
+
+def test_download_video(tmpdir):
+    path = str(tmpdir.join('video.mp4'))
+    progress = []
+    with StandInServer() as server:
+        served = file_route(server, '/files/video.mp4', CONTENT)
+        server.route('GET', '/me/videos/1', lambda request: (200, {}, {'download': [
+            {'quality': 'hd', 'link': server.url + '/files/other.mp4'},
+            {'quality': 'source', 'link': server.url + '/files/video.mp4', 'size': len(CONTENT), 'md5': MD5},
+        ]}))
+        with download_client(server) as client:
+            client.download_video(1, path, progress=lambda *args: progress.append(args))
+            with pytest.raises(exceptions.ClientException):
+                client.download_video(1, path, quality='mobile')
+        assert server.requests[0] == ('GET', '/me/videos/1?fields=download')
+    with open(path, 'rb') as video_file:
+        assert video_file.read() == CONTENT
+    assert sorted(served) == [(start, min(start + 16 * 1024, len(CONTENT)) - 1) for start in range(0, len(CONTENT), 16 * 1024)]
+    assert progress[-1] == (len(CONTENT), len(CONTENT))
+    assert sorted(os.listdir(str(tmpdir))) == ['video.mp4']
+
+
+def test_download_retries_and_single_stream(tmpdir):
+    path = str(tmpdir.join('video.mp4'))
+    with StandInServer() as server:
+        file_route(server, '/files/ranged.mp4', CONTENT, failures=3)
+        served = file_route(server, '/files/video.mp4', CONTENT, ranges=False)
+        with download_client(server) as client:
+            RangedDownload(client, server.url + '/files/ranged.mp4', path, md5=MD5).download()
+            with open(path, 'rb') as video_file:
+                assert video_file.read() == CONTENT
+            RangedDownload(client, server.url + '/files/video.mp4', path, size=len(CONTENT), md5=MD5).download()
+    with open(path, 'rb') as video_file:
+        assert video_file.read() == CONTENT
+    assert served == [(0, len(CONTENT) - 1)]
+
+
+def test_download_resumes_missing_parts(tmpdir):
+    path = str(tmpdir.join('video.mp4'))
+
+    def crash(received, size):
+        if received >= 48 * 1024:
+            raise RuntimeError('crash')
+
+    with StandInServer() as server:
+        served = file_route(server, '/files/video.mp4', CONTENT)
+        with download_client(server) as client:
+            with pytest.raises(RuntimeError):
+                RangedDownload(client, server.url + '/files/video.mp4', path, max_workers=1, progress=crash).download()
+            with open(path + '.part.json') as state_file:
+                done = json.load(state_file)['done']
+            first_run = len(served)
+            RangedDownload(client, server.url + '/files/video.mp4', path, md5=MD5).download()
+    with open(path, 'rb') as video_file:
+        assert video_file.read() == CONTENT
+    # the parts written before the crash are not fetched again
+    assert done[:2] == [0, 1]
+    assert len(served) == first_run + 7 - len(done)
+
+
+def test_download_verification(tmpdir):
+    path = str(tmpdir.join('video.mp4'))
+    with StandInServer() as server:
+        file_route(server, '/files/video.mp4', CONTENT)
+        with download_client(server) as client:
+            with pytest.raises(exceptions.DownloadException):
+                RangedDownload(client, server.url + '/files/video.mp4', path, size=len(CONTENT) + 1).download()
+            with pytest.raises(exceptions.DownloadException):
+                RangedDownload(client, server.url + '/files/video.mp4', path, md5='0' * 32).download()
+            with pytest.raises(exceptions.DownloadException) as error:
+                RangedDownload(client, server.url + '/files/missing.mp4', path).download()
+            assert error.value.status_code == 404
+    assert not os.path.exists(path)
+    assert not os.path.exists(path + '.part.json')
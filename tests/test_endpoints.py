@@ -0,0 +1,74 @@
+# coding: utf-8
+
+import inspect
+
+import pytest
+from standin import StandInServer
+
+from vimeo import exceptions
+from vimeo.clients import VimeoClient
+from vimeo.endpoints import ENDPOINTS
+from vimeo.mixins import VimeoClientMethodMixin
+from vimeo.mixins import _get_querystring
+
+try:
+    from urllib import urlencode
+except ImportError:  # python 3
+    from urllib.parse import urlencode
+
+
+def _parameters(method):
+    try:
+        return list(inspect.signature(method).parameters)
+    except AttributeError:  # python 2
+        return inspect.getargspec(method).args
+
+
+def test_generated_signatures():
+    assert len(set(endpoint.name for endpoint in ENDPOINTS)) == len(ENDPOINTS)
+    assert _parameters(VimeoClientMethodMixin.read_video_from_album) == ['self', 'album_id', 'video_id', 'fields']
+    assert _parameters(VimeoClientMethodMixin.iter_album_videos) == [
+        'self', 'album_id', 'filter_dict', 'fetch_all', 'fields', 'stream',
+    ]
+    assert _parameters(VimeoClientMethodMixin.create_album) == [
+        'self', 'name', 'description', 'privacy', 'password', 'sort',
+    ]
+    assert VimeoClientMethodMixin.read_album.__name__ == 'read_album'
+    assert ':param album_id' in VimeoClientMethodMixin.read_album.__doc__
+
+
+def test_endpoint_calls():
+    def record(status_code):
+        return lambda request, *args: (status_code, {}, {'body': request.read_body().decode('utf-8')})
+
+    with StandInServer() as server:
+        server.route('GET', '/me/portfolios', record(200))
+        server.route('POST', '/me/channels', record(200))
+        server.route('DELETE', r'/me/pictures/\d+', lambda request: (204, {}, b''))
+        server.route('GET', r'/me/ondemand/purchases/\d+', record(200))
+        server.route('POST', '/me/albums', record(201))
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            client.read_portfolios(filter_dict={'page': 2, 'sort': 'date added'})
+            assert client.create_channel({'name': 'channel'}).json() == {'body': '{"name": "channel"}'}
+            client.remove_portrait(7)
+            client.read_ondemand_purchase(3, fields=['uri'])
+            assert client.create_album('name', 'description').json()['body'] == (
+                '{"name": "name", "description": "description", "privacy": null, "password": null, "sort": null}'
+            )
+            with pytest.raises(exceptions.HTTPError404Exception):
+                client.read_watchlater(1)
+            with pytest.raises(exceptions.HTTPMethodNotConfiguredException):
+                VimeoClient(token='token', configuration_dict={'HTTP_METHODS': {'get'}}).post('/me/albums')
+    assert server.requests == [
+        ('GET', '/me/portfolios?page=2&sort=date+added'),
+        ('POST', '/me/channels'),
+        ('DELETE', '/me/pictures/7'),
+        ('GET', '/me/ondemand/purchases/3?fields=uri'),
+        ('POST', '/me/albums'),
+        ('GET', '/me/watchlater/1'),
+    ]
+
+
+def test_querystring():
+    filter_dict = {'page': 2, 'fields': 'uri,name', 'query': u'caf\xe9 & bar', 'filter': 'a/b?c=d'}
+    assert _get_querystring(filter_dict) == urlencode([(str(k), str(v)) for k, v in filter_dict.items()])
@@ -0,0 +1,79 @@
+# coding: utf-8
+
+import logging
+import threading
+
+from vimeo.logger import LoggerManager
+from vimeo.logger import RateLimitFilter
+
+
+class FakeClock(object):
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class Recorder(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+        self.threads = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+        self.threads.append(threading.current_thread())
+
+
+class Lazy(object):
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.current_thread())
+        return 'lazy'
+
+
+def test_rate_limit_filter():
+    clock = FakeClock()
+    logger = logging.getLogger('test_rate_limit_filter')
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    recorder = Recorder()
+    logger.addHandler(recorder)
+    logger.addFilter(RateLimitFilter(rate=1, burst=3, clock=clock))
+
+    def log_error():
+        logger.error('HTTP ERROR: %s', 404)
+
+    for _ in range(10):
+        log_error()
+    logger.info('info')
+    clock.now += 1
+    log_error()
+    assert recorder.messages == ['HTTP ERROR: 404'] * 3 + ['info', 'HTTP ERROR: 404 [7 similar records suppressed]']
+
+
+def test_queued_logger_defers_formatting():
+    manager = LoggerManager(enabled=True, level=logging.DEBUG, queued=True)
+    recorder = Recorder()
+    listener = LoggerManager._listener
+    listener.handlers = (recorder, )
+    lazy = Lazy()
+    manager.logger.propagate = False
+    try:
+        manager.logger.debug('GET: %s', lazy)
+        assert lazy.threads == []
+        listener.stop()
+        LoggerManager._listener = None
+        assert recorder.messages == ['GET: lazy']
+        assert lazy.threads == recorder.threads
+        assert recorder.threads[0] is not threading.current_thread()
+
+        manager.logger.disabled = True
+        manager.logger.debug('GET: %s', lazy)
+        assert len(lazy.threads) == 1
+    finally:
+        manager.logger.propagate = True
+        LoggerManager().logger.disabled = True
@@ -0,0 +1,144 @@
+# coding: utf-8
+
+import pytest
+from standin import StandInServer
+from standin import paged_route
+
+from vimeo import exceptions
+from vimeo.clients import VimeoClient
+
+VIDEOS = [{'uri': '/videos/{}'.format(video_id)} for video_id in range(1, 24)]
+
+
+def test_iter_videos():
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', VIDEOS, per_page=5)
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            assert list(client.iter_videos()) == VIDEOS
+            assert list(client.iter_videos(filter_dict={'per_page': 10})) == VIDEOS
+        assert len(server.requests) == 5 + 3
+
+
+def test_iter_stops_early():
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', VIDEOS, per_page=5)
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            videos = client.iter_videos()
+            assert next(videos) == VIDEOS[0]
+            videos.close()
+        # first page and at most the prefetched one
+        assert len(server.requests) <= 2
+
+
+def test_iter_error_codes():
+    with StandInServer() as server:
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            with pytest.raises(exceptions.HTTPError404Exception):
+                list(client.iter_album_videos(1))
+
+
+def test_fetch_all():
+    videos = [{'uri': '/videos/{}'.format(video_id)} for video_id in range(1, 104)]
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', videos, per_page=10)
+        configuration_dict = {'API_ROOT': server.url, 'FETCH_ALL_WORKERS': 3}
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            assert list(client.iter_videos(fetch_all=True)) == videos
+            assert list(client.fetch_all_method('/me/videos', filter_dict={'page': 10}, max_workers=1)) == videos[90:]
+        assert len(server.requests) == 11 + 2
+
+
+def test_bulk_method():
+    attempts = {}
+
+    def add_video(request, album_id, video_id):
+        attempts[video_id] = attempts.get(video_id, 0) + 1
+        if video_id == '13':
+            return 404, {}, {'error': 'video not found'}
+        if video_id == '21' and attempts[video_id] == 1:
+            return 503, {}, {'error': 'try again'}
+        return 204, {}, b''
+
+    with StandInServer() as server:
+        server.route('PUT', r'/me/albums/(\d+)/videos/(\d+)', add_video)
+        configuration_dict = {'API_ROOT': server.url, 'BULK_WORKERS': 4, 'RETRY_MAX': 0}
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            jobs = ((1, video_id) for video_id in range(50))
+            report = client.bulk_method(client.add_video_to_album, jobs)
+
+    assert [result.job for result in report] == [(1, video_id) for video_id in range(50)]
+    failed = [result for result in report if not result.succeeded]
+    assert [result.job for result in failed] == [(1, 13)]
+    assert isinstance(failed[0].exception, exceptions.HTTPError404Exception)
+    assert [result.job for result in report if result.retried] == [(1, 21)]
+
+
+def test_fields_projection():
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', VIDEOS, per_page=10)
+        server.route('GET', r'/me/albums/(\d+)', lambda request, album_id: (200, {}, {'uri': '/albums/' + album_id}))
+        configuration_dict = {
+            'API_ROOT': server.url,
+            'DEFAULT_FIELDS': {'/me/*': 'uri', '/me/videos*': 'uri,name'},
+        }
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            client.get_videos(fields=['uri', 'duration'])
+            client.get_videos(filter_dict={'page': 2})
+            client.read_album(1)
+            list(client.iter_videos())
+        assert [uri for method, uri in server.requests] == [
+            '/me/videos?fields=uri%2Cduration',
+            '/me/videos?page=2&fields=uri%2Cname',
+            '/me/albums/1?fields=uri',
+            '/me/videos?fields=uri%2Cname',
+            '/me/videos?page=2&per_page=10&fields=uri%2Cname',
+            '/me/videos?page=3&per_page=10&fields=uri%2Cname',
+        ]
+
+
+def test_stream():
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', VIDEOS, per_page=5)
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            assert list(client.iter_videos(stream=True)) == VIDEOS
+            assert list(client.stream_method('/me/videos', chunk_size=7)) == VIDEOS
+            with pytest.raises(exceptions.HTTPError404Exception):
+                list(client.iter_album_videos(1, stream=True))
+
+
+def test_existence_checks():
+    with StandInServer() as server:
+        server.route('GET', r'/me/likes/1', lambda request: (204, {}, b''))
+        server.route('GET', r'/me/following/2', lambda request: (500, {}, b'<html>'))
+        configuration_dict = {'API_ROOT': server.url, 'STATUS_RESULTS': True, 'RETRY_MAX': 0}
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            assert client.read_liked_video(1)
+            result = client.read_liked_video(2)
+            assert not result and result.status_code == 404
+            assert not client.read_video_from_album(1, 2)
+            with pytest.raises(exceptions.UnexpectedHTTPErrorException) as error:
+                client.read_follow_user(2)
+            assert error.value.error_msg == '<html>'
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            assert client.read_liked_video(1).status_code == 204
+            with pytest.raises(exceptions.HTTPError404Exception) as error:
+                client.read_liked_video(2)
+            assert error.value.status_code == 404
+            assert 'DESCRIPTION: not found' in str(error.value)
+
+
+def test_http_error_body_decoded_lazily():
+    class Response(object):
+        status_code = 409
+        url = 'https://api.vimeo.com/me'
+        text = '{}'
+        decoded = 0
+
+        def json(self):
+            Response.decoded += 1
+            return {}
+
+    error = exceptions.HTTP_ERROR_EXCEPTIONS.get(409, exceptions.UnexpectedHTTPErrorException)(Response())
+    assert Response.decoded == 0
+    assert error.error_text == 'HTTP ERROR: 409 - DESCRIPTION: {} - URI: https://api.vimeo.com/me'
+    assert repr(error) and Response.decoded == 1
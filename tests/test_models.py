@@ -0,0 +1,39 @@
+# coding: utf-8
+
+from standin import StandInServer
+from standin import paged_route
+
+from vimeo import models
+from vimeo.clients import VimeoClient
+
+VIDEO = {
+    'uri': '/videos/1',
+    'name': 'video',
+    'duration': 12,
+    'pictures': {'sizes': [{'width': 100, 'link': 'https://i.vimeocdn.com/1.jpg'}]},
+    'user': {'uri': '/users/2', 'name': 'user'},
+    'stats': {'plays': 3},
+    'unknown': [1, 2],
+}
+
+
+def test_build_models():
+    video = models.build(VIDEO)
+    assert isinstance(video, models.Video)
+    assert not hasattr(video, '__dict__')
+    assert (video.name, video.duration, video.description) == ('video', 12, None)
+    assert isinstance(video._pictures, models._Encoded)
+    assert video.pictures == VIDEO['pictures']
+    assert video.unknown == [1, 2]
+    assert dict((key, value) for key, value in video.to_dict().items() if value is not None) == VIDEO
+    assert isinstance(models.build({'uri': '/users/2/albums/3'}), models.Album)
+    assert models.build({'clip': VIDEO}) == {'clip': VIDEO}
+
+
+def test_iter_models():
+    with StandInServer() as server:
+        paged_route(server, '/me/videos', [VIDEO] * 3, per_page=2)
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url, 'MODELS': True}) as client:
+            videos = list(client.iter_videos())
+    assert [video.uri for video in videos] == ['/videos/1'] * 3
+    assert all(isinstance(video, models.Video) for video in videos)
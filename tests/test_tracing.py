@@ -0,0 +1,76 @@
+# coding: utf-8
+
+import pytest
+from standin import StandInServer
+from standin import paged_route
+
+from vimeo import exceptions
+from vimeo.clients import VimeoClient
+from vimeo.tracing import TraceCollector
+from vimeo.tracing import Tracer
+
+
+def _album(request, album_id):
+    if album_id == '404':
+        return 404, {}, {'error': 'not found'}
+    return 200, {}, {'uri': '/albums/' + album_id}
+
+
+class Hook(object):
+    def __init__(self):
+        self.events = []
+
+    def before(self, trace):
+        self.events.append(('before', trace.endpoint))
+
+    def after(self, trace):
+        self.events.append(('after', trace.endpoint))
+
+
+def test_trace_spans():
+    collector, hook = TraceCollector(), Hook()
+    with StandInServer() as server:
+        server.route('GET', r'/me/albums/(\d+)', _album)
+        paged_route(server, '/me/videos', [{'uri': '/videos/1'}], per_page=5)
+        configuration_dict = {'API_ROOT': server.url, 'TRACE_SAMPLE_RATE': 1, 'TRACE_HOOKS': [collector, hook]}
+        with VimeoClient(token='token', configuration_dict=configuration_dict) as client:
+            client.read_album(1)
+            with pytest.raises(exceptions.HTTPError404Exception):
+                client.read_album(404)
+            list(client.iter_videos())
+
+    first, failed, page = collector.traces
+    assert first.endpoint == 'GET /me/albums/{album_id}'
+    assert [span.name for span in first.spans] == ['pool_wait', 'connect', 'ttfb', 'download', 'request', 'check_response']
+    assert first.status_code == 200 and first.error is None
+    # the connection of the first call is reused
+    assert 'connect' not in [span.name for span in failed.spans]
+    assert failed.status_code == 404
+    assert isinstance(failed.error, exceptions.HTTPError404Exception)
+    # get_page and get_method share a trace
+    assert page.endpoint == 'GET /me/videos'
+    assert [span.name for span in page.spans][-2:] == ['check_response', 'decode']
+    assert all(span.duration >= 0 for trace in collector.traces for span in trace.spans)
+    assert hook.events[:2] == [('before', 'GET /me/albums/{album_id}'), ('after', 'GET /me/albums/{album_id}')]
+    assert page.to_dict()['spans'][-1]['name'] == 'decode'
+
+
+def test_trace_sampling_and_broken_hooks():
+    class BrokenHook(object):
+        def after(self, trace):
+            raise ValueError('broken')
+
+    samples = iter([0.5, 0.05, 0.5])
+    collector = TraceCollector()
+    tracer = Tracer(0.1, hooks=[BrokenHook(), collector], sample=lambda: next(samples))
+    for _ in range(3):
+        with tracer.trace('GET /me') as trace:
+            pass
+    assert len(collector.traces) == 1
+    assert trace is None
+
+    with StandInServer() as server:
+        server.route('GET', r'/me/albums/(\d+)', _album)
+        with VimeoClient(token='token', configuration_dict={'API_ROOT': server.url}) as client:
+            assert client.tracer is None
+            assert client.read_album(1).json() == {'uri': '/albums/1'}
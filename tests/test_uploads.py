@@ -0,0 +1,178 @@
+# coding: utf-8
+
+import io
+import json
+import os
+import time
+
+import pytest
+from standin import StandInServer
+from standin import tus_route
+from standin import tus_uploads_route
+
+from vimeo import exceptions
+from vimeo.clients import VimeoClient
+from vimeo.uploads import ChunkReader
+from vimeo.uploads import TusUpload
+from vimeo.uploads import UploadQueue
+from vimeo.uploads import UploadStatus
+
+CONTENT = os.urandom(100 * 1024 + 7)
+
+
+def upload_client(server, **configuration_dict):
+    configuration_dict = dict(
+        {'API_ROOT': server.url, 'UPLOAD_CHUNK_SIZE': 16 * 1024, 'RETRY_BACKOFF': 0}, **configuration_dict
+    )
+    return VimeoClient(token='token', configuration_dict=configuration_dict)
+
+
+def patches(server):
+    return [path for method, path in server.requests if method == 'PATCH']
+
+
+def test_chunk_reader(tmpdir):
+    path = tmpdir.join('video.mp4')
+    path.write_binary(CONTENT)
+    for file_or_path in (str(path), io.BytesIO(CONTENT)):
+        with ChunkReader(file_or_path, 1000) as reader:
+            assert reader.read(0).tobytes() == CONTENT[:1000]
+            assert reader.read(len(CONTENT) - 7).tobytes() == CONTENT[-7:]
+            assert reader.read(len(CONTENT)).tobytes() == b''
+
+
+def test_upload_video(tmpdir):
+    path = tmpdir.join('video.mp4')
+    path.write_binary(CONTENT)
+    progress = []
+    with StandInServer() as server:
+        received = tus_route(server)
+        with upload_client(server) as client:
+            response = client.upload_video(str(path), data={'name': 'video'}, progress=lambda *args: progress.append(args))
+        assert response.json()['upload']['size'] == len(CONTENT)
+        assert response.json()['name'] == 'video'
+        assert bytes(received) == CONTENT
+        assert len(patches(server)) == 7
+        assert progress[0] == (0, len(CONTENT))
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+
+
+def test_upload_resumes_from_server_offset():
+    chunk_size = 16 * 1024
+    with StandInServer() as server:
+        # the failed PATCH at 16K keeps 8K, the next ones start at 24K, 40K, 56K
+        received = tus_route(server, failures=[(chunk_size, 500), (56 * 1024, 503)])
+        with upload_client(server) as client:
+            client.upload_video(io.BytesIO(CONTENT))
+        assert bytes(received) == CONTENT
+        # a HEAD before the upload and after each failure
+        assert [method for method, path in server.requests].count('HEAD') == 3
+        assert len(patches(server)) == 8
+
+
+def test_upload_resumes_interrupted_upload():
+    with StandInServer() as server:
+        received = tus_route(server)
+        received.extend(CONTENT[:50000])
+        with upload_client(server) as client:
+            upload = TusUpload(client, server.url + '/upload/1', io.BytesIO(CONTENT))
+            assert upload.upload() == len(CONTENT)
+        assert bytes(received) == CONTENT
+        assert len(patches(server)) == 4
+
+
+def test_upload_errors():
+    with StandInServer() as server:
+        received = tus_route(server)
+        server.route('HEAD', '/upload/3', lambda request: (200, {'Upload-Offset': '0'}, b''))
+        server.route('PATCH', '/upload/3', lambda request: (request.read_body() and 500, {}, b''))
+        with upload_client(server, UPLOAD_RETRIES=2) as client:
+            with pytest.raises(exceptions.UploadException) as error:
+                TusUpload(client, server.url + '/upload/3', io.BytesIO(CONTENT)).upload()
+            assert error.value.status_code == 500
+            assert len(patches(server)) == 3
+
+            # a PATCH that does not move the offset is a failure
+            server.route('HEAD', '/upload/4', lambda request: (200, {'Upload-Offset': '0'}, b''))
+            server.route('PATCH', '/upload/4', lambda request: (request.read_body() and 204, {'Upload-Offset': '0'}, b''))
+            with pytest.raises(exceptions.UploadException) as error:
+                TusUpload(client, server.url + '/upload/4', io.BytesIO(CONTENT)).upload()
+            assert error.value.status_code == 204
+
+            with pytest.raises(exceptions.UploadException) as error:
+                TusUpload(client, server.url + '/upload/2', io.BytesIO(CONTENT)).upload()
+            assert error.value.status_code == 404
+        assert received == bytearray()
+
+
+def write_videos(tmpdir, count):
+    contents = dict()
+    for number in range(count):
+        path = tmpdir.join('video{}.mp4'.format(number))
+        contents[path.basename] = os.urandom(20000 + number * 1000)
+        path.write_binary(contents[path.basename])
+    return contents
+
+
+def test_upload_queue(tmpdir):
+    contents = write_videos(tmpdir, 6)
+    journal_path = str(tmpdir.join('uploads.journal'))
+    progress = []
+    with StandInServer() as server:
+        uploads = tus_uploads_route(server)
+        with upload_client(server, UPLOAD_CHUNK_SIZE=8 * 1024) as client:
+            with UploadQueue(client, journal_path, max_workers=3) as queue:
+                for name in sorted(contents):
+                    queue.submit(str(tmpdir.join(name)), data={'name': name}, progress=progress.append)
+                statuses = queue.join()
+                metrics = queue.metrics()
+        assert dict((name, bytes(received)) for name, received in uploads.items()) == contents
+    assert [status.state for status in statuses] == [UploadStatus.DONE] * 6
+    assert set(status.path for status in progress) == set(status.path for status in statuses)
+    assert metrics['done'] == metrics['uploads'] == 6
+    assert metrics['bytes'] == sum(len(content) for content in contents.values())
+    assert metrics['throughput'] > 0
+    with open(journal_path) as journal_file:
+        journal = json.load(journal_file)
+    assert set(entry['state'] for entry in journal.values()) == {UploadStatus.DONE}
+
+
+def test_upload_queue_resumes_from_journal(tmpdir):
+    contents = write_videos(tmpdir, 2)
+    journal_path = str(tmpdir.join('uploads.journal'))
+
+    def crash(status):
+        if status.offset >= 16 * 1024:
+            raise RuntimeError('crash')
+
+    with StandInServer() as server:
+        uploads = tus_uploads_route(server)
+        with upload_client(server, UPLOAD_CHUNK_SIZE=8 * 1024) as client:
+            with UploadQueue(client, journal_path, max_workers=2) as queue:
+                for name in sorted(contents):
+                    queue.submit(str(tmpdir.join(name)), data={'name': name}, progress=crash)
+                assert [status.state for status in queue.join()] == [UploadStatus.FAILED] * 2
+            assert all(len(received) == 16 * 1024 for received in uploads.values())
+
+            # a new queue, as after a restart of the process
+            with UploadQueue(client, journal_path) as queue:
+                resumed = queue.resume()
+                assert [status.state for status in queue.join()] == [UploadStatus.DONE] * 2
+        assert dict((name, bytes(received)) for name, received in uploads.items()) == contents
+        assert [method for method, path in server.requests].count('POST') == 2
+    assert sorted(status.path for status in resumed) == sorted(str(tmpdir.join(name)) for name in contents)
+    assert all(status.sent == status.size - 16 * 1024 for status in resumed)
+
+
+def test_upload_queue_bandwidth(tmpdir):
+    contents = write_videos(tmpdir, 2)
+    started = time.time()
+    with StandInServer() as server:
+        tus_uploads_route(server)
+        with upload_client(server) as client:
+            with UploadQueue(client, str(tmpdir.join('uploads.journal')), bandwidth=20000) as queue:
+                for name in sorted(contents):
+                    queue.submit(str(tmpdir.join(name)), data={'name': name})
+                queue.join()
+    # 41000 bytes: a second of burst, then 20000 bytes per second
+    assert time.time() - started >= 1
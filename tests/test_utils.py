@@ -0,0 +1,23 @@
+# coding: utf-8
+
+import json
+
+from vimeo.utils import JSONListDecoder
+
+
+def test_json_list_decoder():
+    document = {
+        'total': 50,
+        'paging': {'next': '/me/videos?page=2', 'data': 'not "data"'},
+        'data': [{'id': number, 'name': u'è€' * number, 'tags': [1, 2.5, None, True]} for number in range(50)],
+        'page': 12345,
+    }
+    raw = json.dumps(document, ensure_ascii=False).encode('utf-8')
+    for size in (1, 7, 100, len(raw)):
+        decoder = JSONListDecoder('data')
+        items = []
+        for start in range(0, len(raw), size):
+            items.extend(decoder.feed(raw[start:start + size]))
+        items.extend(decoder.feed(b'', eof=True))
+        assert items == document['data']
+        assert decoder.document == dict((key, value) for key, value in document.items() if key != 'data')